@@ -0,0 +1,185 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# pip install aiohttp
+import aiohttp
+
+import HtmlArchive
+import HttpCache
+import RateControl
+
+# Default limits for a full refresh of the player list
+DEFAULT_CONCURRENCY = 16
+DEFAULT_PER_HOST = 8
+DEFAULT_TIMEOUT = 30
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+async def fetch_page_content_async(session, url, limiter=None, max_retries=RateControl.DEFAULT_RETRIES):
+    """
+    Fetch HTML content from the provided URL using a shared aiohttp session.
+    Sends a conditional GET and serves 304 responses from the local cache.
+    429/5xx responses and timeouts are retried with backoff, honouring Retry-After.
+
+    Args:
+        session (aiohttp.ClientSession): Pooled keep-alive session
+        url (str): URL of the player profile page
+        limiter (RateControl.AdaptiveLimiter): Optional adaptive concurrency controller
+        max_retries (int): Number of retries after a retryable failure
+
+    Returns:
+        str: HTML content of the page
+    """
+    entry = HttpCache.load_entry(url)
+    attempt = 0
+    while True:
+        if limiter:
+            await limiter.acquire()
+        started = time.monotonic()
+        try:
+            async with session.get(url, headers=HttpCache.conditional_headers(entry)) as response:
+                if response.status == 304 and entry:
+                    html_content = entry["body"]
+                elif response.status in RateControl.RETRYABLE_STATUSES:
+                    raise RateControl.RetryableStatus(
+                        response.status, RateControl.parse_retry_after(response.headers.get("Retry-After")))
+                else:
+                    response.raise_for_status()  # Raise exception for 4XX/5XX responses
+                    html_content = await response.text()
+                    HttpCache.store_entry(url, response.headers, html_content)
+            if limiter:
+                limiter.on_success(time.monotonic() - started)
+            break
+        except (RateControl.RetryableStatus, asyncio.TimeoutError, aiohttp.ClientConnectionError) as e:
+            status = getattr(e, "status", None)
+            retry_after = getattr(e, "retry_after", None)
+            if limiter:
+                limiter.on_failure(status, retry_after)
+            attempt += 1
+            if attempt > max_retries:
+                raise Exception(f"Failed to fetch the URL: {str(e) or type(e).__name__}")
+            delay = RateControl.backoff_delay(attempt, retry_after)
+        except aiohttp.ClientError as e:
+            raise Exception(f"Failed to fetch the URL: {str(e)}")
+        finally:
+            if limiter:
+                await limiter.release()
+        # Wait outside the limiter so the slot is free for other requests
+        await asyncio.sleep(delay)
+
+    # Keep the raw page so it can be re-parsed offline later
+    HtmlArchive.store_page(url, html_content)
+    return html_content
+
+async def _fetch_worker(session, url_queue, page_queue, limiter):
+    """
+    Take URLs off the queue, fetch them and hand the pages to the consumer
+    """
+    while True:
+        url = await url_queue.get()
+        try:
+            html_content = await fetch_page_content_async(session, url, limiter)
+            await page_queue.put((url, html_content, None))
+        except Exception as e:
+            await page_queue.put((url, None, e))
+        finally:
+            url_queue.task_done()
+
+async def _consume_pages(page_queue, handle_page, handle_error, executor):
+    """
+    Pass fetched pages to the handler on a single background thread so parsing
+    and database writes overlap with the requests still in flight. If the
+    error handler itself raises, the task ends with that exception and
+    crawl() stops and re-raises it.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        url, html_content, error = await page_queue.get()
+        try:
+            if error is None:
+                try:
+                    await loop.run_in_executor(executor, handle_page, url, html_content)
+                except Exception as e:
+                    error = e
+            if error is not None:
+                handle_error(url, error)
+        finally:
+            page_queue.task_done()
+
+async def _drain(url_queue, page_queue):
+    await url_queue.join()
+    await page_queue.join()
+
+async def crawl(urls, handle_page, handle_error=None, concurrency=DEFAULT_CONCURRENCY,
+                per_host=DEFAULT_PER_HOST, timeout=DEFAULT_TIMEOUT, adaptive=True, limiter=None):
+    """
+    Fetch all URLs concurrently and process each page as soon as it arrives
+
+    Args:
+        urls (iterable): URLs of the player profile pages
+        handle_page (callable): Called as handle_page(url, html_content) for every
+            fetched page. Calls are made one at a time from a single thread, so the
+            handler may use a database connection that is not thread-safe.
+        handle_error (callable): Called as handle_error(url, exception) when a page
+            could not be fetched or handled. Defaults to printing the error.
+        concurrency (int): Maximum number of requests in flight overall
+        per_host (int): Maximum number of requests in flight to a single host
+        timeout (float): Total timeout in seconds for each request
+        adaptive (bool): Let an AIMD controller find the highest sustainable number
+            of requests in flight, up to `concurrency`
+        limiter (RateControl.AdaptiveLimiter): Controller to use when adaptive, so the
+            caller can read its stats; one is created if omitted
+
+    Returns:
+        int: Number of URLs crawled
+    """
+    if handle_error is None:
+        handle_error = lambda url, e: print(f"Error crawling {url}: {str(e)}")
+    if adaptive and limiter is None:
+        limiter = RateControl.AdaptiveLimiter(initial=min(4, concurrency), maximum=concurrency)
+    if not adaptive:
+        limiter = None
+
+    connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=per_host)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+    url_queue = asyncio.Queue()
+    # Bounded so fetching pauses if parsing/writing falls behind
+    page_queue = asyncio.Queue(maxsize=concurrency * 2)
+
+    count = 0
+    for url in urls:
+        url_queue.put_nowait(url)
+        count += 1
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        async with aiohttp.ClientSession(connector=connector, timeout=client_timeout, headers=HEADERS) as session:
+            workers = [asyncio.create_task(_fetch_worker(session, url_queue, page_queue, limiter))
+                       for _ in range(min(concurrency, max(count, 1)))]
+            consumer = asyncio.create_task(_consume_pages(page_queue, handle_page, handle_error, executor))
+            drained = asyncio.create_task(_drain(url_queue, page_queue))
+
+            # The consumer only finishes early by failing; the queues would then never drain
+            await asyncio.wait([drained, consumer], return_when=asyncio.FIRST_COMPLETED)
+
+            for task in workers + [consumer, drained]:
+                task.cancel()
+            await asyncio.gather(*workers, consumer, drained, return_exceptions=True)
+            if not consumer.cancelled() and consumer.exception() is not None:
+                raise consumer.exception()
+    finally:
+        executor.shutdown(wait=True)
+
+    if limiter:
+        print(f"Crawl finished: {limiter.stats()}")
+    return count
+
+def run_crawl(urls, handle_page, **kwargs):
+    """
+    Blocking wrapper around crawl() for use from synchronous scripts
+    """
+    return asyncio.run(crawl(urls, handle_page, **kwargs))
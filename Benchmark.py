@@ -0,0 +1,242 @@
+import contextlib
+import gc
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import Demo01
+import DemoFinal
+import MockServer
+import ScrapeData
+
+# Parser throughput benchmarks over a fixed, generated HTML corpus.
+#
+#   python Benchmark.py                  # run everything and append to benchmarks/results.jsonl
+#   python Benchmark.py --only scrape    # run the benchmarks whose name contains "scrape"
+#   python Benchmark.py --compare        # also show the change against the last saved run
+
+RESULTS_FILE = os.path.join("benchmarks", "results.jsonl")
+
+DEFAULT_PAGES = 200
+DEFAULT_REPEAT = 3
+DEFAULT_SEED = 0
+
+# Flag runs that are this much slower than the last saved one
+REGRESSION_THRESHOLD = 0.10
+
+def build_corpus(pages=DEFAULT_PAGES, seed=DEFAULT_SEED):
+    """
+    Build the benchmark corpus. Everything is derived from the checked-in
+    pages with a fixed seed, so the corpus is the same on every machine.
+
+    Args:
+        pages (int): Number of pages per player-page corpus
+        seed (int): Seed for the generated stats
+
+    Returns:
+        dict: Corpus name -> list of HTML strings
+    """
+    # Table pages with 5 to 40 matches, built from cricket_match_data.html
+    table_pages = []
+    for rows in (5, 10, 20, 40):
+        site = MockServer.SyntheticSite(players=pages // 4, rows=rows, seed=seed)
+        for name, player_id, slug in site.iter_players():
+            table_pages.append(site.page(slug, player_id))
+
+    # Full Index.html copies carrying the embedded JSON payload
+    site = MockServer.SyntheticSite(players=pages, template="index", seed=seed)
+    payload_pages = [site.page(slug, player_id) for name, player_id, slug in site.iter_players()]
+
+    # Player listings for the URL discovery scripts
+    listings = [MockServer.SyntheticSite(players=players, seed=seed).listing_page()
+                for players in (100, 1000, 5000)]
+    with open("Demo.txt", 'r', encoding='utf-8') as f:
+        listings.append(f.read())
+
+    return {"table": table_pages, "payload": payload_pages, "listing": listings}
+
+def _scrape(html, **kwargs):
+    player_name, matches = DemoFinal.scrape_player_match_stats(html, **kwargs)
+    return len(matches)
+
+def _create_player_urls(html):
+    return len(json.loads(ScrapeData.create_player_urls(html)))
+
+def _extract_player_data(html, output_dir):
+    output_filename = os.path.join(output_dir, "player_urls.csv")
+    Demo01.extract_player_data(html, output_filename)
+    with open(output_filename, 'r', encoding='utf-8') as f:
+        return sum(1 for line in f) - 1
+
+def _extract_player_data_stream(html, output_dir, paths):
+    # The dump is written to disk on the untimed warm-up pass
+    if id(html) not in paths:
+        paths[id(html)] = os.path.join(output_dir, f"listing-{len(paths)}.txt")
+        with open(paths[id(html)], 'w', encoding='utf-8') as f:
+            f.write(html)
+    rows, duplicates = Demo01.extract_player_data_stream(paths[id(html)], os.path.join(output_dir, "stream.csv"))
+    return rows
+
+def benchmarks(output_dir):
+    """
+    Benchmarks to run: name -> (corpus name, function returning the rows found in one page)
+    """
+    paths = {}
+    return {
+        "scrape_player_match_stats[table]": ("table", _scrape),
+        "scrape_player_match_stats[table,html.parser]": ("table", lambda html: _scrape(html, backend="html.parser")),
+        "scrape_player_match_stats[payload]": ("payload", _scrape),
+        "scrape_player_match_stats[payload,dom]": ("payload", lambda html: _scrape(html, use_payload=False)),
+        "ScrapeData.create_player_urls": ("listing", _create_player_urls),
+        "Demo01.extract_player_data": ("listing", lambda html: _extract_player_data(html, output_dir)),
+        "Demo01.extract_player_data_stream": ("listing", lambda html: _extract_player_data_stream(html, output_dir, paths)),
+    }
+
+def measure(function, pages, repeat=DEFAULT_REPEAT):
+    """
+    Time a function over every page of a corpus
+
+    Args:
+        function (callable): Takes one HTML string, returns the number of rows extracted
+        pages (list): HTML strings
+        repeat (int): Number of timed passes; the fastest one is reported
+
+    Returns:
+        dict: pages, rows, seconds, pages_per_sec, rows_per_sec and peak_memory_mb
+    """
+    # The scripts print warnings per row or URL; keep that out of the timings
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        return _measure(function, pages, repeat)
+
+def _measure(function, pages, repeat):
+    # Untimed pass for warm-up and the row count
+    rows = sum(function(page) for page in pages)
+
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        for page in pages:
+            function(page)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    # Memory is measured on a separate pass since tracemalloc slows everything down
+    gc.collect()
+    tracemalloc.start()
+    try:
+        for page in pages:
+            function(page)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "pages": len(pages),
+        "rows": rows,
+        "seconds": round(best, 4),
+        "pages_per_sec": round(len(pages) / best, 1),
+        "rows_per_sec": round(rows / best, 1),
+        "peak_memory_mb": round(peak / 1024 / 1024, 2),
+    }
+
+def git_commit():
+    """
+    Current commit, with "-dirty" appended if there are uncommitted changes
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True,
+                               text=True, check=True).stdout.strip()
+        return commit + ("-dirty" if dirty else "")
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def load_previous(path=RESULTS_FILE):
+    """
+    Latest saved result of every benchmark
+
+    Returns:
+        dict: Benchmark name -> result record
+    """
+    previous = {}
+    if not os.path.exists(path):
+        return previous
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                previous[record["benchmark"]] = record
+    return previous
+
+def save_results(records, path=RESULTS_FILE):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+def run(only=None, pages=DEFAULT_PAGES, repeat=DEFAULT_REPEAT, seed=DEFAULT_SEED, save=True, compare=False):
+    """
+    Run the benchmarks and print a table of results
+
+    Args:
+        only (str): Only run benchmarks whose name contains this text
+        pages (int): Size of the player-page corpora
+        repeat (int): Timed passes per benchmark
+        seed (int): Corpus seed
+        save (bool): Append the results to RESULTS_FILE
+        compare (bool): Show the change against the last saved run
+
+    Returns:
+        list: Result records
+    """
+    previous = load_previous() if compare else {}
+    corpus = build_corpus(pages, seed)
+    commit = git_commit()
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    records = []
+    with tempfile.TemporaryDirectory() as output_dir:
+        for name, (corpus_name, function) in benchmarks(output_dir).items():
+            if only and only not in name:
+                continue
+            result = measure(function, corpus[corpus_name], repeat)
+            record = {"benchmark": name, "commit": commit, "timestamp": timestamp,
+                      "python": platform.python_version(), "corpus": corpus_name, "seed": seed}
+            record.update(result)
+            records.append(record)
+
+            line = (f"{name:48} {result['pages_per_sec']:>10.1f} pages/s {result['rows_per_sec']:>12.1f} rows/s "
+                    f"{result['peak_memory_mb']:>8.2f} MB peak")
+            before = previous.get(name)
+            if before and before.get("pages") == result["pages"]:
+                change = result["pages_per_sec"] / before["pages_per_sec"] - 1
+                flag = "  REGRESSION" if change < -REGRESSION_THRESHOLD else ""
+                line += f"  {change:+.1%} vs {before['commit']}{flag}"
+            print(line)
+
+    if save and records:
+        save_results(records)
+        print(f"Saved {len(records)} results to {RESULTS_FILE}")
+    return records
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the HTML parsers over a fixed corpus")
+    parser.add_argument("--only", help="only run benchmarks whose name contains this text")
+    parser.add_argument("--pages", type=int, default=DEFAULT_PAGES, help="pages in each player-page corpus")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timed passes per benchmark (best is kept)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="seed for the generated corpus")
+    parser.add_argument("--no-save", action="store_true", help="don't append the results to " + RESULTS_FILE)
+    parser.add_argument("--compare", action="store_true", help="show the change against the last saved run")
+    args = parser.parse_args()
+
+    run(only=args.only, pages=args.pages, repeat=args.repeat, seed=args.seed,
+        save=not args.no_save, compare=args.compare)
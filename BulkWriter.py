@@ -0,0 +1,99 @@
+import threading
+import time
+
+import Schema
+
+DEFAULT_BATCH_SIZE = 500
+
+class BulkWriter:
+    """
+    Buffers rows and writes them with one executemany per batch instead of
+    one execute (and one network round trip) per row.
+
+    With commit=True every flush is its own transaction. With commit=False
+    the caller decides when to commit, e.g. together with a checkpoint;
+    call flush() before committing so no buffered rows are left behind.
+    """
+
+    def __init__(self, conn, sql=Schema.STATS_UPSERT, batch_size=DEFAULT_BATCH_SIZE, commit=True):
+        """
+        Args:
+            conn: SQLite or SQLite Cloud connection
+            sql (str): Parameterised INSERT statement (by default the stats upsert)
+            batch_size (int): Rows buffered before they are written
+            commit (bool): Commit after every flush
+        """
+        self.conn = conn
+        self.sql = sql
+        self.batch_size = batch_size
+        self.commit = commit
+        self.rows = 0
+        self.batches = 0
+        self.seconds = 0.0
+        self._buffer = []
+        self._lock = threading.Lock()
+
+    def add(self, row):
+        """
+        Queue one row, writing the batch once it is full
+        """
+        with self._lock:
+            self._buffer.append(row)
+            full = len(self._buffer) >= self.batch_size
+        if full:
+            self.flush()
+
+    def add_many(self, rows):
+        """
+        Queue several rows, writing full batches as they fill up
+        """
+        with self._lock:
+            self._buffer.extend(rows)
+            full = len(self._buffer) >= self.batch_size
+        if full:
+            self.flush()
+
+    def flush(self):
+        """
+        Write every buffered row
+
+        Returns:
+            int: Number of rows written
+        """
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+            if not batch:
+                return 0
+            cursor = self.conn.cursor()
+            for offset in range(0, len(batch), self.batch_size):
+                chunk = batch[offset:offset + self.batch_size]
+                start = time.perf_counter()
+                try:
+                    cursor.executemany(self.sql, chunk)
+                    if self.commit:
+                        self.conn.commit()
+                except Exception:
+                    if self.commit:
+                        self.conn.rollback()
+                    raise
+                self.seconds += time.perf_counter() - start
+                self.rows += len(chunk)
+                self.batches += 1
+            return len(batch)
+
+    def rows_per_sec(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def stats(self):
+        """
+        Rows written, batches and write throughput so far
+
+        Returns:
+            dict: rows, batches, seconds and rows_per_sec
+        """
+        return {
+            "rows": self.rows,
+            "batches": self.batches,
+            "seconds": round(self.seconds, 3),
+            "rows_per_sec": round(self.rows_per_sec(), 1),
+        }
@@ -0,0 +1,157 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+# Local checkpoint database (override with the CHECKPOINT_DB environment variable)
+CHECKPOINT_DB = os.environ.get("CHECKPOINT_DB", "crawl_checkpoint.db")
+
+# Per-URL states, in the order a page moves through them
+PENDING = "pending"
+FETCHED = "fetched"
+PARSED = "parsed"
+STORED = "stored"
+FAILED = "failed"
+
+DEFAULT_BATCH_SIZE = 25
+
+def _now():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+class CheckpointLog:
+    """
+    Durable per-URL progress log for a crawl run, kept in a local SQLite file.
+
+    Status changes are buffered in an open transaction and written out by
+    commit(). Callers commit the stats database first and the checkpoint
+    second, so a URL is never marked stored before its rows are durable.
+    """
+
+    def __init__(self, path=None, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Args:
+            path (str): Checkpoint database file
+            batch_size (int): Number of stored URLs between commits; see commit_due()
+        """
+        self.conn = sqlite3.connect(path or CHECKPOINT_DB, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                started_at TEXT NOT NULL,
+                finished_at TEXT
+            );
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                run_id INTEGER NOT NULL,
+                url TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                error TEXT,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (run_id, url)
+            );
+            CREATE INDEX IF NOT EXISTS idx_checkpoints_status ON checkpoints (run_id, status, position);
+        """)
+        self.conn.commit()
+        self.batch_size = batch_size
+        self.run_id = None
+        self._since_commit = 0
+        self._lock = threading.Lock()
+
+    def start(self, urls):
+        """
+        Begin a new run covering the given URLs
+
+        Args:
+            urls (iterable): URLs to crawl, in order
+
+        Returns:
+            list: The URLs, all pending
+        """
+        urls = list(dict.fromkeys(urls))
+        with self._lock, self.conn:
+            cursor = self.conn.execute("INSERT INTO runs (started_at) VALUES (?)", (_now(),))
+            self.run_id = cursor.lastrowid
+            now = _now()
+            self.conn.executemany(
+                "INSERT INTO checkpoints (run_id, url, position, status, updated_at) VALUES (?, ?, ?, ?, ?)",
+                [(self.run_id, url, position, PENDING, now) for position, url in enumerate(urls)]
+            )
+        return urls
+
+    def resume(self):
+        """
+        Continue the most recent unfinished run
+
+        Returns:
+            list: (url, status) for every URL not yet stored, in the original order,
+                or None if there is no unfinished run
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT run_id FROM runs WHERE finished_at IS NULL ORDER BY run_id DESC LIMIT 1"
+            ).fetchone()
+            if not row:
+                return None
+            self.run_id = row[0]
+            return self.conn.execute(
+                "SELECT url, status FROM checkpoints WHERE run_id = ? AND status != ? ORDER BY position",
+                (self.run_id, STORED)
+            ).fetchall()
+
+    def mark(self, url, status, error=None):
+        """
+        Record a URL's new status (written out on the next commit)
+
+        Args:
+            url (str): URL of the player page
+            status (str): One of PENDING, FETCHED, PARSED, STORED, FAILED
+            error (str): Error message for FAILED
+        """
+        with self._lock:
+            self.conn.execute(
+                "UPDATE checkpoints SET status = ?, error = ?, updated_at = ? WHERE run_id = ? AND url = ?",
+                (status, error, _now(), self.run_id, url)
+            )
+            if status == STORED:
+                self._since_commit += 1
+
+    def commit_due(self):
+        """
+        Whether enough URLs have been stored since the last commit
+        """
+        return self._since_commit >= self.batch_size
+
+    def commit(self):
+        """
+        Make all recorded statuses durable
+        """
+        with self._lock:
+            self.conn.commit()
+            self._since_commit = 0
+
+    def finish(self):
+        """
+        Mark the run as complete so --resume starts afresh next time
+        """
+        with self._lock:
+            self.conn.execute("UPDATE runs SET finished_at = ? WHERE run_id = ?", (_now(), self.run_id))
+            self.conn.commit()
+            self._since_commit = 0
+
+    def summary(self):
+        """
+        Count the URLs of the current run by status
+
+        Returns:
+            dict: status -> count
+        """
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT status, COUNT(*) FROM checkpoints WHERE run_id = ? GROUP BY status", (self.run_id,)
+            ).fetchall()
+        return dict(rows)
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,125 @@
+from datetime import datetime
+
+# Columns used by Scheduler, added after the table was first introduced
+SCHEDULE_COLUMNS = [
+    ("match_interval_days", "REAL"),
+    ("failures", "INTEGER DEFAULT 0"),
+    ("next_fetch_at", "TEXT"),
+]
+
+def ensure_table(cursor):
+    """
+    Create the crawl_state table if it doesn't exist
+
+    Args:
+        cursor: Database cursor (SQLite or SQLite Cloud)
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS crawl_state (
+            player_url TEXT PRIMARY KEY,
+            player_name TEXT,
+            last_match_id INTEGER,
+            last_match_date TEXT,
+            last_crawled_at TEXT,
+            last_changed_at TEXT,
+            match_interval_days REAL,
+            failures INTEGER DEFAULT 0,
+            next_fetch_at TEXT
+        )
+    """)
+
+    # Add the scheduling columns to tables created before they existed
+    cursor.execute("PRAGMA table_info(crawl_state)")
+    columns = {row[1] for row in cursor.fetchall()}
+    for column, definition in SCHEDULE_COLUMNS:
+        if column not in columns:
+            cursor.execute(f"ALTER TABLE crawl_state ADD COLUMN {column} {definition}")
+
+def load_state(cursor):
+    """
+    Load the newest match seen for every player in one query
+
+    Args:
+        cursor: Database cursor
+
+    Returns:
+        dict: player_url -> (last_match_id, last_match_date)
+    """
+    cursor.execute("SELECT player_url, last_match_id, last_match_date FROM crawl_state")
+    return {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
+
+def newest_match(matches):
+    """
+    Find the newest match in a list of match entries. Match IDs are not
+    assigned in playing order across tournaments, so the date decides.
+
+    Args:
+        matches (list): List of match dictionaries
+
+    Returns:
+        tuple: (match_id, date) of the newest match, or (None, None) if there is none
+    """
+    dated = [match for match in matches if match.get("date")]
+    if not dated:
+        return None, None
+    newest = max(dated, key=lambda match: match["date"])
+    return newest.get("match_id"), newest["date"]
+
+def new_matches(matches, last_seen):
+    """
+    Keep only the matches newer than the newest one recorded for the player
+
+    Args:
+        matches (list): List of match dictionaries
+        last_seen (tuple): (last_match_id, last_match_date) from load_state, or None
+
+    Returns:
+        list: Match entries that have not been stored yet
+    """
+    if not last_seen or not last_seen[1]:
+        return list(matches)
+    last_match_id, last_match_date = last_seen
+
+    fresh = []
+    for match in matches:
+        match_date = match.get("date")
+        if not match_date or match_date > last_match_date:
+            fresh.append(match)
+        elif match_date == last_match_date and last_match_id is not None \
+                and match.get("match_id") not in (None, last_match_id):
+            # A different match on the same day as the last one stored
+            fresh.append(match)
+    return fresh
+
+def record_crawl(cursor, player_url, player_name, matches, last_seen=None, changed=True):
+    """
+    Record the newest match seen for a player after a crawl
+
+    Args:
+        cursor: Database cursor
+        player_url (str): URL of the player page
+        player_name (str): Name of the player
+        matches (list): All match entries scraped from the page
+        last_seen (tuple): Previously recorded (last_match_id, last_match_date), or None
+        changed (bool): Whether the crawl found new matches
+
+    Returns:
+        tuple: The new (last_match_id, last_match_date)
+    """
+    newest_id, newest_date = newest_match(matches)
+    if last_seen and last_seen[1] and (newest_date is None or last_seen[1] > newest_date):
+        # Never move the high-water mark backwards
+        newest_id, newest_date = last_seen
+
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    cursor.execute("""
+        INSERT INTO crawl_state (player_url, player_name, last_match_id, last_match_date, last_crawled_at, last_changed_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT(player_url) DO UPDATE SET
+            player_name = excluded.player_name,
+            last_match_id = excluded.last_match_id,
+            last_match_date = excluded.last_match_date,
+            last_crawled_at = excluded.last_crawled_at,
+            last_changed_at = COALESCE(excluded.last_changed_at, crawl_state.last_changed_at)
+    """, (player_url, player_name, newest_id, newest_date, now, now if changed else None))
+    return newest_id, newest_date
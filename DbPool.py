@@ -0,0 +1,256 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# SQLite Cloud connection string (or set SQLITECLOUD_URL)
+DATABASE_URL = os.environ.get("SQLITECLOUD_URL", "")
+
+DEFAULT_MAX_SIZE = 8          # Open connections at most, idle or in use
+DEFAULT_MAX_LIFETIME = 600.0  # Seconds before a connection is replaced
+DEFAULT_HEALTH_INTERVAL = 30.0  # Idle seconds after which a connection is checked before reuse
+DEFAULT_TIMEOUT = 30.0        # Seconds to wait for a free connection
+
+def _connect():
+    # pip install sqlitecloud
+    import sqlitecloud
+    return sqlitecloud.connect(DATABASE_URL)
+
+class _Entry:
+    def __init__(self, conn):
+        self.conn = conn
+        self.created_at = time.monotonic()
+        self.returned_at = self.created_at
+
+class ConnectionPool:
+    """
+    Bounded pool of SQLite Cloud connections shared by the API and the batch
+    jobs, so each request reuses an open connection instead of paying for a
+    new TLS handshake and login.
+
+    A thread holds at most one shared connection: nested checkouts on the
+    same thread get the connection it already has, and it goes back to the
+    pool when the outermost checkout ends. A checkout with shared=False
+    always gets a connection of its own, e.g. for a cursor that is still
+    being read while the same thread writes. Connections idle for a while are
+    checked with a cheap query before reuse, and connections older than
+    max_lifetime are closed and replaced.
+    """
+
+    def __init__(self, connect=_connect, max_size=DEFAULT_MAX_SIZE, max_lifetime=DEFAULT_MAX_LIFETIME,
+                 health_interval=DEFAULT_HEALTH_INTERVAL, timeout=DEFAULT_TIMEOUT):
+        """
+        Args:
+            connect (callable): Opens a new connection
+            max_size (int): Maximum number of open connections
+            max_lifetime (float): Seconds before a connection is recycled
+            health_interval (float): Idle seconds after which a connection is checked before reuse
+            timeout (float): Seconds to wait for a free connection before giving up
+        """
+        self.connect = connect
+        self.max_size = max_size
+        self.max_lifetime = max_lifetime
+        self.health_interval = health_interval
+        self.timeout = timeout
+        self.opened = 0
+        self.recycled = 0
+        self._idle = []
+        self._open = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._local = threading.local()
+        self._private = {}  # id(conn) -> entry for shared=False checkouts
+
+    def _expired(self, entry, now):
+        return now - entry.created_at >= self.max_lifetime
+
+    def _healthy(self, entry, now):
+        if now - entry.returned_at < self.health_interval:
+            return True
+        try:
+            cursor = entry.conn.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, entry):
+        self.recycled += 1
+        try:
+            entry.conn.close()
+        except Exception:
+            pass
+
+    def _take(self):
+        deadline = time.monotonic() + self.timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    # A connection opened now would never be closed
+                    raise Exception("Connection pool is closed")
+                if self._idle:
+                    entry = self._idle.pop()  # Most recently used first, so spare ones age out
+                    break
+                if self._open < self.max_size:
+                    self._open += 1
+                    entry = None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise Exception(f"No database connection free after {self.timeout}s (pool size {self.max_size})")
+                self._cond.wait(remaining)
+
+        # Checks and connects happen outside the lock so other threads aren't held up
+        try:
+            if entry is not None:
+                now = time.monotonic()
+                if not self._expired(entry, now) and self._healthy(entry, now):
+                    return entry
+                self._discard(entry)
+            entry = _Entry(self.connect())
+            self.opened += 1
+            return entry
+        except Exception:
+            self._give_back(None)
+            raise
+
+    def _give_back(self, entry):
+        with self._cond:
+            if entry is not None and self._closed:
+                self._discard(entry)
+                entry = None
+            if entry is None:
+                self._open -= 1
+            else:
+                entry.returned_at = time.monotonic()
+                self._idle.append(entry)
+            self._cond.notify()
+
+    def acquire(self, shared=True):
+        """
+        Check out this thread's connection, taking one from the pool if it has none.
+        Every acquire() must be matched by a release().
+
+        Args:
+            shared (bool): False to get a connection no other checkout on this thread uses
+
+        Returns:
+            Connection
+        """
+        if not shared:
+            entry = self._take()
+            with self._cond:
+                self._private[id(entry.conn)] = entry
+            return entry.conn
+        held = getattr(self._local, "entry", None)
+        if held is not None:
+            self._local.depth += 1
+            return held.conn
+        entry = self._take()
+        self._local.entry = entry
+        self._local.depth = 1
+        return entry.conn
+
+    def release(self, conn, failed=False):
+        """
+        Hand a connection back once the thread's outermost checkout is done
+
+        Args:
+            conn: Connection from acquire()
+            failed (bool): The work on it raised; roll back before it is reused
+        """
+        with self._cond:
+            entry = self._private.pop(id(conn), None)
+        if entry is None:
+            entry = getattr(self._local, "entry", None)
+            if entry is None or entry.conn is not conn:
+                raise Exception("Connection was not checked out by this thread")
+            self._local.depth -= 1
+            if self._local.depth > 0:
+                return
+            self._local.entry = None
+        if failed:
+            try:
+                entry.conn.rollback()
+            except Exception:
+                # A connection that can't roll back is unusable
+                self._discard(entry)
+                self._give_back(None)
+                return
+        if self._expired(entry, time.monotonic()):
+            self._discard(entry)
+            self._give_back(None)
+            return
+        self._give_back(entry)
+
+    @contextmanager
+    def connection(self, shared=True):
+        """
+        Check out a connection for the duration of a with block
+
+        Args:
+            shared (bool): False to get a connection no other checkout on this thread uses
+
+        Yields:
+            Connection
+        """
+        conn = self.acquire(shared)
+        try:
+            yield conn
+        except BaseException:
+            self.release(conn, failed=True)
+            raise
+        self.release(conn)
+
+    def stats(self):
+        """
+        Connections open, idle, created and recycled so far
+
+        Returns:
+            dict: open, idle, opened and recycled
+        """
+        with self._cond:
+            return {"open": self._open, "idle": len(self._idle), "opened": self.opened, "recycled": self.recycled}
+
+    def close(self):
+        """
+        Close the idle connections. Connections in use are closed when they come back,
+        and new checkouts raise.
+        """
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+            self._cond.notify_all()
+        for entry in idle:
+            try:
+                entry.conn.close()
+            except Exception:
+                pass
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_pool():
+    """
+    Process-wide pool, created on first use
+
+    Returns:
+        ConnectionPool
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool()
+    return _pool
+
+def connection(shared=True):
+    """
+    Check out a connection from the shared pool:
+
+        with DbPool.connection() as conn:
+            conn.cursor().execute(...)
+    """
+    return get_pool().connection(shared)
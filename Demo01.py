@@ -1,59 +1,166 @@
-import re
-import csv
-
-def extract_player_data(html_content, output_filename="player_urls.csv"):
-    """
-    Extracts player name, ID, and URL from the given HTML content (script) and saves the data to a CSV file.
-
-    Args:
-        html_content (str): The HTML content (specifically the script part) to parse.
-        output_filename (str, optional): The name of the CSV file to create. Defaults to "player_urls.csv".
-
-    Returns:
-        None
-    """
-
-    base_url = "https://www.cricket.com/players/"  # Corrected base URL
-    pattern = r'\\"href\\":\\"/players/([a-zA-Z0-9\-]+)\\\",'
-
-    matches = re.findall(pattern, html_content)
-
-    with open(output_filename, 'w', newline='', encoding='utf-8') as csvfile:
-        csv_writer = csv.writer(csvfile)
-        csv_writer.writerow(['Name', 'ID', 'URL'])  # Write header row
-
-        unique_urls = set()  # Use a set to store unique URLs
-
-        for href in matches:
-            try:
-                parts = href.split('-')
-                url_id = int(parts[-1])
-                player_name_slug = '-'.join(parts[:-1])
-                player_name = ' '.join(word.capitalize() for word in player_name_slug.split('-'))
-                player_url = f"{base_url}{href}/recent"
-
-                if player_url not in unique_urls:  # Check if URL is already in the set
-                    csv_writer.writerow([player_name, url_id, player_url])
-                    unique_urls.add(player_url)  # Add URL to the set
-                else:
-                    print(f"Duplicate URL found: {player_url}") #optional
-            except Exception as e:
-                print(f"Error processing href {href}: {e}")
-
-# Load the HTML content from the provided file
-file_path = 'Demo.txt'
-try:
-    with open(file_path, 'r', encoding='utf-8') as file:
-        html_content = file.read()
-except FileNotFoundError:
-    print(f"Error: The file '{file_path}' was not found.")
-    html_content = None
-except Exception as e:
-    print(f"Error occurred while reading the file: {e}")
-    html_content = None
-
-if html_content:
-    extract_player_data(html_content)
-    print("CSV file created successfully.")
-else:
-    print("No data to process.")
+import re
+import csv
+import mmap
+import os
+
+BASE_URL = "https://www.cricket.com/players/"
+
+# Same pattern as extract_player_data, compiled once for scanning raw bytes
+HREF_PATTERN = re.compile(rb'\\"href\\":\\"/players/([a-zA-Z0-9\-]+)\\",')
+
+# Bytes scanned per step in streaming mode, and how far past the end of a
+# step a match may run (longer than any player href)
+CHUNK_SIZE = 8 * 1024 * 1024
+OVERLAP = 1024
+
+def extract_player_data(html_content, output_filename="player_urls.csv"):
+    """
+    Extracts player name, ID, and URL from the given HTML content (script) and saves the data to a CSV file.
+
+    Args:
+        html_content (str): The HTML content (specifically the script part) to parse.
+        output_filename (str, optional): The name of the CSV file to create. Defaults to "player_urls.csv".
+
+    Returns:
+        None
+    """
+
+    base_url = "https://www.cricket.com/players/"  # Corrected base URL
+    pattern = r'\\"href\\":\\"/players/([a-zA-Z0-9\-]+)\\\",'
+
+    matches = re.findall(pattern, html_content)
+
+    with open(output_filename, 'w', newline='', encoding='utf-8') as csvfile:
+        csv_writer = csv.writer(csvfile)
+        csv_writer.writerow(['Name', 'ID', 'URL'])  # Write header row
+
+        unique_urls = set()  # Use a set to store unique URLs
+
+        for href in matches:
+            try:
+                parts = href.split('-')
+                url_id = int(parts[-1])
+                player_name_slug = '-'.join(parts[:-1])
+                player_name = ' '.join(word.capitalize() for word in player_name_slug.split('-'))
+                player_url = f"{base_url}{href}/recent"
+
+                if player_url not in unique_urls:  # Check if URL is already in the set
+                    csv_writer.writerow([player_name, url_id, player_url])
+                    unique_urls.add(player_url)  # Add URL to the set
+                else:
+                    print(f"Duplicate URL found: {player_url}") #optional
+            except Exception as e:
+                print(f"Error processing href {href}: {e}")
+
+def player_row(href, base_url=BASE_URL):
+    """
+    Build the CSV row for one player href
+
+    Args:
+        href (str): Player slug with the ID at the end, e.g. "virat-kohli-3993"
+        base_url (str): Prefix for the player URL
+
+    Returns:
+        list: [name, id, url]
+    """
+    parts = href.split('-')
+    url_id = int(parts[-1])
+    player_name = ' '.join(word.capitalize() for word in parts[:-1])
+    return [player_name, url_id, f"{base_url}{href}/recent"]
+
+def iter_hrefs(file_path, chunk_size=CHUNK_SIZE, overlap=OVERLAP):
+    """
+    Scan a listing dump for player hrefs without reading it into memory.
+    The file is memory-mapped and searched one chunk at a time; each search
+    may run `overlap` bytes into the next chunk so hrefs crossing a chunk
+    boundary are still found, and only matches starting inside the chunk are
+    kept so none are reported twice.
+
+    Args:
+        file_path (str): Path of the dump
+        chunk_size (int): Bytes searched per step
+        overlap (int): Longest match that may straddle two chunks
+
+    Yields:
+        bytes: Player hrefs in file order, duplicates included
+    """
+    if os.path.getsize(file_path) == 0:
+        return
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        size = len(data)
+        for start in range(0, size, chunk_size):
+            end = min(start + chunk_size, size)
+            for match in HREF_PATTERN.finditer(data, start, min(end + overlap, size)):
+                if match.start() >= end:
+                    break
+                yield match.group(1)
+
+def extract_player_data_stream(file_path, output_filename="player_urls.csv", chunk_size=CHUNK_SIZE):
+    """
+    Streaming version of extract_player_data for dumps too large to load.
+    Rows are written as they are found, so memory only grows with the
+    number of distinct players, not the size of the dump.
+
+    Args:
+        file_path (str): Path of the listing dump
+        output_filename (str, optional): The name of the CSV file to create. Defaults to "player_urls.csv".
+        chunk_size (int): Bytes searched per step
+
+    Returns:
+        tuple: (rows written, duplicate hrefs skipped)
+    """
+    seen = set()
+    rows = 0
+    duplicates = 0
+    with open(output_filename, 'w', newline='', encoding='utf-8') as csvfile:
+        csv_writer = csv.writer(csvfile)
+        csv_writer.writerow(['Name', 'ID', 'URL'])  # Write header row
+
+        for href in iter_hrefs(file_path, chunk_size):
+            if href in seen:
+                duplicates += 1
+                continue
+            seen.add(href)
+            try:
+                csv_writer.writerow(player_row(href.decode('ascii')))
+                rows += 1
+            except Exception as e:
+                print(f"Error processing href {href!r}: {e}")
+    return rows, duplicates
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Extract player URLs from a players listing dump into a CSV file")
+    parser.add_argument("input", nargs="?", default="Demo.txt", help="listing dump to scan")
+    parser.add_argument("--output", default="player_urls.csv", help="CSV file to write")
+    parser.add_argument("--stream", action="store_true",
+                        help="memory-map the dump and write rows as they are found (for very large dumps)")
+    args = parser.parse_args()
+
+    file_path = args.input
+    if args.stream:
+        try:
+            rows, duplicates = extract_player_data_stream(file_path, args.output)
+            print(f"Wrote {rows} players to {args.output} ({duplicates} duplicates skipped)")
+        except FileNotFoundError:
+            print(f"Error: The file '{file_path}' was not found.")
+        except Exception as e:
+            print(f"Error occurred while reading the file: {e}")
+    else:
+        # Load the HTML content from the provided file
+        try:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                html_content = file.read()
+        except FileNotFoundError:
+            print(f"Error: The file '{file_path}' was not found.")
+            html_content = None
+        except Exception as e:
+            print(f"Error occurred while reading the file: {e}")
+            html_content = None
+
+        if html_content:
+            extract_player_data(html_content, args.output)
+            print("CSV file created successfully.")
+        else:
+            print("No data to process.")
@@ -1,278 +1,519 @@
-import requests
-from bs4 import BeautifulSoup
-import json
-from datetime import datetime
-import os
-import re
-import Fetch
-
-# pip install sqlitecloud
-import sqlite3
-import json
-import sqlitecloud
-
-def fetch_page_content(url):
-    """
-    Fetch HTML content from the provided URL
-    
-    Args:
-        url (str): URL of the player profile page
-        
-    Returns:
-        str: HTML content of the page
-    """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()  # Raise exception for 4XX/5XX responses
-        return response.text
-    except requests.exceptions.RequestException as e:
-        raise Exception(f"Failed to fetch the URL: {str(e)}")
-
-def extract_player_name(soup):
-    """
-    Extract player name from the page
-    
-    Args:
-        soup (BeautifulSoup): Parsed HTML content
-        
-    Returns:
-        str: Player name or "Unknown Player" if not found
-    """
-    try:
-        # Try different selectors that might contain the player name
-        selectors = [
-            'h1.player-profile-name',
-            '.player-name',
-            'h1.font-bold',
-            'title'
-        ]
-        
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                name = element.text.strip()
-                # If it's the title element, extract just the player name
-                if selector == 'title':
-                    name = name.split('|')[0].strip()
-                    if "stats" in name.lower():
-                        name = re.sub(r'\s+stats.*', '', name, flags=re.IGNORECASE)
-                return name[:-15]
-                
-        # Extract from URL as fallback
-        url_path = soup.find('meta', property='og:url')
-        if url_path:
-            url = url_path.get('content', '')
-            match = re.search(r'/players/([^/]+)', url)
-            if match:
-                player_slug = match.group(1)
-                player_name = ' '.join(word.capitalize() for word in player_slug.split('-') if word.isalpha())
-                if player_name:
-                    return player_name[:-15]
-                    
-        return "Unknown Player"
-    except Exception:
-        return "Unknown Player"
-
-def find_matches_table(soup):
-    """
-    Find the table containing match statistics
-    
-    Args:
-        soup (BeautifulSoup): Parsed HTML content
-        
-    Returns:
-        BeautifulSoup: Table element containing match statistics or None if not found
-    """
-    # Look for table with specific classes or within specific container
-    try:
-        # First try with specific class
-        table = soup.find('table', class_='w-full')
-        if table:
-            return table
-            
-        # Try with container that has "All Matches" heading
-        all_matches_heading = soup.find('p', string=lambda text: text and 'All Matches' in text)
-        if all_matches_heading:
-            container = all_matches_heading.find_parent('div')
-            if container:
-                table = container.find('table')
-                if table:
-                    return table
-                    
-        # Generic approach - look for tables with certain column headers
-        tables = soup.find_all('table')
-        for table in tables:
-            headers = table.find_all('th')
-            header_texts = [h.get_text(strip=True).lower() for h in headers]
-            if 'opposition' in header_texts and 'batting' in header_texts:
-                return table
-                
-        return None
-    except Exception:
-        return None
-
-def scrape_player_match_stats(html_content):
-    """
-    Scrape player match statistics from the provided HTML content
-    
-    Args:
-        html_content (str): HTML content containing player match statistics
-        
-    Returns:
-        tuple: (player_name, matches_list)
-    """
-    # Parse HTML content
-    soup = BeautifulSoup(html_content, 'html.parser')
-    
-    # Extract player name
-    player_name = extract_player_name(soup)
-    
-    # Find the table containing match stats
-    table = find_matches_table(soup)
-    if not table:
-        raise Exception("Could not find match statistics table in the HTML content")
-    
-    # Extract all rows except the header
-    tbody = table.find('tbody')
-    if not tbody:
-        raise Exception("Table structure is not as expected (missing tbody)")
-        
-    rows = tbody.find_all('tr')
-    if not rows:
-        raise Exception("No match data found in the table")
-    
-    matches = []
-    
-    for row in rows:
-        cells = row.find_all('td')
-        if len(cells) < 5:
-            continue  # Skip rows with insufficient data
-        
-        try:
-            # Create match entry with the required format
-            match_entry = {
-                "player_name": player_name
-            }
-            
-            # Extract opposition
-            match_link = cells[0].find('a')
-            if not match_link:
-                continue
-                
-            match_entry["opponent"] = match_link.get_text(strip=True)
-            
-            # Extract batting stats
-            batting_div = cells[1].find('div', class_='flex')
-            if batting_div:
-                batting_stats = batting_div.find('p').get_text(strip=True)
-            else:
-                batting_stats = cells[1].find('p').get_text(strip=True)
-            
-            # Extract bowling stats
-            bowling_div = cells[2].find('div', class_='flex')
-            if bowling_div:
-                bowling_stats = bowling_div.find('p').get_text(strip=True)
-            else:
-                bowling_stats = cells[2].find('p').get_text(strip=True)
-            
-            # Extract match format
-            match_entry["format"] = cells[3].find('p').get_text(strip=True)
-            
-            # Extract and parse date
-            date_text = cells[4].find('p').get_text(strip=True)
-            try:
-                date_obj = datetime.strptime(date_text, '%d-%b-%Y')
-                match_entry["date"] = date_obj.strftime('%Y-%m-%d')
-            except ValueError:
-                # Try alternative date formats
-                try:
-                    date_obj = datetime.strptime(date_text, '%d %b %Y')
-                    match_entry["date"] = date_obj.strftime('%Y-%m-%d')
-                except ValueError:
-                    match_entry["date"] = date_text  # Use as-is if parsing fails
-            
-            # For batting stats, add runs and balls if available
-            if batting_stats != "DNB" and batting_stats != "-":
-                try:
-                    # Handle not out innings (with *)
-                    if "*" in batting_stats:
-                        # Extract runs and balls using regex
-                        match = re.search(r'(\d+)\*\((\d+)\)', batting_stats)
-                        if match:
-                            runs_str, balls_str = match.groups()
-                        else:
-                            runs_str, balls_str = batting_stats.replace("*", "").replace("(", "").replace(")", "").split()
-                    else:
-                        # Extract runs and balls using regex
-                        match = re.search(r'(\d+)\((\d+)\)', batting_stats)
-                        if match:
-                            runs_str, balls_str = match.groups()
-                        else:
-                            runs_str, balls_str = batting_stats.replace("(", "").replace(")", "").split()
-                    
-                    match_entry["runs"] = int(runs_str)
-                    match_entry["balls_faced"] = int(balls_str)
-                except Exception:
-                    pass
-            
-            # Extract bowling figures if available
-            if bowling_stats not in ["DNB", "-"] and "/" in bowling_stats:
-                try:
-                    wickets_runs = bowling_stats.split("/")
-                    match_entry["wickets"] = int(wickets_runs[0])
-                    match_entry["runs_conceded"] = int(wickets_runs[1])
-                except Exception:
-                    pass
-            
-            matches.append(match_entry)
-        except Exception as e:
-            print(f"Warning: Could not process row: {str(e)}")
-    
-    return player_name, matches
-
-
-def main():
-    # Open the connection to SQLite Cloud
-    conn = sqlitecloud.connect("")
-
-    # Connect to SQLite database (or create it if it doesn't exist)
-    cursor = conn.cursor()
-    i = 0
-    try:
-        urls = Fetch.fetch_data_from_mongodb()
-        for url in urls:
-            content = fetch_page_content(url["url"])
-            details = scrape_player_match_stats(content)
-            player_name = details[0]
-            details = details[1]
-            for entry in details:
-                player_name = entry.get('player_name')
-                opponent = entry.get('opponent', None)  # Default to None if missing
-                runs_scored = entry.get('runs', 0)  # Default to 0 if missing
-                balls_faced = entry.get('balls_faced', 0)  # Default to 0 if missing
-                wickets_taken = entry.get('wickets', 0)  # Default to 0 if missing
-                catch_taken = entry.get('catch_taken', 0)  # Default to 0 if missing
-                format_type = entry.get('format')
-                date = entry.get('date', None)  # Default to None if missing
-                
-                # Insert into database
-                cursor.execute('''
-                    INSERT INTO stats (player_name, opponent, runs_scored, balls_faced, wickets_taken, catch_taken, format, date)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (player_name, opponent, runs_scored, balls_faced, wickets_taken, catch_taken, format_type, date))
-                print("Successful")
-                print(i)
-                i = i + 1
-            
-
-            
-                
-    except Exception as e:
-        print(f"An error occurred: {str(e)}")
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
+import csv
+import requests
+import json
+import os
+import re
+import HttpCache
+import HtmlArchive
+import JsonExtractor
+import ParserBackends
+import ScoreParser
+import BulkWriter
+import Checkpoint
+import CrawlState
+import DbPool
+import Fetch
+import Frontier
+import Scheduler
+import Schema
+import Storage
+
+import sqlite3
+import json
+
+def fetch_page_content(url):
+    """
+    Fetch HTML content from the provided URL
+    
+    Args:
+        url (str): URL of the player profile page
+        
+    Returns:
+        str: HTML content of the page
+    """
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    }
+    
+    try:
+        # Conditional GET: unchanged pages are served from the local cache
+        html_content = HttpCache.fetch(url, headers=headers)
+        # Keep the raw page so it can be re-parsed offline later
+        HtmlArchive.store_page(url, html_content)
+        return html_content
+    except requests.exceptions.RequestException as e:
+        raise Exception(f"Failed to fetch the URL: {str(e)}")
+
+def extract_player_name(soup):
+    """
+    Extract player name from the page
+    
+    Args:
+        soup (BeautifulSoup): Parsed HTML content
+        
+    Returns:
+        str: Player name or "Unknown Player" if not found
+    """
+    try:
+        # Try different selectors that might contain the player name
+        selectors = [
+            'h1.player-profile-name',
+            '.player-name',
+            'h1.font-bold',
+            'title'
+        ]
+        
+        for selector in selectors:
+            element = soup.select_one(selector)
+            if element:
+                name = element.text.strip()
+                # If it's the title element, extract just the player name
+                if selector == 'title':
+                    name = name.split('|')[0].strip()
+                    if "stats" in name.lower():
+                        name = re.sub(r'\s+stats.*', '', name, flags=re.IGNORECASE)
+                return name[:-15]
+                
+        # Extract from URL as fallback
+        url_path = soup.find('meta', property='og:url')
+        if url_path:
+            url = url_path.get('content', '')
+            match = re.search(r'/players/([^/]+)', url)
+            if match:
+                player_slug = match.group(1)
+                player_name = ' '.join(word.capitalize() for word in player_slug.split('-') if word.isalpha())
+                if player_name:
+                    return player_name[:-15]
+                    
+        return "Unknown Player"
+    except Exception:
+        return "Unknown Player"
+
+def find_matches_table(soup):
+    """
+    Find the table containing match statistics
+    
+    Args:
+        soup (BeautifulSoup): Parsed HTML content
+        
+    Returns:
+        BeautifulSoup: Table element containing match statistics or None if not found
+    """
+    # Look for table with specific classes or within specific container
+    try:
+        # First try with specific class
+        table = soup.find('table', class_='w-full')
+        if table:
+            return table
+            
+        # Try with container that has "All Matches" heading
+        all_matches_heading = soup.find('p', string=lambda text: text and 'All Matches' in text)
+        if all_matches_heading:
+            container = all_matches_heading.find_parent('div')
+            if container:
+                table = container.find('table')
+                if table:
+                    return table
+                    
+        # Generic approach - look for tables with certain column headers
+        tables = soup.find_all('table')
+        for table in tables:
+            headers = table.find_all('th')
+            header_texts = [h.get_text(strip=True).lower() for h in headers]
+            if 'opposition' in header_texts and 'batting' in header_texts:
+                return table
+                
+        return None
+    except Exception:
+        return None
+
+def scrape_player_match_stats(html_content, backend=ParserBackends.DEFAULT_BACKEND, use_payload=True):
+    """
+    Scrape player match statistics from the provided HTML content
+    
+    Args:
+        html_content (str): HTML content containing player match statistics
+        backend (str): HTML parser backend (see ParserBackends.make_soup)
+        use_payload (bool): Read the matches from the embedded JSON payload when present
+        
+    Returns:
+        tuple: (player_name, matches_list)
+    """
+    # Prefer the embedded JSON payload; walk the table only when it is missing
+    if use_payload:
+        result = JsonExtractor.scrape_from_payload(html_content)
+        if result is not None and result[1]:
+            return result
+
+    # selectolax and lxml read the rows from their own tree; the rest go through BeautifulSoup
+    page = ParserBackends.read_match_rows(html_content, backend)
+    if page is not None:
+        name_soup, rows = page
+        player_name = extract_player_name(name_soup)
+    else:
+        # Parse HTML content
+        soup = ParserBackends.make_soup(html_content, backend)
+
+        # Extract player name
+        player_name = extract_player_name(soup)
+
+        # Find the table containing match stats
+        table = find_matches_table(soup)
+        if not table:
+            raise Exception("Could not find match statistics table in the HTML content")
+
+        # Extract all rows except the header
+        tbody = table.find('tbody')
+        if not tbody:
+            raise Exception("Table structure is not as expected (missing tbody)")
+        rows = ParserBackends.soup_rows(tbody)
+
+    if not rows:
+        raise Exception("No match data found in the table")
+    
+    matches = []
+    
+    for cells in rows:
+        if cells is None:
+            continue  # Skip rows with insufficient data or no match link
+        
+        try:
+            if isinstance(cells, Exception):
+                raise cells
+            
+            # Parse runs/balls/not out, wickets/runs conceded and date in one pass
+            line = ScoreParser.parse_cells(cells)
+            matches.append(ScoreParser.to_match_entry(line, player_name))
+        except Exception as e:
+            print(f"Warning: Could not process row: {str(e)}")
+    
+    return player_name, matches
+
+
+def store_matches(cursor, matches, i=0, writer=None, player_id=None):
+    """
+    Insert scraped match entries into the stats table
+
+    Args:
+        cursor: SQLite Cloud cursor
+        matches (list): List of match dictionaries
+        i (int): Running count of inserted rows
+        writer (BulkWriter.BulkWriter): Buffer the rows here instead of inserting them straight away
+        player_id (int): cricket.com ID of the player the matches belong to
+
+    Returns:
+        int: Updated running count of inserted rows
+    """
+    rows = [Schema.stats_row(entry, player_id) for entry in matches]
+    if writer is not None:
+        writer.add_many(rows)
+    elif rows:
+        cursor.executemany(Schema.STATS_UPSERT, rows)
+    return i + len(rows)
+
+
+def ingest_matches(cursor, url, player_name, matches, crawl_state=None, i=0, writer=None, players=None):
+    """
+    Store the matches scraped from one player page
+
+    Args:
+        cursor: SQLite Cloud cursor
+        url (str): URL of the player page
+        player_name (str): Name of the player as scraped from the page
+        matches (list): List of match dictionaries
+        crawl_state (dict): Newest match seen per URL from CrawlState.load_state.
+            When given, only matches newer than that are inserted. None stores everything.
+        i (int): Running count of inserted rows
+        writer (BulkWriter.BulkWriter): Batch the inserts through this writer
+        players (dict): player_id -> canonical name from Schema.load_players; new players are added
+
+    Returns:
+        int: Updated running count of inserted rows
+    """
+    player_id, player_name = Schema.resolve_player(cursor, url, player_name, players if players is not None else {})
+    if player_id is None:
+        print(f"No player ID in {url}, skipping its matches")
+        return i
+    if crawl_state is not None:
+        last_seen = crawl_state.get(url)
+        fresh = CrawlState.new_matches(matches, last_seen)
+        if fresh:
+            i = store_matches(cursor, fresh, i, writer, player_id)
+        else:
+            print(f"No new matches for {player_name}")
+        crawl_state[url] = CrawlState.record_crawl(cursor, url, player_name, matches, last_seen, changed=bool(fresh))
+        return i
+    return store_matches(cursor, matches, i, writer, player_id)
+
+
+def load_player_urls(source):
+    """
+    Load player documents from a CSV of player URLs instead of MongoDB
+
+    Args:
+        source (str): Path or http(s) URL of a CSV with Name and URL columns
+            (the format of player_urls.csv), or a plain list of URLs one per line
+
+    Returns:
+        list: Documents with "player_name" and "url" keys
+    """
+    if source.startswith("http"):
+        response = requests.get(source, timeout=HttpCache.DEFAULT_TIMEOUT)
+        response.raise_for_status()
+        text = response.text
+    else:
+        with open(source, 'r', encoding='utf-8') as f:
+            text = f.read()
+
+    lines = text.splitlines()
+    if lines and "URL" in lines[0].split(','):
+        return [{"player_name": row.get("Name"), "url": row["URL"]}
+                for row in csv.DictReader(lines) if row.get("URL")]
+    return [{"player_name": None, "url": line.strip()} for line in lines if line.strip()]
+
+
+def load_resumed_page(url, status):
+    """
+    Get the page for a URL picked up from an interrupted run. Pages that were
+    already fetched come from the local archive instead of the network.
+
+    Args:
+        url (str): URL of the player page
+        status (str): Checkpoint status the URL was left in
+
+    Returns:
+        str: HTML content of the page
+    """
+    if status in (Checkpoint.FETCHED, Checkpoint.PARSED):
+        content = HtmlArchive.load_latest(url)
+        if content is not None:
+            return content
+    return fetch_page_content(url)
+
+
+def main(async_mode=False, concurrency=None, per_host=None, timeout=None, replay=False, workers=None,
+         incremental=True, scheduled=False, budget=None, upcoming=(), adaptive=True,
+         resume=False, checkpoint_every=Checkpoint.DEFAULT_BATCH_SIZE, url_source=None, frontier_path=None,
+         batch_size=BulkWriter.DEFAULT_BATCH_SIZE, local_path=None, sync=True):
+    if local_path is not None:
+        # Write to the local primary; changes reach SQLite Cloud in the background unless sync is off
+        conn = Storage.open_store(local_path or None, sync=sync)
+    else:
+        # Pooled connection to SQLite Cloud
+        pool = DbPool.get_pool()
+        conn = pool.acquire()
+
+    # Connect to SQLite database (or create it if it doesn't exist)
+    cursor = conn.cursor()
+    # Rows go out in batches; commits happen below, together with the checkpoint
+    writer = BulkWriter.BulkWriter(conn, batch_size=batch_size, commit=False)
+    i = 0
+    checkpoint = None
+    frontier = None
+    failed = False
+    try:
+        # Unique match key and indexes, so reruns update rows instead of duplicating them
+        Schema.ensure_stats(cursor)
+        # Canonical names by player ID; pages of new players add to it
+        players = Schema.load_players(cursor)
+        crawl_state = None
+        if incremental or scheduled:
+            CrawlState.ensure_table(cursor)
+        if incremental:
+            crawl_state = CrawlState.load_state(cursor)
+
+        if replay and workers:
+            # Re-parse the archive on a process pool; rows are written here
+            import ParallelParse
+            for url, player_name, rows, error in ParallelParse.parse_archive(workers=workers):
+                if error:
+                    print(f"Error parsing {url}: {error}")
+                    continue
+                matches = ParallelParse.record_to_matches(player_name, rows)
+                i = ingest_matches(cursor, url, player_name, matches, crawl_state, i, writer, players)
+            writer.flush()
+            conn.commit()
+            print(f"Stored {i} rows: {writer.stats()}")
+            return
+
+        if replay:
+            # Re-parse the latest archived copy of every page, no network needed
+            for url, content in HtmlArchive.iter_latest_pages():
+                player_name, matches = scrape_player_match_stats(content)
+                i = ingest_matches(cursor, url, player_name, matches, crawl_state, i, writer, players)
+            writer.flush()
+            conn.commit()
+            print(f"Stored {i} rows: {writer.stats()}")
+            return
+
+        checkpoint = Checkpoint.CheckpointLog(batch_size=checkpoint_every)
+        scheduler = None
+        resumed = checkpoint.resume() if resume else None
+        if resumed is not None:
+            # Pick up the interrupted run where it stopped; stored pages are skipped
+            print(f"Resuming crawl with {len(resumed)} pages left")
+            statuses = dict(resumed)
+            urls = [url for url, status in resumed]
+        else:
+            if resume:
+                print("No interrupted crawl to resume, starting a new one")
+            if url_source:
+                docs = load_player_urls(url_source)
+            elif frontier_path is not None:
+                # Claim due players from the local frontier so other workers skip them
+                frontier = Frontier.Frontier(frontier_path or None)
+                docs = frontier.claim(limit=budget)
+            elif scheduled:
+                # Let MongoDB skip players that are known not to be due
+                docs = Fetch.iter_players(Fetch.exclude_urls_query(Scheduler.not_due_urls(cursor, upcoming)))
+            else:
+                docs = Fetch.iter_players()
+            if scheduled:
+                # Only crawl players that are due, most urgent first, within the budget
+                scheduler = Scheduler.build_scheduler(cursor, docs, upcoming)
+                docs = scheduler.due(budget)
+            statuses = {}
+            urls = checkpoint.start(doc["url"] for doc in docs)
+
+        # Frontier updates wait for the batch: the frontier commits as it goes
+        completed = []
+
+        def commit_batch():
+            # Stats first, then the checkpoint and the frontier, so a page is never
+            # marked stored or done before its rows are
+            writer.flush()
+            conn.commit()
+            checkpoint.commit()
+            for url, due_at in completed:
+                frontier.complete(url, due_at)
+            completed.clear()
+
+        def store_page(url, content):
+            # The page is in the archive now, so --resume reads it from there
+            checkpoint.mark(url, Checkpoint.FETCHED)
+            player_name, matches = scrape_player_match_stats(content)
+            checkpoint.mark(url, Checkpoint.PARSED)
+            rows = ingest_matches(cursor, url, player_name, matches, crawl_state, counter["rows"], writer, players)
+            if scheduler:
+                due_at = scheduler.record_success(cursor, url, matches)
+            else:
+                # Same refresh interval the scheduler would pick, so the frontier doesn't recrawl at once
+                _, due_at = Scheduler.next_due(matches)
+            checkpoint.mark(url, Checkpoint.STORED)
+            if frontier:
+                completed.append((url, due_at))
+            if checkpoint.commit_due():
+                commit_batch()
+            counter["rows"] = rows
+
+        def record_error(url, e):
+            print(f"Error crawling {url}: {str(e)}")
+            checkpoint.mark(url, Checkpoint.FAILED, str(e))
+            retry_at = scheduler.record_failure(cursor, url) if scheduler else None
+            if frontier:
+                frontier.fail(url, str(e), retry_at)
+
+        def crawl_serially(urls):
+            for url in urls:
+                try:
+                    store_page(url, load_resumed_page(url, statuses.get(url)))
+                except Exception as e:
+                    # One bad page shouldn't stop the crawl; it stays FAILED for the next run
+                    record_error(url, e)
+
+        counter = {"rows": 0}
+        if async_mode:
+            import AsyncCrawler
+
+            # Pages fetched before an interruption are read back from the archive
+            archived = [url for url in urls if statuses.get(url) in (Checkpoint.FETCHED, Checkpoint.PARSED)]
+            crawl_serially(archived)
+            archived = set(archived)
+            urls = [url for url in urls if url not in archived]
+
+            options = {
+                "concurrency": concurrency or AsyncCrawler.DEFAULT_CONCURRENCY,
+                "per_host": per_host or AsyncCrawler.DEFAULT_PER_HOST,
+                "timeout": timeout or AsyncCrawler.DEFAULT_TIMEOUT,
+                "adaptive": adaptive,
+            }
+            AsyncCrawler.run_crawl(urls, store_page, handle_error=record_error, **options)
+        else:
+            crawl_serially(urls)
+
+        commit_batch()
+        summary = checkpoint.summary()
+        print(f"Crawl finished: {summary}")
+        print(f"Stored {writer.rows} rows: {writer.stats()}")
+        if summary.get(Checkpoint.FAILED) and not scheduler:
+            # Without the scheduler nothing retries failed pages, so keep the run open for --resume
+            print(f"{summary[Checkpoint.FAILED]} pages failed; rerun with --resume to retry them")
+        else:
+            checkpoint.finish()
+                
+    except BaseException as e:
+        failed = True
+        print(f"An error occurred: {str(e) or type(e).__name__}")
+        if checkpoint:
+            # Drop the partial batch so the stats table matches the checkpoint
+            conn.rollback()
+            print("Rows since the last checkpoint were not committed; rerun with --resume to continue")
+        if not isinstance(e, Exception):
+            raise  # Ctrl-C and exit still stop the program once the batch is rolled back
+    finally:
+        if checkpoint:
+            checkpoint.close()
+        if frontier:
+            # Players skipped by the scheduler or cut short by an error go back to the frontier
+            frontier.release()
+            frontier.close()
+        if local_path is not None:
+            # Waits for the outstanding changes to be pushed to the cloud
+            conn.close()
+        else:
+            pool.release(conn, failed=failed)
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Scrape recent matches for every player and store them in SQLite Cloud")
+    parser.add_argument("--async", dest="async_mode", action="store_true", help="crawl players concurrently with asyncio")
+    parser.add_argument("--concurrency", type=int, help="maximum requests in flight overall (async mode)")
+    parser.add_argument("--per-host", type=int, help="maximum requests in flight per host (async mode)")
+    parser.add_argument("--timeout", type=float, help="per-request timeout in seconds (async mode)")
+    parser.add_argument("--fixed-concurrency", action="store_true",
+                        help="always keep --concurrency requests in flight instead of adapting to the server (async mode)")
+    parser.add_argument("--replay", action="store_true", help="re-parse pages from the local HTML archive instead of crawling")
+    parser.add_argument("--workers", type=int, help="parse archived pages on this many processes (replay mode)")
+    parser.add_argument("--full", action="store_true", help="insert every scraped match instead of only ones newer than the last crawl")
+    parser.add_argument("--scheduled", action="store_true", help="only crawl players that are due for a refresh, most urgent first")
+    parser.add_argument("--budget", type=int, help="maximum number of players to crawl (scheduled mode)")
+    parser.add_argument("--upcoming", help="file of player URLs or names in upcoming fixtures, one per line (scheduled mode)")
+    parser.add_argument("--urls", dest="url_source",
+                        help="crawl the players in this CSV file or URL (e.g. from MockServer) instead of MongoDB")
+    parser.add_argument("--frontier", dest="frontier_path", nargs="?", const="", metavar="DB",
+                        help="claim players from the local SQLite frontier (see Frontier.py) instead of MongoDB")
+    parser.add_argument("--batch-size", type=int, default=BulkWriter.DEFAULT_BATCH_SIZE,
+                        help="match rows sent to the database per executemany")
+    parser.add_argument("--local", dest="local_path", nargs="?", const="", metavar="DB",
+                        help="store in a local SQLite file (see Storage.py) and sync to SQLite Cloud in the background")
+    parser.add_argument("--no-sync", action="store_true",
+                        help="store in the --local file only and never contact SQLite Cloud, e.g. for MockServer runs")
+    parser.add_argument("--resume", action="store_true", help="continue the last interrupted crawl instead of starting a new one")
+    parser.add_argument("--checkpoint-every", type=int, default=Checkpoint.DEFAULT_BATCH_SIZE,
+                        help="commit stored rows and crawl progress after this many pages")
+    args = parser.parse_args()
+    if args.no_sync and args.local_path is None:
+        args.local_path = ""
+
+    upcoming = ()
+    if args.upcoming:
+        with open(args.upcoming, 'r', encoding='utf-8') as f:
+            upcoming = [line.strip() for line in f if line.strip()]
+
+    main(async_mode=args.async_mode, concurrency=args.concurrency, per_host=args.per_host, timeout=args.timeout,
+         replay=args.replay, workers=args.workers, incremental=not args.full,
+         scheduled=args.scheduled, budget=args.budget, upcoming=upcoming, adaptive=not args.fixed_concurrency,
+         resume=args.resume, checkpoint_every=args.checkpoint_every, url_source=args.url_source,
+         frontier_path=args.frontier_path, batch_size=args.batch_size,
+         local_path=args.local_path, sync=not args.no_sync)
@@ -1,110 +1,130 @@
-from flask import Flask, jsonify, request
-import sqlitecloud
-import math
-from fuzzywuzzy import fuzz
-from fuzzywuzzy import process
-
-app = Flask(__name__)
-
-# SQLite Cloud connection string
-DATABASE_URL = ""
-
-def get_db_connection():
-    """Connect to SQLite Cloud database."""
-    conn = sqlitecloud.connect(DATABASE_URL)
-    return conn
-
-@app.route('/player/<string:player_name>', methods=['GET'])
-def get_player_points(player_name):
-    """
-    Endpoint to fetch credit points for a specific player.
-    URL: /player/<player_name>
-    """
-    # player_name = " ".join(player_name.split("-")).title()
-    search_term = player_name
-
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        threshold = 30
-
-        # Fetch all player names from the database
-        cursor.execute("SELECT player_name FROM player_average_points")
-        player_names = [row[0] for row in cursor.fetchall()]
-        
-        # Perform fuzzy matching
-        best_match, score = process.extractOne(search_term, player_names, scorer=fuzz.ratio)
-        print(best_match)
-        print(score)
-        if score >= threshold:
-            # Retrieve the average point for the best matching player
-            query = '''
-            SELECT player_name, average_point
-            FROM player_average_points
-            WHERE player_name = ?
-            '''
-
-            conn = get_db_connection()
-            cursor = conn.cursor()
-            cursor.execute(query, (best_match,))
-            rows = cursor.fetchone()
-            
-            if not rows:
-                return jsonify({"message": f"No data found for player: {best_match}"}), 404
-
-        # Format the response data
-        results = []
-        
-        results.append({
-                "player_name": rows[0],
-                "credit_points": math.ceil(rows[1])
-            })
-
-        return jsonify(results), 200
-
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-
-    finally:
-        conn.close()
-
-@app.route('/players', methods=['GET'])
-def get_all_players():
-    """
-    Endpoint to fetch all players and their average credit points.
-    URL: /players
-    """
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        # Query to fetch all players and their average points
-        query = '''
-        SELECT player_name, total_matches, avg_credit
-        FROM total_credits
-        '''
-        cursor.execute(query)
-        rows = cursor.fetchall()
-
-        if not rows:
-            return jsonify({"message": "No players found"}), 404
-
-        # Format the response data
-        results = []
-        for row in rows:
-            results.append({
-                "player_name": row[0],
-                "total_matches": row[1],
-                "avg_credit_points": row[2]
-            })
-
-        return jsonify(results), 200
-
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-
-    finally:
-        conn.close()
-
-if __name__ == '__main__':
-    app.run(debug=True)
+from flask import Flask, jsonify, request
+import math
+import threading
+import time
+from fuzzywuzzy import fuzz
+from fuzzywuzzy import process
+
+import DbPool
+
+app = Flask(__name__)
+
+# Seconds before the cached player names are reloaded
+PLAYER_INDEX_TTL = 300
+
+_player_index = None  # (loaded_at, names, {player_name: player_id})
+_player_index_lock = threading.Lock()
+
+def get_db_connection():
+    """Check out a pooled SQLite Cloud connection for one request."""
+    return DbPool.connection()
+
+def get_player_index(cursor):
+    """
+    Canonical names of the players that have average points, for fuzzy
+    matching. Loaded once and shared by requests until it expires, instead
+    of fetching every name on every request.
+
+    Returns:
+        tuple: (list of names, dict of player_name -> player_id)
+    """
+    global _player_index
+    with _player_index_lock:
+        if _player_index is None or time.monotonic() - _player_index[0] > PLAYER_INDEX_TTL:
+            cursor.execute("""
+                SELECT p.player_name, p.player_id
+                FROM player_average_points a JOIN players p ON p.player_id = a.player_id
+            """)
+            ids = dict(cursor.fetchall())
+            _player_index = (time.monotonic(), list(ids), ids)
+        return _player_index[1], _player_index[2]
+
+@app.route('/player/<string:player_name>', methods=['GET'])
+def get_player_points(player_name):
+    """
+    Endpoint to fetch credit points for a specific player.
+    URL: /player/<player_name>
+    """
+    # player_name = " ".join(player_name.split("-")).title()
+    search_term = player_name
+
+    try:
+        # One pooled connection for the whole request
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            threshold = 30
+
+            # Player names come from the in-memory index
+            player_names, player_ids = get_player_index(cursor)
+            if not player_names:
+                return jsonify({"message": f"No data found for player: {player_name}"}), 404
+
+            # Perform fuzzy matching
+            best_match, score = process.extractOne(search_term, player_names, scorer=fuzz.ratio)
+            print(best_match)
+            print(score)
+            if score < threshold:
+                return jsonify({"message": f"No data found for player: {player_name}"}), 404
+
+            # Retrieve the average point for the best matching player by its ID
+            query = '''
+            SELECT average_point
+            FROM player_average_points
+            WHERE player_id = ?
+            '''
+            cursor.execute(query, (player_ids[best_match],))
+            rows = cursor.fetchone()
+
+        if not rows:
+            return jsonify({"message": f"No data found for player: {best_match}"}), 404
+
+        # Format the response data
+        results = []
+        
+        results.append({
+                "player_name": best_match,
+                "credit_points": math.ceil(rows[0])
+            })
+
+        return jsonify(results), 200
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/players', methods=['GET'])
+def get_all_players():
+    """
+    Endpoint to fetch all players and their average credit points.
+    URL: /players
+    """
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+
+            # Query to fetch all players and their average points
+            query = '''
+            SELECT player_name, total_matches, avg_credit
+            FROM total_credits
+            '''
+            cursor.execute(query)
+            rows = cursor.fetchall()
+
+        if not rows:
+            return jsonify({"message": "No players found"}), 404
+
+        # Format the response data
+        results = []
+        for row in rows:
+            results.append({
+                "player_name": row[0],
+                "total_matches": row[1],
+                "avg_credit_points": row[2]
+            })
+
+        return jsonify(results), 200
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+if __name__ == '__main__':
+    app.run(debug=True)
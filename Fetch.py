@@ -1,39 +1,98 @@
-import pymongo
-
-def fetch_data_from_mongodb():
-    """
-    Connects to MongoDB, fetches data from a specified collection, and returns it.
-
-    Returns:
-        list: A list of documents fetched from the MongoDB collection.
-    """
-    try:
-        # Replace with your MongoDB connection string
-        CONNECTION_STRING = ""
-        
-        # Connect to MongoDB
-        client = pymongo.MongoClient(CONNECTION_STRING)
-        # Access the database and collection
-        db = client["cricket"]  # Replace with your database name
-        collection = db["players"]  # Replace with your collection name
-        
-        # Fetch all documents from the collection
-        documents = collection.find()  # Retrieves all documents
-        
-        # Convert documents to a list for easier processing
-        data_list = [doc for doc in documents]
-        
-        return data_list
-    
-    except pymongo.errors.ConnectionFailure as e:
-        print(f"Could not connect to MongoDB: {e}")
-    except Exception as e:
-        print(f"An error occurred: {e}")
-
-# Example usage
-if __name__ == "__main__":
-    data = fetch_data_from_mongodb()
-    if data:
-        print(f"Fetched {len(data)} documents.")
-    else:
-        print("No data found or an error occurred.")
+import os
+import threading
+
+import pymongo
+
+# Replace with your MongoDB connection string (or set MONGODB_URI)
+CONNECTION_STRING = os.environ.get("MONGODB_URI", "")
+DATABASE_NAME = "cricket"
+COLLECTION_NAME = "players"
+
+# Documents per round trip while streaming
+DEFAULT_BATCH_SIZE = 500
+
+# The crawlers only read these fields
+DEFAULT_FIELDS = ("url", "player_name", "player_id")
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_client():
+    """
+    Process-wide MongoClient, created on first use. MongoClient keeps its own
+    connection pool and is safe to share between threads.
+
+    Returns:
+        pymongo.MongoClient
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = pymongo.MongoClient(CONNECTION_STRING)
+    return _client
+
+def get_collection():
+    return get_client()[DATABASE_NAME][COLLECTION_NAME]
+
+def exclude_urls_query(urls):
+    """
+    Query matching every player except the given URLs, e.g. the ones
+    Scheduler.not_due_urls says are not due for a refresh yet
+
+    Args:
+        urls (iterable): Player URLs to leave out
+
+    Returns:
+        dict: MongoDB query
+    """
+    urls = list(urls)
+    return {"url": {"$nin": urls}} if urls else {}
+
+def iter_players(query=None, fields=DEFAULT_FIELDS, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Stream player documents from MongoDB. Only the requested fields are sent
+    and documents arrive batch_size at a time, so the first URL is available
+    straight away and memory doesn't grow with the collection.
+
+    Args:
+        query (dict): MongoDB filter, e.g. exclude_urls_query(...); None for every player
+        fields (iterable): Fields to return, or None for whole documents
+        batch_size (int): Documents per round trip
+
+    Yields:
+        dict: Player documents
+    """
+    projection = None
+    if fields is not None:
+        projection = {field: 1 for field in fields}
+        projection["_id"] = 0
+    with get_collection().find(query or {}, projection, batch_size=batch_size) as cursor:
+        yield from cursor
+
+def fetch_data_from_mongodb():
+    """
+    Connects to MongoDB, fetches data from a specified collection, and returns it.
+
+    Returns:
+        list: A list of documents fetched from the MongoDB collection.
+    """
+    try:
+        # Fetch all documents from the collection
+        # Convert documents to a list for easier processing
+        data_list = list(iter_players(fields=None))
+
+        return data_list
+
+    except pymongo.errors.ConnectionFailure as e:
+        print(f"Could not connect to MongoDB: {e}")
+    except Exception as e:
+        print(f"An error occurred: {e}")
+
+# Example usage
+if __name__ == "__main__":
+    data = fetch_data_from_mongodb()
+    if data:
+        print(f"Fetched {len(data)} documents.")
+    else:
+        print("No data found or an error occurred.")
@@ -0,0 +1,265 @@
+import csv
+import os
+import socket
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+# Local URL frontier (override with the FRONTIER_DB environment variable)
+FRONTIER_DB = os.environ.get("FRONTIER_DB", "frontier.db")
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Player states
+PENDING = "pending"
+CLAIMED = "claimed"
+DONE = "done"
+FAILED = "failed"
+
+# Claims older than this are assumed abandoned by a crashed worker
+DEFAULT_LEASE = timedelta(minutes=30)
+
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_FIELDS = ("url", "player_name", "player_id")
+
+def _now():
+    return datetime.now().strftime(TIME_FORMAT)
+
+def default_worker_id():
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+class Frontier:
+    """
+    Player URL store in a local SQLite file, used in place of the MongoDB
+    collection. WAL mode lets several crawler processes read and claim
+    URLs at the same time; claim() hands each URL to one worker only.
+    """
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path (str): Frontier database file
+        """
+        self.path = path or FRONTIER_DB
+        self.conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS players (
+                player_id INTEGER PRIMARY KEY,
+                player_name TEXT,
+                url TEXT NOT NULL UNIQUE,
+                status TEXT NOT NULL DEFAULT 'pending',
+                next_fetch_at TEXT,
+                claimed_by TEXT,
+                claimed_at TEXT,
+                error TEXT,
+                updated_at TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_players_due ON players (status, next_fetch_at);
+        """)
+        self._lock = threading.Lock()
+
+    def add_players(self, players):
+        """
+        Add players or update their name and URL, keyed on player ID
+
+        Args:
+            players (iterable): Dictionaries with player_id, player_name and url
+
+        Returns:
+            int: Number of players written
+        """
+        rows = [(player["player_id"], player.get("player_name"), player["url"], _now())
+                for player in players if player.get("player_id") is not None]
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self.conn.executemany("""
+                    INSERT INTO players (player_id, player_name, url, updated_at) VALUES (?, ?, ?, ?)
+                    ON CONFLICT(player_id) DO UPDATE SET
+                        player_name = excluded.player_name,
+                        url = excluded.url,
+                        updated_at = excluded.updated_at
+                """, rows)
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+        return len(rows)
+
+    def import_csv(self, filename="player_urls.csv"):
+        """
+        Load players from a CSV with Name, ID and URL columns (the format of player_urls.csv)
+
+        Returns:
+            int: Number of players written
+        """
+        with open(filename, 'r', encoding='utf-8') as f:
+            players = [{"player_id": int(row["ID"]), "player_name": row["Name"], "url": row["URL"]}
+                       for row in csv.DictReader(f) if row.get("ID", "").isdigit() and row.get("URL")]
+        return self.add_players(players)
+
+    def iter_players(self, due_before=None, fields=DEFAULT_FIELDS, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Stream player documents, like Fetch.iter_players
+
+        Args:
+            due_before (datetime): Only players due for a fetch at this time; None for every player
+            fields (iterable): Columns to return
+            batch_size (int): Rows fetched per step
+
+        Yields:
+            dict: Player documents
+        """
+        fields = list(fields or DEFAULT_FIELDS)
+        query = f"SELECT {', '.join(fields)} FROM players"
+        params = ()
+        if due_before is not None:
+            query += " WHERE next_fetch_at IS NULL OR next_fetch_at <= ?"
+            params = (due_before.strftime(TIME_FORMAT),)
+        # A separate connection so a long read doesn't hold up claims on this one
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            cursor = conn.execute(query + " ORDER BY player_id", params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(zip(fields, row))
+        finally:
+            conn.close()
+
+    def claim(self, worker_id=None, limit=None, now=None, lease=DEFAULT_LEASE):
+        """
+        Take due players for one worker. A player is due when its next_fetch_at
+        has passed (or was never set) and no other worker holds a live claim.
+
+        Args:
+            worker_id (str): Name of the claiming worker
+            limit (int): Maximum number of players to claim (None for every due player)
+            now (datetime): Current time
+            lease (timedelta): Claims older than this are taken over
+
+        Returns:
+            list: Claimed player documents, soonest due first
+        """
+        worker_id = worker_id or default_worker_id()
+        now = now or datetime.now()
+        now_text = now.strftime(TIME_FORMAT)
+        stale = (now - lease).strftime(TIME_FORMAT)
+        with self._lock:
+            # IMMEDIATE takes the write lock first, so two workers never pick the same rows
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self.conn.execute("""
+                    SELECT player_id, player_name, url FROM players
+                    WHERE (status != ? OR claimed_at < ?)
+                      AND (next_fetch_at IS NULL OR next_fetch_at <= ?)
+                    ORDER BY next_fetch_at IS NOT NULL, next_fetch_at, player_id
+                    LIMIT ?
+                """, (CLAIMED, stale, now_text, -1 if limit is None else limit)).fetchall()
+                self.conn.executemany("""
+                    UPDATE players SET status = ?, claimed_by = ?, claimed_at = ?, updated_at = ?
+                    WHERE player_id = ?
+                """, [(CLAIMED, worker_id, now_text, now_text, row[0]) for row in rows])
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+        return [{"player_id": row[0], "player_name": row[1], "url": row[2]} for row in rows]
+
+    def _finish(self, url, status, next_fetch_at=None, error=None):
+        next_fetch = next_fetch_at.strftime(TIME_FORMAT) if next_fetch_at else None
+        with self._lock:
+            self.conn.execute("""
+                UPDATE players SET status = ?, next_fetch_at = ?, error = ?, claimed_by = NULL,
+                    claimed_at = NULL, updated_at = ?
+                WHERE url = ?
+            """, (status, next_fetch, error, _now(), url))
+
+    def complete(self, url, next_fetch_at=None):
+        """
+        Release a claimed player after a successful crawl
+
+        Args:
+            url (str): URL of the player page
+            next_fetch_at (datetime): When it is next due (None: due again straight away)
+        """
+        self._finish(url, DONE, next_fetch_at)
+
+    def fail(self, url, error=None, retry_at=None):
+        """
+        Release a claimed player after a failed crawl
+
+        Args:
+            url (str): URL of the player page
+            error (str): Error message
+            retry_at (datetime): When to try again (None: next run)
+        """
+        self._finish(url, FAILED, retry_at, error)
+
+    def release(self, worker_id=None):
+        """
+        Hand back players a worker claimed but never finished
+
+        Returns:
+            int: Number of players released
+        """
+        worker_id = worker_id or default_worker_id()
+        with self._lock:
+            cursor = self.conn.execute("""
+                UPDATE players SET status = ?, claimed_by = NULL, claimed_at = NULL, updated_at = ?
+                WHERE status = ? AND claimed_by = ?
+            """, (PENDING, _now(), CLAIMED, worker_id))
+        return cursor.rowcount
+
+    def summary(self):
+        """
+        Count players by status
+
+        Returns:
+            dict: status -> count
+        """
+        with self._lock:
+            return dict(self.conn.execute("SELECT status, COUNT(*) FROM players GROUP BY status").fetchall())
+
+    def close(self):
+        self.conn.close()
+
+def fetch_data_from_frontier(path=None):
+    """
+    Drop-in replacement for Fetch.fetch_data_from_mongodb that reads the local frontier
+
+    Args:
+        path (str): Frontier database file
+
+    Returns:
+        list: A list of player documents.
+    """
+    try:
+        frontier = Frontier(path)
+        try:
+            return list(frontier.iter_players())
+        finally:
+            frontier.close()
+    except Exception as e:
+        print(f"An error occurred: {e}")
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Manage the local player URL frontier")
+    parser.add_argument("--db", help=f"frontier database file (default {FRONTIER_DB})")
+    parser.add_argument("--import", dest="import_csv", metavar="CSV",
+                        help="add or update players from a CSV with Name, ID and URL columns")
+    args = parser.parse_args()
+
+    frontier = Frontier(args.db)
+    try:
+        if args.import_csv:
+            print(f"Imported {frontier.import_csv(args.import_csv)} players from {args.import_csv}")
+        print(f"Players by status: {frontier.summary()}")
+    finally:
+        frontier.close()
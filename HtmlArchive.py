@@ -0,0 +1,187 @@
+import gzip
+import hashlib
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+# Use zstd when the zstandard package is installed, otherwise fall back to gzip
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Directory holding the archive (override with the HTML_ARCHIVE_DIR environment variable)
+ARCHIVE_DIR = os.environ.get("HTML_ARCHIVE_DIR", "html_archive")
+
+CODEC_SUFFIXES = {"zstd": ".html.zst", "gzip": ".html.gz"}
+
+def _manifest_path():
+    return os.path.join(ARCHIVE_DIR, "manifest.db")
+
+def object_path(digest, codec):
+    """
+    Get the file path of an archived page from its content hash
+    """
+    return os.path.join(ARCHIVE_DIR, "objects", digest[:2], digest + CODEC_SUFFIXES[codec])
+
+def connect():
+    """
+    Open the archive manifest, creating it if it doesn't exist
+
+    Returns:
+        sqlite3.Connection: Connection to the manifest database
+    """
+    os.makedirs(ARCHIVE_DIR, exist_ok=True)
+    conn = sqlite3.connect(_manifest_path(), timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS pages (
+            url TEXT NOT NULL,
+            fetched_at TEXT NOT NULL,
+            hash TEXT NOT NULL,
+            codec TEXT NOT NULL
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_url_fetched ON pages (url, fetched_at)")
+    return conn
+
+def _compress(data, codec):
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    return gzip.compress(data, compresslevel=6)
+
+def _decompress(data, codec):
+    if codec == "zstd":
+        if zstandard is None:
+            raise Exception("Page was archived with zstd but the zstandard package is not installed")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+def store_page(url, html_content, conn=None):
+    """
+    Store a fetched page in the archive and record it in the manifest.
+    Identical pages are stored only once.
+
+    Args:
+        url (str): URL the page was fetched from
+        html_content (str): HTML content of the page
+        conn (sqlite3.Connection): Optional open manifest connection
+
+    Returns:
+        str: SHA-256 hash of the page content
+    """
+    data = html_content.encode('utf-8')
+    digest = hashlib.sha256(data).hexdigest()
+    codec = "zstd" if zstandard is not None else "gzip"
+
+    # Reuse an existing object whatever codec it was written with
+    for existing_codec in CODEC_SUFFIXES:
+        if os.path.exists(object_path(digest, existing_codec)):
+            codec = existing_codec
+            break
+    else:
+        path = object_path(digest, codec)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(_compress(data, codec))
+        os.replace(tmp_path, path)
+
+    own_conn = conn is None
+    if own_conn:
+        conn = connect()
+    try:
+        with conn:
+            conn.execute(
+                "INSERT INTO pages (url, fetched_at, hash, codec) VALUES (?, ?, ?, ?)",
+                (url, datetime.now().strftime("%Y-%m-%d %H:%M:%S"), digest, codec)
+            )
+    finally:
+        if own_conn:
+            conn.close()
+    return digest
+
+def load_path(path):
+    """
+    Load an archived page from its object file path
+
+    Args:
+        path (str): Path of a .html.zst or .html.gz object file
+
+    Returns:
+        str: HTML content of the page
+    """
+    codec = "zstd" if path.endswith(CODEC_SUFFIXES["zstd"]) else "gzip"
+    with open(path, 'rb') as f:
+        return _decompress(f.read(), codec).decode('utf-8')
+
+def load_page(digest, codec=None):
+    """
+    Load an archived page by its content hash
+
+    Args:
+        digest (str): SHA-256 hash of the page content
+        codec (str): "zstd" or "gzip"; detected from the stored file if omitted
+
+    Returns:
+        str: HTML content of the page
+    """
+    codecs = [codec] if codec else list(CODEC_SUFFIXES)
+    for candidate in codecs:
+        path = object_path(digest, candidate)
+        if os.path.exists(path):
+            return load_path(path)
+    raise Exception(f"Page {digest} not found in the archive")
+
+def load_latest(url):
+    """
+    Load the most recently archived copy of a URL
+
+    Args:
+        url (str): URL of the page
+
+    Returns:
+        str: HTML content of the page or None if the URL was never archived
+    """
+    conn = connect()
+    try:
+        row = conn.execute(
+            "SELECT hash, codec FROM pages WHERE url = ? ORDER BY fetched_at DESC, rowid DESC LIMIT 1",
+            (url,)
+        ).fetchone()
+    finally:
+        conn.close()
+    if not row:
+        return None
+    return load_page(row[0], row[1])
+
+def iter_latest_entries():
+    """
+    Iterate over the latest manifest entry of every archived URL
+
+    Yields:
+        tuple: (url, fetched_at, hash, codec)
+    """
+    conn = connect()
+    try:
+        cursor = conn.execute("""
+            SELECT url, fetched_at, hash, codec FROM pages p
+            WHERE rowid = (SELECT rowid FROM pages WHERE url = p.url
+                           ORDER BY fetched_at DESC, rowid DESC LIMIT 1)
+            ORDER BY url
+        """)
+        for row in cursor:
+            yield row
+    finally:
+        conn.close()
+
+def iter_latest_pages():
+    """
+    Iterate over the latest archived copy of every URL, for offline replay
+
+    Yields:
+        tuple: (url, html_content)
+    """
+    for url, fetched_at, digest, codec in iter_latest_entries():
+        yield url, load_page(digest, codec)
@@ -0,0 +1,152 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+import requests
+
+import RateControl
+
+# Directory holding cached responses (override with the HTTP_CACHE_DIR environment variable)
+CACHE_DIR = os.environ.get("HTTP_CACHE_DIR", "http_cache")
+
+# Per-request timeout in seconds
+DEFAULT_TIMEOUT = 30
+
+# Shared session so repeated requests reuse keep-alive connections
+_session = requests.Session()
+
+def _cache_paths(url):
+    """
+    Get the metadata and body file paths used to cache a URL
+
+    Args:
+        url (str): Requested URL
+
+    Returns:
+        tuple: (metadata_path, body_path)
+    """
+    key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+    directory = os.path.join(CACHE_DIR, key[:2])
+    return os.path.join(directory, key + ".json"), os.path.join(directory, key + ".html")
+
+def _write_atomic(path, data):
+    """
+    Write a file via a temporary name so readers never see a partial file
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def load_entry(url):
+    """
+    Load a cached response for a URL
+
+    Args:
+        url (str): Requested URL
+
+    Returns:
+        dict: Cached entry with etag, last_modified, fetched_at and body, or None if not cached
+    """
+    meta_path, body_path = _cache_paths(url)
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+        with open(body_path, 'r', encoding='utf-8', newline='') as f:
+            entry["body"] = f.read()
+        return entry
+    except (OSError, ValueError):
+        return None
+
+def conditional_headers(entry):
+    """
+    Build the validator headers for revalidating a cached entry
+
+    Args:
+        entry (dict): Cached entry returned by load_entry, or None
+
+    Returns:
+        dict: If-None-Match / If-Modified-Since headers (empty if there is nothing to revalidate)
+    """
+    headers = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+def store_entry(url, response_headers, body):
+    """
+    Save a response body and its validators to the cache
+
+    Args:
+        url (str): Requested URL
+        response_headers (Mapping): Response headers (case-insensitive mapping)
+        body (str): Response body
+
+    Returns:
+        bool: True if the response was cached, False if it carried no validators
+    """
+    etag = response_headers.get("ETag")
+    last_modified = response_headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return False
+
+    meta_path, body_path = _cache_paths(url)
+    os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+    _write_atomic(body_path, body)
+    _write_atomic(meta_path, json.dumps({
+        "url": url,
+        "etag": etag,
+        "last_modified": last_modified,
+        "fetched_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    }))
+    return True
+
+def fetch(url, headers=None, timeout=DEFAULT_TIMEOUT, max_retries=RateControl.DEFAULT_RETRIES):
+    """
+    Fetch a URL with a conditional GET, serving 304 responses from the local cache.
+    429/5xx responses and timeouts are retried with backoff, honouring Retry-After.
+
+    Args:
+        url (str): URL to fetch
+        headers (dict): Extra request headers
+        timeout (float): Per-request timeout in seconds
+        max_retries (int): Number of retries after a retryable failure
+
+    Returns:
+        str: Response body
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails or returns an error status
+    """
+    entry = load_entry(url)
+    request_headers = dict(headers or {})
+    request_headers.update(conditional_headers(entry))
+
+    attempt = 0
+    while True:
+        retry_after = None
+        try:
+            response = _session.get(url, headers=request_headers, timeout=timeout)
+            if response.status_code not in RateControl.RETRYABLE_STATUSES:
+                break
+            retry_after = RateControl.parse_retry_after(response.headers.get("Retry-After"))
+            if attempt >= max_retries:
+                break  # raise_for_status below reports the last error
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+            if attempt >= max_retries:
+                raise
+        attempt += 1
+        time.sleep(RateControl.backoff_delay(attempt, retry_after))
+
+    if response.status_code == 304 and entry:
+        return entry["body"]
+    response.raise_for_status()  # Raise exception for 4XX/5XX responses
+
+    store_entry(url, response.headers, response.text)
+    return response.text
@@ -0,0 +1,172 @@
+import json
+import re
+from datetime import datetime, timedelta, timezone
+
+import ScoreParser
+
+# cricket.com renders match dates in Indian Standard Time
+IST = timezone(timedelta(hours=5, minutes=30))
+
+# Next.js streams its data as escaped JSON strings in self.__next_f.push([1, "..."]) calls.
+# They are located with str.find: a regex over the escaped strings backtracks
+# through the whole page and costs more than walking the DOM.
+PUSH_START = 'self.__next_f.push([1,'
+PUSH_END = '"])'
+ROW_PATTERN = re.compile(r'^([0-9a-f]+):', re.MULTILINE)
+
+def iter_chunks(html_content):
+    """
+    Yield the escaped string of every self.__next_f.push([1, "..."]) call
+
+    Args:
+        html_content (str): HTML content of the page
+
+    Yields:
+        str: Chunk text, still JSON-escaped
+    """
+    pos = html_content.find(PUSH_START)
+    while pos != -1:
+        start = pos + len(PUSH_START)
+        while start < len(html_content) and html_content[start].isspace():
+            start += 1
+        if not html_content.startswith('"', start):
+            pos = html_content.find(PUSH_START, start)
+            continue
+        end = html_content.find(PUSH_END, start + 1)
+        # A quote preceded by an odd number of backslashes is part of the string
+        while end != -1 and (end - start - 1 - len(html_content[start + 1:end].rstrip("\\"))) % 2:
+            end = html_content.find(PUSH_END, end + 1)
+        if end == -1:
+            return
+        yield html_content[start + 1:end]
+        pos = html_content.find(PUSH_START, end)
+
+def decode_payload(html_content):
+    """
+    Decode the Next.js flight payload embedded in a page
+
+    Args:
+        html_content (str): HTML content of the page
+
+    Returns:
+        str: Decoded payload text or None if the page has no payload
+    """
+    chunks = list(iter_chunks(html_content))
+    if not chunks:
+        return None
+    return "".join(json.loads(f'"{chunk}"') for chunk in chunks)
+
+def _row_at(payload, start):
+    """
+    Return the raw JSON text of the row whose "<id>:" header starts at `start`, and where it ends
+    """
+    header = ROW_PATTERN.match(payload, start)
+    following = ROW_PATTERN.search(payload, header.end())
+    end = following.start() if following else len(payload)
+    return payload[header.end():end].rstrip("\n"), end
+
+def find_row(payload, row_id):
+    """
+    Find one row of a flight payload without splitting the rest
+
+    Args:
+        payload (str): Decoded payload text
+        row_id (str): Hex id of the row
+
+    Returns:
+        str: Raw JSON text of the row, or None if there is no such row
+    """
+    if payload.startswith(f"{row_id}:"):
+        return _row_at(payload, 0)[0]
+    start = payload.find(f"\n{row_id}:")
+    if start == -1:
+        return None
+    return _row_at(payload, start + 1)[0]
+
+def _resolve(payload, value):
+    """
+    Decode a "$<id>" reference to another row, or return the value unchanged
+    """
+    if isinstance(value, str) and value.startswith("$"):
+        raw = find_row(payload, value[1:])
+        if raw is not None:
+            return json.loads(raw)
+    return value
+
+def _find_player_row(payload):
+    """
+    Find the row holding the player's recent matches ({"playerName", "playerID", "all", ...})
+    """
+    pos = payload.find('"playerName"')
+    while pos != -1:
+        start = payload.rfind("\n", 0, pos) + 1
+        if ROW_PATTERN.match(payload, start):
+            raw, end = _row_at(payload, start)
+            if raw.startswith("{") and '"all"' in raw:
+                try:
+                    data = json.loads(raw)
+                except ValueError:
+                    data = None
+                if isinstance(data, dict) and "all" in data:
+                    return data
+            pos = max(pos + 1, end)
+        else:
+            pos += 1
+        pos = payload.find('"playerName"', pos)
+    return None
+
+def _format_date(match_date):
+    """
+    Convert an epoch-milliseconds matchDate into YYYY-MM-DD
+    """
+    try:
+        return datetime.fromtimestamp(int(match_date) / 1000, IST).strftime('%Y-%m-%d')
+    except (TypeError, ValueError):
+        return match_date
+
+def payload_match_to_entry(match, player_name):
+    """
+    Map one match object from the payload to the match dict format of scrape_player_match_stats
+
+    Args:
+        match (dict): Match object from the payload
+        player_name (str): Name of the player
+
+    Returns:
+        dict: Match entry
+    """
+    line = ScoreParser.parse_cells([
+        f"{match.get('homeTeamName', '')} vs {match.get('awayTeamName', '')}",
+        match.get("battingStats") or "",
+        match.get("bowlingStats") or "",
+        match.get("matchType"),
+        _format_date(match.get("matchDate")),
+        match.get("matchID")
+    ])
+    return ScoreParser.to_match_entry(line, player_name)
+
+def scrape_from_payload(html_content):
+    """
+    Extract player match statistics from the embedded JSON payload
+
+    Args:
+        html_content (str): HTML content of a player's recent matches page
+
+    Returns:
+        tuple: (player_name, matches_list), or None if the page has no usable payload
+    """
+    payload = decode_payload(html_content)
+    if not payload:
+        return None
+
+    player = _find_player_row(payload)
+    if not player:
+        return None
+
+    player_name = player.get("playerName") or "Unknown Player"
+    matches = []
+    for item in _resolve(payload, player["all"]) or []:
+        match = _resolve(payload, item)
+        if isinstance(match, dict):
+            matches.append(payload_match_to_entry(match, player_name))
+    return player_name, matches
@@ -0,0 +1,348 @@
+import csv
+import hashlib
+import io
+import os
+import random
+import re
+import threading
+import time
+from datetime import date, timedelta
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+# Local stand-in for cricket.com so crawls can be benchmarked offline.
+#
+#   python MockServer.py --players 10000 --latency 0.05 --error-rate 0.01
+#   python DemoFinal.py --urls http://127.0.0.1:8765/player_urls.csv --local mock.db --no-sync
+#
+# --no-sync keeps the results in mock.db without touching SQLite Cloud; use a
+# separate file so the synthetic players never reach the real database.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_PLAYERS = 1000
+DEFAULT_ROWS = 10
+
+# Synthetic players get IDs from here up, clear of the real ones in player_urls.csv
+FIRST_PLAYER_ID = 900000
+
+FIRST_NAMES = ["Aarav", "Rohan", "Kabir", "Arjun", "Ishan", "Dev", "Nikhil", "Yash", "Rahul", "Varun",
+               "Liam", "Oliver", "Jack", "Harry", "Noah", "Ethan", "Mason", "Lucas", "Tom", "Sam"]
+LAST_NAMES = ["Sharma", "Patel", "Iyer", "Reddy", "Nair", "Gill", "Rao", "Singh", "Kumar", "Das",
+              "Smith", "Jones", "Taylor", "Brown", "Wilson", "Evans", "Walker", "Wright", "Green", "Hall",
+              "Khan", "Ali", "Ahmed", "Malik", "Shah", "Perera", "Silva", "Fernando", "Mendis", "Dias"]
+
+# Static pages served as checked in
+STATIC_PAGES = {
+    "/players": "Players.html",
+    "/Players.html": "Players.html",
+    "/Index.html": "Index.html",
+    "/cricket_match_data.html": "cricket_match_data.html",
+}
+
+PLAYER_PAGE_PATTERN = re.compile(r'^/players/([a-z0-9-]+)-(\d+)(?:/recent)?/?$')
+
+# Markers substituted into the row templates taken from cricket_match_data.html
+BATTING_MARK = "@@BATTING@@"
+BOWLING_MARK = "@@BOWLING@@"
+DATE_MARK = "@@DATE@@"
+MATCH_ID_MARK = "@@MATCH_ID@@"
+
+def _read(name):
+    with open(os.path.join(HERE, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+def _slug(name):
+    return name.lower().replace(' ', '-')
+
+def _row_templates(fragment):
+    """
+    Split the match table fragment into the text before the rows, one template
+    per row with markers for the stats, and the text after the rows
+    """
+    body_start = fragment.index('<tbody')
+    body_start = fragment.index('>', body_start) + 1
+    body_end = fragment.index('</tbody>')
+    rows = re.findall(r'<tr\b.*?</tr>', fragment[body_start:body_end], flags=re.DOTALL)
+
+    templates = []
+    for row in rows:
+        cells = re.split(r'(?=<td\b)', row)
+        # cells[0] is the <tr> tag, then opposition, batting, bowling, format, date
+        cells[1] = re.sub(r'(href="[^"]*-)\d+"', rf'\g<1>{MATCH_ID_MARK}"', cells[1], count=1)
+        cells[2] = re.sub(r'(<p[^>]*>)\s*[^<]*?\s*(</p>)', rf'\g<1>{BATTING_MARK}\g<2>', cells[2], count=1)
+        cells[3] = re.sub(r'(<p[^>]*>)\s*[^<]*?\s*(</p>)', rf'\g<1>{BOWLING_MARK}\g<2>', cells[3], count=1)
+        cells[5] = re.sub(r'\d{1,2}-[A-Za-z]{3}-\d{4}', DATE_MARK, cells[5], count=1)
+        templates.append(''.join(cells))
+    return fragment[:body_start], templates, fragment[body_end:]
+
+class SyntheticSite:
+    """
+    Deterministic fake player pages. The same seed and player ID always
+    produce the same page, so runs are reproducible.
+    """
+
+    def __init__(self, players=DEFAULT_PLAYERS, rows=DEFAULT_ROWS, template="table", seed=0):
+        """
+        Args:
+            players (int): Number of players in the synthetic listing
+            rows (int): Number of matches on each player page
+            template (str): "table" for the bare match table (HTML parsing path) or
+                "index" for a copy of Index.html (embedded JSON payload path)
+            seed (int): Seed for the generated stats
+        """
+        if template not in ("table", "index"):
+            raise Exception(f"Unknown page template: {template}")
+        self.players = players
+        self.rows = rows
+        self.template = template
+        self.seed = seed
+        self.head, self.row_templates, self.tail = _row_templates(_read("cricket_match_data.html"))
+        self.index_page = _read("Index.html") if template == "index" else None
+        self.page = lru_cache(maxsize=4096)(self._page)
+
+    def player(self, n):
+        """
+        Name, ID and URL slug of the n-th synthetic player
+        """
+        first = FIRST_NAMES[n % len(FIRST_NAMES)]
+        last = LAST_NAMES[(n // len(FIRST_NAMES)) % len(LAST_NAMES)]
+        name = f"{first} {last}"
+        player_id = FIRST_PLAYER_ID + n
+        return name, player_id, f"{_slug(name)}-{player_id}"
+
+    def iter_players(self):
+        for n in range(self.players):
+            yield self.player(n)
+
+    def name_for(self, slug, player_id):
+        n = player_id - FIRST_PLAYER_ID
+        if 0 <= n < self.players:
+            return self.player(n)[0]
+        return ' '.join(word.capitalize() for word in slug.split('-'))
+
+    def etag(self, player_id):
+        key = f"{self.seed}:{self.template}:{self.rows}:{player_id}"
+        return '"' + hashlib.sha1(key.encode('utf-8')).hexdigest()[:16] + '"'
+
+    def _match_rows(self, player_id):
+        rng = random.Random(self.seed * 1000003 + player_id)
+        day = date(2025, 4, 1) - timedelta(days=rng.randint(0, 30))
+        rows = []
+        for n in range(self.rows):
+            template = self.row_templates[n % len(self.row_templates)]
+            if rng.random() < 0.8:
+                runs = int(rng.expovariate(1 / 30))
+                balls = max(runs + rng.randint(-runs // 3, runs // 2 + 5), 1)
+                batting = f"{runs}{'*' if rng.random() < 0.15 else ''}({balls})"
+            else:
+                batting = "DNB"
+            if rng.random() < 0.4:
+                bowling = f"{rng.choice([0, 0, 1, 1, 2, 3, 4, 5])}/{rng.randint(10, 60)}"
+            else:
+                bowling = "DNB"
+            rows.append(template
+                        .replace(BATTING_MARK, batting)
+                        .replace(BOWLING_MARK, bowling)
+                        .replace(DATE_MARK, day.strftime("%d-%b-%Y"))
+                        .replace(MATCH_ID_MARK, str(rng.randint(200000, 299999))))
+            day -= timedelta(days=rng.randint(2, 20))
+        return rows
+
+    def _page(self, slug, player_id):
+        name = self.name_for(slug, player_id)
+        if self.index_page is not None:
+            return self.index_page.replace("Virat Kohli", name)
+        return (
+            "<!DOCTYPE html><html><head>"
+            f"<title>{name} Recent Matches Stats - Cricket.com</title>"
+            f'<meta property="og:url" content="https://www.cricket.com/players/{slug}-{player_id}/recent"/>'
+            "</head><body>"
+            + self.head + ''.join(self._match_rows(player_id)) + self.tail
+            + "</body></html>"
+        )
+
+    def listing_page(self):
+        """
+        Player listing in both shapes the discovery scripts read: ds-grow divs
+        (ScrapeData) and an escaped flight payload (Demo01)
+        """
+        divs = []
+        payload = []
+        for name, player_id, slug in self.iter_players():
+            divs.append(f'<div class="ds-grow"><a href="/players/{slug}">{name}</a></div>')
+            payload.append(f'{{\\"href\\":\\"/players/{slug}\\",\\"title\\":\\"{name}\\"}}')
+        return (
+            "<!DOCTYPE html><html><head><title>Players - Cricket.com</title></head><body>"
+            + ''.join(divs)
+            + '<script>self.__next_f.push([1,"[' + ','.join(payload) + ']"])</script>'
+            + "</body></html>"
+        )
+
+    def url_csv(self, base_url):
+        """
+        player_urls.csv for the synthetic players, pointing at this server
+        """
+        out = io.StringIO()
+        writer = csv.writer(out)
+        writer.writerow(['Name', 'ID', 'URL'])
+        for name, player_id, slug in self.iter_players():
+            writer.writerow([name, player_id, f"{base_url}/players/{slug}/recent"])
+        return out.getvalue()
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status, body=b"", content_type="text/html; charset=utf-8", headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.do_GET()
+
+    def do_GET(self):
+        server = self.server
+        server.count("requests")
+        if server.latency or server.jitter:
+            time.sleep(server.latency + random.uniform(0, server.jitter))
+
+        path = urlsplit(self.path).path
+        if path in STATIC_PAGES:
+            self._send(200, server.static(STATIC_PAGES[path]))
+            return
+        if path == "/players/all":
+            self._send(200, server.listing)
+            return
+        if path == "/player_urls.csv":
+            self._send(200, server.site.url_csv(server.base_url).encode('utf-8'), content_type="text/csv; charset=utf-8")
+            return
+
+        match = PLAYER_PAGE_PATTERN.match(path)
+        if not match:
+            self._send(404, b"Not Found", content_type="text/plain")
+            return
+        # Only player pages fail, so the URL list itself always loads
+        if server.error_rate and random.random() < server.error_rate:
+            server.count("errors")
+            self._send(server.error_status, b"Service Unavailable",
+                       content_type="text/plain", headers={"Retry-After": str(server.retry_after)})
+            return
+        slug, player_id = match.group(1), int(match.group(2))
+        etag = server.site.etag(player_id)
+        if self.headers.get("If-None-Match") == etag:
+            server.count("not_modified")
+            self._send(304, headers={"ETag": etag})
+            return
+        server.count("pages")
+        self._send(200, server.site.page(slug, player_id).encode('utf-8'), headers={"ETag": etag})
+
+class MockServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, site, host=DEFAULT_HOST, port=DEFAULT_PORT, latency=0.0, jitter=0.0,
+                 error_rate=0.0, error_status=503, retry_after=1, verbose=False):
+        """
+        Args:
+            site (SyntheticSite): Generator for the player pages
+            host (str): Interface to listen on
+            port (int): Port to listen on (0 picks a free one)
+            latency (float): Seconds added to every response
+            jitter (float): Extra random delay of up to this many seconds
+            error_rate (float): Fraction of requests answered with error_status
+            error_status (int): Status for injected errors (e.g. 503 or 429)
+            retry_after (int): Retry-After seconds sent with injected errors
+            verbose (bool): Log every request
+        """
+        super().__init__((host, port), MockHandler)
+        self.site = site
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self.verbose = verbose
+        self.base_url = f"http://{host}:{self.server_address[1]}"
+        self.listing = site.listing_page().encode('utf-8')
+        self.counters = {"requests": 0, "pages": 0, "not_modified": 0, "errors": 0}
+        self._static = {}
+        self._lock = threading.Lock()
+
+    def count(self, key):
+        with self._lock:
+            self.counters[key] += 1
+
+    def static(self, name):
+        if name not in self._static:
+            self._static[name] = _read(name).encode('utf-8')
+        return self._static[name]
+
+def serve_in_thread(**kwargs):
+    """
+    Start a mock server on a background thread, e.g. from a benchmark script
+
+    Args:
+        **kwargs: SyntheticSite options (players, rows, template, seed) and
+            MockServer options (host, port, latency, jitter, error_rate, ...)
+
+    Returns:
+        MockServer: The running server; call shutdown() when done. Its base_url
+            is the address to crawl.
+    """
+    site_options = {key: kwargs.pop(key) for key in ("players", "rows", "template", "seed") if key in kwargs}
+    kwargs.setdefault("port", 0)
+    server = MockServer(SyntheticSite(**site_options), **kwargs)
+    thread = threading.Thread(target=server.serve_forever, name="mock-server", daemon=True)
+    thread.start()
+    return server
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve a local mock of cricket.com for offline crawl benchmarks")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--players", type=int, default=DEFAULT_PLAYERS, help="number of synthetic players")
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS, help="matches on each player page")
+    parser.add_argument("--template", choices=["table", "index"], default="table",
+                        help="serve bare match tables or copies of Index.html with the JSON payload")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the generated stats")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random delay of up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests that fail")
+    parser.add_argument("--error-status", type=int, default=503, help="HTTP status of injected failures")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with failures")
+    parser.add_argument("--write-urls", help="also write the synthetic player URL list to this CSV file")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args()
+
+    site = SyntheticSite(players=args.players, rows=args.rows, template=args.template, seed=args.seed)
+    server = MockServer(site, host=args.host, port=args.port, latency=args.latency, jitter=args.jitter,
+                        error_rate=args.error_rate, error_status=args.error_status,
+                        retry_after=args.retry_after, verbose=args.verbose)
+    if args.write_urls:
+        with open(args.write_urls, 'w', newline='', encoding='utf-8') as f:
+            f.write(site.url_csv(server.base_url))
+        print(f"Wrote {args.players} player URLs to {args.write_urls}")
+
+    print(f"Serving {args.players} synthetic players at {server.base_url}")
+    print(f"  player list: {server.base_url}/player_urls.csv")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Served: {server.counters}")
@@ -0,0 +1,91 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import DemoFinal
+import HtmlArchive
+import ParserBackends
+
+# Order of the fields in a compact match record
+MATCH_FIELDS = ("opponent", "format", "date", "runs", "balls_faced", "not_out", "wickets", "runs_conceded", "match_id")
+
+# Pages sent to a worker per round trip; larger chunks mean fewer IPC messages
+DEFAULT_CHUNKSIZE = 32
+
+def _load_item(item):
+    """
+    Turn a parse input into HTML text
+
+    Args:
+        item: HTML content as str or bytes, or the path of an archived page
+    """
+    if isinstance(item, bytes):
+        return item.decode('utf-8')
+    if isinstance(item, str) and item.endswith(tuple(HtmlArchive.CODEC_SUFFIXES.values())) and os.path.exists(item):
+        return HtmlArchive.load_path(item)
+    return item
+
+def _parse_item(args):
+    """
+    Parse one page in a worker process and return a compact record
+
+    Returns:
+        tuple: (player_name, rows, error) where rows is a tuple of match tuples
+            ordered as MATCH_FIELDS, and error is None or an error message
+    """
+    item, backend = args
+    try:
+        player_name, matches = DemoFinal.scrape_player_match_stats(_load_item(item), backend)
+        rows = tuple(tuple(match.get(field) for field in MATCH_FIELDS) for match in matches)
+        return player_name, rows, None
+    except Exception as e:
+        return None, (), str(e)
+
+def record_to_matches(player_name, rows):
+    """
+    Expand a compact record back into the match dicts scrape_player_match_stats returns
+
+    Args:
+        player_name (str): Player name from the record
+        rows (tuple): Match tuples ordered as MATCH_FIELDS
+
+    Returns:
+        list: List of match dictionaries
+    """
+    matches = []
+    for row in rows:
+        match_entry = {"player_name": player_name}
+        for field, value in zip(MATCH_FIELDS, row):
+            if value is not None:
+                match_entry[field] = value
+        matches.append(match_entry)
+    return matches
+
+def parse_pages(items, workers=None, chunksize=DEFAULT_CHUNKSIZE, backend=ParserBackends.DEFAULT_BACKEND):
+    """
+    Parse many pages across all CPU cores
+
+    Args:
+        items (iterable): HTML content as str or bytes, or paths of archived pages
+        workers (int): Number of worker processes (defaults to the CPU count)
+        chunksize (int): Number of pages dispatched to a worker at a time
+        backend (str): HTML parser backend (see ParserBackends.make_soup)
+
+    Yields:
+        tuple: (player_name, rows, error) for each item, in input order
+    """
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        for record in executor.map(_parse_item, ((item, backend) for item in items), chunksize=chunksize):
+            yield record
+
+def parse_archive(workers=None, chunksize=DEFAULT_CHUNKSIZE, backend=ParserBackends.DEFAULT_BACKEND):
+    """
+    Parse the latest archived copy of every URL across all CPU cores
+
+    Yields:
+        tuple: (url, player_name, rows, error)
+    """
+    entries = list(HtmlArchive.iter_latest_entries())
+    paths = [HtmlArchive.object_path(digest, codec) for url, fetched_at, digest, codec in entries]
+    records = parse_pages(paths, workers=workers, chunksize=chunksize, backend=backend)
+    for entry, (player_name, rows, error) in zip(entries, records):
+        yield (entry[0], player_name, rows, error)
@@ -0,0 +1,382 @@
+# Columnar snapshots of the stats, credit and players tables for analytics.
+#
+#   python ParquetExport.py                 # export what changed in SQLite Cloud
+#   python ParquetExport.py --db local.db   # export from a local SQLite file
+#   python ParquetExport.py --full          # rebuild every table from scratch
+#
+# Then, for example:
+#   arrays = ParquetExport.read_numpy("stats", ["runs_scored", "balls_faced"], formats=["T20s"])
+
+import json
+import os
+import queue
+import shutil
+import threading
+import time
+from urllib.parse import quote
+
+# pip install pyarrow
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+# Root of the Parquet files (override with the PARQUET_DIR environment variable)
+EXPORT_DIR = os.environ.get("PARQUET_DIR", "parquet")
+STATE_FILE = "_export_state.json"  # High-water marks; the leading _ keeps it out of datasets
+
+DEFAULT_BATCH_SIZE = 50000  # Rows per fetch and per record batch
+
+# Marks the end of the batches handed to the writer thread
+_DONE = object()
+
+# Directory name pyarrow gives a null partition value
+HIVE_NULL = "__HIVE_DEFAULT_PARTITION__"
+
+# table -> (partition columns, mode):
+#   "append":  rows are only ever inserted; rows past the last exported rowid are appended
+#   "changed": rows are upserted and deleted in place; partitions whose row count or
+#              newest updated_at moved since the last export are rewritten
+#   "full":    small tables, rewritten whole
+EXPORTS = {
+    "stats": (("format", "month"), "changed"),
+    "player_points": ((), "full"),  # Upserted per match, so appending by rowid would miss updates
+    "player_average_points": ((), "full"),
+    "total_credits": ((), "full"),
+    "players": ((), "full"),
+}
+
+# Above this many changed partitions a "changed" table is rewritten whole
+MAX_CHANGED_PARTITIONS = 200
+
+# Derived columns added on export
+DERIVED_COLUMNS = {
+    "month": ("substr(date, 1, 7)", "TEXT"),  # Dates are stored as YYYY-MM-DD
+}
+
+_ARROW_TYPES = {
+    "INTEGER": pa.int64(),
+    "INT": pa.int64(),
+    "REAL": pa.float64(),
+    "TEXT": pa.string(),
+}
+
+def _arrow_type(declared):
+    return _ARROW_TYPES.get((declared or "").upper(), pa.string())
+
+def _table_exists(cursor, table):
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+    return cursor.fetchone() is not None
+
+def _table_columns(cursor, table):
+    cursor.execute(f"PRAGMA table_info({table})")
+    return [(row[1], row[2]) for row in cursor.fetchall()]
+
+def load_state(export_dir=None):
+    path = os.path.join(export_dir or EXPORT_DIR, STATE_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_state(state, export_dir=None):
+    path = os.path.join(export_dir or EXPORT_DIR, STATE_FILE)
+    tmp = path + ".tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp, path)
+
+def _iter_batches(cursor, schema, batch_size):
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        columns = list(zip(*rows))
+        # rowid is the last selected column; it drives the high-water mark, not the file
+        yield max(columns[-1]), pa.RecordBatch.from_arrays(
+            [pa.array(values, type=field.type) for values, field in zip(columns, schema)], schema=schema
+        )
+
+def _move_files(src, dst):
+    for root, _, files in os.walk(src):
+        target = os.path.join(dst, os.path.relpath(root, src))
+        os.makedirs(target, exist_ok=True)
+        for name in files:
+            os.replace(os.path.join(root, name), os.path.join(target, name))
+
+def _partition_dir(partition_columns, values):
+    # Same layout as pyarrow's hive partitioning: URI-encoded values, nulls under HIVE_NULL
+    return os.path.join(*(f"{name}={quote(str(value), safe='') if value is not None else HIVE_NULL}"
+                          for name, value in zip(partition_columns, values)))
+
+def _partition_versions(cursor, table, expressions):
+    """
+    Row count and newest updated_at of every partition, keyed on the JSON
+    list of partition values so the result can go straight into the state file
+    """
+    keys = ", ".join(expressions)
+    cursor.execute(f"SELECT {keys}, COUNT(*), MAX(updated_at) FROM {table} GROUP BY {keys}")
+    width = len(expressions)
+    return {json.dumps(list(row[:width])): list(row[width:]) for row in cursor.fetchall()}
+
+def _write_staging(cursor, table, schema, staging, partition_columns, batch_size, basename):
+    """
+    Write the rows of an executed SELECT to a staging directory
+
+    Returns:
+        tuple: (rows written, highest rowid seen)
+    """
+    shutil.rmtree(staging, ignore_errors=True)
+
+    # pyarrow consumes the batches on its own threads, but a cursor belongs to
+    # this one: fetch here and hand the batches over through a small queue
+    feed = queue.Queue(maxsize=2)
+    errors = []
+    def write():
+        try:
+            ds.write_dataset(
+                iter(feed.get, _DONE), staging, schema=schema, format="parquet",
+                partitioning=list(partition_columns) or None,
+                partitioning_flavor="hive" if partition_columns else None,
+                basename_template=basename,
+                max_rows_per_group=batch_size,
+            )
+        except Exception as e:
+            errors.append(e)
+    writer = threading.Thread(target=write, name=f"parquet-{table}")
+    writer.start()
+
+    def put(item):
+        # Give up if the writer has failed and stopped reading
+        while writer.is_alive():
+            try:
+                feed.put(item, timeout=1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    high_water = 0
+    written = 0
+    try:
+        for max_rowid, batch in _iter_batches(cursor, schema, batch_size):
+            high_water = max(high_water, max_rowid)
+            written += batch.num_rows
+            if not put(batch):
+                break
+    finally:
+        put(_DONE)
+        writer.join()
+    if errors:
+        raise errors[0]
+    return written, high_water
+
+def export_table(cursor, table, export_dir=None, full=False, state=None, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Export one table to Parquet. Files are written to a staging directory
+    and moved into place before the state file is updated, so an
+    interrupted export is simply repeated next time.
+
+    Args:
+        cursor: Database cursor (SQLite or SQLite Cloud)
+        table (str): Table name from EXPORTS
+        export_dir (str): Root of the Parquet files
+        full (bool): Rewrite the table instead of only what changed
+        state (dict): Export state (high-water marks, partition versions), updated in place
+        batch_size (int): Rows per fetch
+
+    Returns:
+        int: Number of rows written
+    """
+    export_dir = export_dir or EXPORT_DIR
+    state = state if state is not None else {}
+    partition_columns, mode = EXPORTS[table]
+    if not _table_exists(cursor, table):
+        print(f"Skipping {table}: no such table")
+        return 0
+
+    columns = _table_columns(cursor, table)
+    names = {name for name, _ in columns}
+    derived = [(name, expr, declared) for name, (expr, declared) in DERIVED_COLUMNS.items()
+               if name in partition_columns and name not in names]
+    fields = [pa.field(name, _arrow_type(declared)) for name, declared in columns]
+    fields += [pa.field(name, _arrow_type(declared)) for name, _, declared in derived]
+    schema = pa.schema(fields)
+    select = [name for name, _ in columns] + [f"{expr} AS {name}" for name, expr, _ in derived] + ["rowid"]
+    select = f"SELECT {', '.join(select)} FROM {table}"
+
+    table_dir = os.path.join(export_dir, table)
+    staging = os.path.join(export_dir, "_staging", table)
+    basename = f"part-{time.strftime('%Y%m%d%H%M%S')}-{{i}}.parquet"
+
+    if mode == "append" and not full:
+        last_rowid = state.get(table, 0)
+        cursor.execute(f"{select} WHERE rowid > ? ORDER BY rowid", (last_rowid,))
+        # A unique name per run, so appended files never replace earlier ones
+        written, high_water = _write_staging(cursor, table, schema, staging, partition_columns, batch_size,
+                                             f"part-{time.strftime('%Y%m%d%H%M%S')}-{last_rowid}-{{i}}.parquet")
+        if written:
+            os.makedirs(table_dir, exist_ok=True)
+            _move_files(staging, table_dir)
+            state[table] = high_water
+            save_state(state, export_dir)
+        shutil.rmtree(staging, ignore_errors=True)
+        return written
+
+    if mode == "changed" and "updated_at" not in names:
+        print(f"{table} has no updated_at column, rewriting it whole")
+        mode = "full"
+    if mode == "changed":
+        expressions = [DERIVED_COLUMNS[name][0] if name not in names else name for name in partition_columns]
+        # Versions are read before the rows, so a write that lands in between is picked up next time
+        versions = _partition_versions(cursor, table, expressions)
+        previous = state.get(table) if isinstance(state.get(table), dict) else None
+        if previous is not None and not full:
+            previous = previous.get("partitions", {})
+            changed = [key for key, version in versions.items() if previous.get(key) != version]
+            removed = [key for key in previous if key not in versions]
+            if not changed and not removed:
+                return 0
+            if len(changed) <= MAX_CHANGED_PARTITIONS:
+                written = 0
+                if changed:
+                    condition = " OR ".join("(" + " AND ".join(f"{expr} IS ?" for expr in expressions) + ")"
+                                            for _ in changed)
+                    params = [value for key in changed for value in json.loads(key)]
+                    cursor.execute(f"{select} WHERE {condition} ORDER BY rowid", params)
+                    written, _ = _write_staging(cursor, table, schema, staging, partition_columns, batch_size,
+                                                basename)
+                for key in changed + removed:
+                    shutil.rmtree(os.path.join(table_dir, _partition_dir(partition_columns, json.loads(key))),
+                                  ignore_errors=True)
+                os.makedirs(table_dir, exist_ok=True)
+                _move_files(staging, table_dir)
+                shutil.rmtree(staging, ignore_errors=True)
+                state[table] = {"partitions": versions}
+                save_state(state, export_dir)
+                return written
+
+    cursor.execute(f"{select} ORDER BY rowid")
+    written, high_water = _write_staging(cursor, table, schema, staging, partition_columns, batch_size, basename)
+    shutil.rmtree(table_dir, ignore_errors=True)
+    os.makedirs(table_dir, exist_ok=True)
+    _move_files(staging, table_dir)
+    shutil.rmtree(staging, ignore_errors=True)
+    if mode == "append":
+        state[table] = high_water
+    elif mode == "changed":
+        state[table] = {"partitions": versions}
+    else:
+        state[table] = 0
+    save_state(state, export_dir)
+    return written
+
+def export_all(conn, export_dir=None, full=False, tables=None, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Export the stats and credit tables
+
+    Args:
+        conn: SQLite or SQLite Cloud connection
+        export_dir (str): Root of the Parquet files
+        full (bool): Rebuild every table instead of only what changed
+        tables (iterable): Tables to export (default: all of EXPORTS)
+        batch_size (int): Rows per fetch
+
+    Returns:
+        dict: table -> rows written
+    """
+    export_dir = export_dir or EXPORT_DIR
+    os.makedirs(export_dir, exist_ok=True)
+    state = load_state(export_dir)
+    cursor = conn.cursor()
+    return {table: export_table(cursor, table, export_dir, full, state, batch_size) for table in (tables or EXPORTS)}
+
+def dataset(table, export_dir=None):
+    """
+    Open an exported table as a pyarrow dataset (lazy; nothing is read yet)
+
+    Args:
+        table (str): Table name from EXPORTS
+        export_dir (str): Root of the Parquet files
+
+    Returns:
+        pyarrow.dataset.Dataset
+    """
+    partition_columns, _ = EXPORTS[table]
+    partitioning = None
+    if partition_columns:
+        partitioning = ds.partitioning(pa.schema([(name, pa.string()) for name in partition_columns]), flavor="hive")
+    return ds.dataset(os.path.join(export_dir or EXPORT_DIR, table), format="parquet", partitioning=partitioning)
+
+def read_table(table, columns=None, formats=None, months=None, export_dir=None):
+    """
+    Load an exported table, reading only the requested columns and, for
+    stats, only the partitions of the requested formats and months
+
+    Args:
+        table (str): Table name from EXPORTS
+        columns (list): Columns to load (default: all)
+        formats (list): Match formats to keep, e.g. ["T20s"]
+        months (list): Months to keep, e.g. ["2025-01", "2025-02"]
+        export_dir (str): Root of the Parquet files
+
+    Returns:
+        pyarrow.Table
+    """
+    condition = None
+    for name, values in (("format", formats), ("month", months)):
+        if values:
+            expr = ds.field(name).isin(list(values))
+            condition = expr if condition is None else condition & expr
+    return dataset(table, export_dir).to_table(columns=columns, filter=condition)
+
+def read_numpy(table, columns, formats=None, months=None, export_dir=None):
+    """
+    Load columns of an exported table as NumPy arrays. A numeric column
+    without nulls that arrives as one chunk is a view on the Arrow buffer
+    rather than a copy.
+
+    Args:
+        table (str): Table name from EXPORTS
+        columns (list): Columns to load
+        formats (list): Match formats to keep
+        months (list): Months to keep
+        export_dir (str): Root of the Parquet files
+
+    Returns:
+        dict: column -> numpy.ndarray
+    """
+    data = read_table(table, columns, formats, months, export_dir)
+    arrays = {}
+    for name in columns:
+        column = data.column(name)
+        if column.num_chunks != 1:
+            column = column.combine_chunks()
+        else:
+            column = column.chunk(0)
+        arrays[name] = column.to_numpy(zero_copy_only=False)
+    return arrays
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Export the stats and credit tables to partitioned Parquet")
+    parser.add_argument("--db", help="local SQLite file to export instead of SQLite Cloud")
+    parser.add_argument("--dir", help=f"output directory (default {EXPORT_DIR})")
+    parser.add_argument("--full", action="store_true", help="rebuild every table instead of only what changed")
+    parser.add_argument("--tables", nargs="+", choices=sorted(EXPORTS), help="tables to export (default: all)")
+    args = parser.parse_args()
+
+    if args.db:
+        import sqlite3
+        conn = sqlite3.connect(args.db)
+        release = conn.close
+    else:
+        import DbPool
+        pool = DbPool.get_pool()
+        conn = pool.acquire()
+        release = lambda: pool.release(conn)
+    try:
+        start = time.perf_counter()
+        counts = export_all(conn, args.dir, args.full, args.tables)
+        print(f"Exported {counts} in {time.perf_counter() - start:.1f}s")
+    finally:
+        release()
@@ -0,0 +1,234 @@
+from bs4 import BeautifulSoup, SoupStrainer
+
+# Optional fast parsers; the backends that need them are skipped when missing
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# "auto" picks the fastest backend that is installed
+DEFAULT_BACKEND = "auto"
+
+# Elements that extract_player_name looks at; the table is read separately
+STRAINER_TAGS = ["title", "h1", "meta", "table"]
+SELECTOLAX_NAME_SELECTOR = 'title, h1, meta[property="og:url"], .player-name'
+LXML_NAME_XPATH = (
+    "//title | //h1 | //meta[@property='og:url']"
+    " | //*[contains(concat(' ', normalize-space(@class), ' '), ' player-name ')]"
+)
+
+def _lxml_class(tag, name):
+    return f".//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {name} ')]"
+
+def available_backends():
+    """
+    List the parser backends that can be used in this environment
+
+    Returns:
+        list: Backend names, fastest first
+    """
+    backends = []
+    if LexborHTMLParser is not None:
+        backends.append("selectolax")
+    if lxml is not None:
+        backends.append("lxml")
+    backends.extend(["strainer", "html.parser"])
+    return backends
+
+def _top_level(nodes, parent_of, key=lambda node: node):
+    """
+    Drop the nodes nested inside another selected node
+    """
+    selected = {key(node) for node in nodes}
+    kept = []
+    for node in nodes:
+        parent = parent_of(node)
+        while parent is not None and key(parent) not in selected:
+            parent = parent_of(parent)
+        if parent is None:
+            kept.append(node)
+    return kept
+
+def _name_soup(fragments):
+    """
+    Small BeautifulSoup document of the name elements, for extract_player_name.
+    These are a handful of short tags; the match table is never reparsed.
+    """
+    return BeautifulSoup("".join(fragments), 'html.parser')
+
+def soup_rows(tbody):
+    """
+    Read the match rows of a BeautifulSoup table body
+
+    Args:
+        tbody (BeautifulSoup): The tbody of the matches table
+
+    Returns:
+        list: One entry per <tr>: [opposition, batting, bowling, format, date, match href],
+            None for rows without enough cells or a match link, or the exception
+            raised reading a malformed row
+    """
+    rows = []
+    for row in tbody.find_all('tr'):
+        cells = row.find_all('td')
+        if len(cells) < 5:
+            rows.append(None)
+            continue
+        match_link = cells[0].find('a')
+        if not match_link:
+            rows.append(None)
+            continue
+        try:
+            values = [match_link.get_text(strip=True)]
+            for cell in cells[1:3]:
+                # Batting and bowling figures sit in a flex container when the row has extras
+                container = cell.find('div', class_='flex') or cell
+                values.append(container.find('p').get_text(strip=True))
+            values.append(cells[3].find('p').get_text(strip=True))
+            values.append(cells[4].find('p').get_text(strip=True))
+            values.append(match_link.get('href'))
+            rows.append(values)
+        except Exception as e:
+            rows.append(e)
+    return rows
+
+def _selectolax_rows(tbody):
+    def text(node):
+        if node is None:
+            raise AttributeError("'NoneType' object has no attribute 'get_text'")
+        return node.text(deep=True, separator='', strip=True)
+
+    rows = []
+    for row in tbody.css('tr'):
+        cells = row.css('td')
+        if len(cells) < 5:
+            rows.append(None)
+            continue
+        match_link = cells[0].css_first('a')
+        if match_link is None:
+            rows.append(None)
+            continue
+        try:
+            values = [text(match_link)]
+            for cell in cells[1:3]:
+                container = cell.css_first('div.flex')
+                values.append(text((container if container is not None else cell).css_first('p')))
+            values.append(text(cells[3].css_first('p')))
+            values.append(text(cells[4].css_first('p')))
+            values.append(match_link.attributes.get('href'))
+            rows.append(values)
+        except Exception as e:
+            rows.append(e)
+    return rows
+
+def _lxml_rows(tbody):
+    def text(node):
+        if node is None:
+            raise AttributeError("'NoneType' object has no attribute 'get_text'")
+        # Same as BeautifulSoup's get_text(strip=True): comments are left out
+        return "".join(part.strip() for part in node.xpath(".//text()"))
+
+    def first(node, path):
+        found = node.xpath(path)
+        return found[0] if found else None
+
+    rows = []
+    for row in tbody.iter('tr'):
+        cells = list(row.iter('td'))
+        if len(cells) < 5:
+            rows.append(None)
+            continue
+        match_link = first(cells[0], ".//a")
+        if match_link is None:
+            rows.append(None)
+            continue
+        try:
+            values = [text(match_link)]
+            for cell in cells[1:3]:
+                container = first(cell, _lxml_class("div", "flex"))
+                values.append(text(first(container if container is not None else cell, ".//p")))
+            values.append(text(first(cells[3], ".//p")))
+            values.append(text(first(cells[4], ".//p")))
+            values.append(match_link.get('href'))
+            rows.append(values)
+        except Exception as e:
+            rows.append(e)
+    return rows
+
+def _read_selectolax(html_content):
+    # Lexbor adds implied <tbody> elements that html.parser would not
+    if "<tbody" not in html_content.lower():
+        return None
+    tree = LexborHTMLParser(html_content)
+    table = tree.css_first('table.w-full')
+    tbody = table.css_first('tbody') if table is not None else None
+    if tbody is None:
+        return None
+    names = _top_level(tree.css(SELECTOLAX_NAME_SELECTOR), lambda node: node.parent, key=lambda node: node.mem_id)
+    return _name_soup(node.html for node in names), _selectolax_rows(tbody)
+
+def _read_lxml(html_content):
+    tree = lxml.html.fromstring(html_content)
+    tables = tree.xpath(_lxml_class("table", "w-full"))
+    tbody = tables[0].find('.//tbody') if tables else None
+    if tbody is None:
+        return None
+    names = _top_level(tree.xpath(LXML_NAME_XPATH), lambda node: node.getparent())
+    return (_name_soup(lxml.html.tostring(node, encoding='unicode', with_tail=False) for node in names),
+            _lxml_rows(tbody))
+
+def read_match_rows(html_content, backend=DEFAULT_BACKEND):
+    """
+    Read the match table straight from the parse tree of a fast backend,
+    without building a BeautifulSoup tree of the page
+
+    Args:
+        html_content (str): HTML content of the player page
+        backend (str): "auto", "selectolax", "lxml", "strainer" or "html.parser"
+
+    Returns:
+        tuple: (soup of the name elements for extract_player_name, rows as from soup_rows),
+            or None when the backend has no native reader or the page needs the
+            fallbacks of find_matches_table; use make_soup then
+    """
+    if backend == "auto":
+        backend = available_backends()[0]
+    if backend in ("selectolax", "lxml") and backend not in available_backends():
+        raise ValueError(f"Parser backend '{backend}' is not available")
+    if backend == "selectolax":
+        return _read_selectolax(html_content)
+    if backend == "lxml":
+        return _read_lxml(html_content)
+    return None
+
+def make_soup(html_content, backend=DEFAULT_BACKEND):
+    """
+    Parse a player page with the selected backend
+
+    Args:
+        html_content (str): HTML content of the player page
+        backend (str): "auto", "selectolax", "lxml", "strainer" or "html.parser".
+            Every backend gives the same results from extract_player_name and
+            find_matches_table. selectolax and lxml are read with
+            read_match_rows; here they get the full tree, which is only
+            needed when that returns None.
+
+    Returns:
+        BeautifulSoup: Parsed HTML content
+    """
+    if backend == "auto":
+        backend = available_backends()[0]
+    if backend not in available_backends():
+        raise ValueError(f"Parser backend '{backend}' is not available")
+    if backend == "strainer" and "player-name" not in html_content:
+        # The strainer only filters by tag name, so it cannot keep .player-name elements
+        soup = BeautifulSoup(html_content, 'html.parser', parse_only=SoupStrainer(STRAINER_TAGS))
+        # The "All Matches" heading fallback in find_matches_table needs the full tree
+        if soup.find('table', class_='w-full') is not None:
+            return soup
+    return BeautifulSoup(html_content, 'html.parser')
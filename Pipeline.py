@@ -0,0 +1,207 @@
+import queue
+import threading
+
+import CrawlState
+import DbPool
+import DemoFinal
+import Schema
+import Storage
+import UltimateDatabase
+
+# Marks the end of a stage's output
+_DONE = object()
+
+DEFAULT_BUFFER = 32
+DEFAULT_FETCH_WORKERS = 4
+DEFAULT_COMMIT_EVERY = 50
+
+def _run_stage(in_queue, out_queue, work, workers, name):
+    """
+    Start worker threads that apply `work` to every item of in_queue.
+    `work` returns the item to pass on, or None to drop it. The last worker
+    to finish forwards the end marker, so downstream stages see exactly one.
+    """
+    remaining = [workers]
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            item = in_queue.get()
+            if item is _DONE:
+                in_queue.put(_DONE)  # Let sibling workers see it too
+                break
+            try:
+                result = work(item)
+                if result is not None:
+                    out_queue.put(result)  # Blocks while the next stage is behind
+            except Exception as e:
+                print(f"Error in {name} stage: {str(e)}")
+        with lock:
+            remaining[0] -= 1
+            if remaining[0] == 0:
+                out_queue.put(_DONE)
+
+    threads = [threading.Thread(target=worker, name=f"{name}-{n}", daemon=True) for n in range(workers)]
+    for thread in threads:
+        thread.start()
+    return threads
+
+def _feed(docs, out_queue):
+    """
+    Push player documents into the pipeline, pulling from `docs` only as space frees up
+    """
+    try:
+        for doc in docs:
+            out_queue.put(doc)
+    finally:
+        out_queue.put(_DONE)
+
+def stream_credits(docs, conn, crawl_state=None, fetch_workers=DEFAULT_FETCH_WORKERS,
+                   buffer_size=DEFAULT_BUFFER, commit_every=DEFAULT_COMMIT_EVERY):
+    """
+    Crawl, parse, score and store players as a streaming pipeline.
+
+    fetch -> parse -> credit -> store, with a bounded queue between each
+    stage. A slow stage makes the ones before it wait instead of piling up
+    pages in memory, and credits are yielded as soon as each player is stored.
+
+    Args:
+        docs (iterable): Player documents with a "url" key; consumed lazily
+        conn: SQLite Cloud connection, used only from the calling thread
+        crawl_state (dict): Newest match seen per URL (CrawlState.load_state) to
+            only store new matches, or None to store everything
+        fetch_workers (int): Number of threads fetching pages
+        buffer_size (int): Capacity of each queue between stages
+        commit_every (int): Commit after this many players
+
+    Yields:
+        tuple: (player_name, point) for every stored match
+    """
+    url_queue = queue.Queue(buffer_size)
+    page_queue = queue.Queue(buffer_size)
+    match_queue = queue.Queue(buffer_size)
+    store_queue = queue.Queue(buffer_size)
+
+    def fetch(doc):
+        return doc["url"], DemoFinal.fetch_page_content(doc["url"])
+
+    def parse(item):
+        url, html_content = item
+        player_name, matches = DemoFinal.scrape_player_match_stats(html_content)
+        return url, player_name, matches
+
+    def credit(item):
+        url, player_name, matches = item
+        fresh = matches if crawl_state is None else CrawlState.new_matches(matches, crawl_state.get(url))
+        points = [UltimateDatabase.calculate_credit_points(
+                      match.get('runs', 0), match.get('balls_faced', 0), match.get('wickets', 0),
+                      match.get('format'), match.get('catch_taken', 0))
+                  for match in fresh]
+        return url, player_name, matches, fresh, points
+
+    feeder = threading.Thread(target=_feed, args=(docs, url_queue), name="feed", daemon=True)
+    feeder.start()
+    _run_stage(url_queue, page_queue, fetch, fetch_workers, "fetch")
+    _run_stage(page_queue, match_queue, parse, 1, "parse")
+    _run_stage(match_queue, store_queue, credit, 1, "credit")
+
+    # Store stage runs here so the connection never leaves this thread
+    cursor = conn.cursor()
+    Schema.ensure_stats(cursor)
+    if crawl_state is not None:
+        CrawlState.ensure_table(cursor)
+    Schema.ensure_player_points(cursor)
+    known = Schema.load_players(cursor)
+    players = 0
+    rows = 0
+    while True:
+        item = store_queue.get()
+        if item is _DONE:
+            break
+        url, player_name, matches, fresh, points = item
+        player_id, player_name = Schema.resolve_player(cursor, url, player_name, known)
+        if player_id is None:
+            print(f"No player ID in {url}, skipping its matches")
+            continue
+        if fresh:
+            rows = DemoFinal.store_matches(cursor, fresh, rows, player_id=player_id)
+            cursor.executemany(Schema.PLAYER_POINTS_UPSERT,
+                               [(player_id, Schema.match_key(match.get('match_id'), match.get('date'),
+                                                             match.get('opponent')), point)
+                                for match, point in zip(fresh, points)])
+        if crawl_state is not None:
+            crawl_state[url] = CrawlState.record_crawl(cursor, url, player_name, matches,
+                                                       crawl_state.get(url), changed=bool(fresh))
+        players += 1
+        if players % commit_every == 0:
+            conn.commit()
+        for point in points:
+            yield player_name, point
+    conn.commit()
+
+def main(fetch_workers=DEFAULT_FETCH_WORKERS, buffer_size=DEFAULT_BUFFER, incremental=True, frontier_path=None,
+         local_path=None, sync=True):
+    import Fetch
+    import Frontier
+
+    if local_path is not None:
+        # Write to the local primary; changes reach SQLite Cloud in the background unless sync is off
+        conn = Storage.open_store(local_path or None, sync=sync)
+    else:
+        # Pooled connection to SQLite Cloud
+        pool = DbPool.get_pool()
+        conn = pool.acquire()
+    frontier = None
+    failed = False
+    try:
+        crawl_state = None
+        if incremental:
+            cursor = conn.cursor()
+            CrawlState.ensure_table(cursor)
+            crawl_state = CrawlState.load_state(cursor)
+
+        if frontier_path is not None:
+            frontier = Frontier.Frontier(frontier_path or None)
+            docs = frontier.iter_players()
+        else:
+            docs = Fetch.iter_players()
+        credits = 0
+        for player_name, point in stream_credits(docs, conn, crawl_state, fetch_workers, buffer_size):
+            credits += 1
+            print(f"{player_name}: {point}")
+        print(f"Stored {credits} match credits")
+    except BaseException as e:
+        failed = True
+        print(f"An error occurred: {str(e) or type(e).__name__}")
+        # Drop the uncommitted part; stream_credits commits every commit_every players
+        conn.rollback()
+        if not isinstance(e, Exception):
+            raise
+    finally:
+        if frontier:
+            frontier.close()
+        if local_path is not None:
+            # Waits for the outstanding changes to be pushed to the cloud
+            conn.close()
+        else:
+            pool.release(conn, failed=failed)
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Crawl, score and store players as a streaming pipeline")
+    parser.add_argument("--fetch-workers", type=int, default=DEFAULT_FETCH_WORKERS, help="threads fetching pages")
+    parser.add_argument("--buffer", type=int, default=DEFAULT_BUFFER, help="capacity of each queue between stages")
+    parser.add_argument("--full", action="store_true", help="store every scraped match instead of only new ones")
+    parser.add_argument("--frontier", dest="frontier_path", nargs="?", const="", metavar="DB",
+                        help="read players from the local SQLite frontier (see Frontier.py) instead of MongoDB")
+    parser.add_argument("--local", dest="local_path", nargs="?", const="", metavar="DB",
+                        help="store in a local SQLite file (see Storage.py) and sync to SQLite Cloud in the background")
+    parser.add_argument("--no-sync", action="store_true",
+                        help="store in the --local file only and never contact SQLite Cloud")
+    args = parser.parse_args()
+    if args.no_sync and args.local_path is None:
+        args.local_path = ""
+
+    main(fetch_workers=args.fetch_workers, buffer_size=args.buffer, incremental=not args.full,
+         frontier_path=args.frontier_path, local_path=args.local_path, sync=not args.no_sync)
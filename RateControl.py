@@ -0,0 +1,188 @@
+import asyncio
+import random
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+# Status codes that mean "slow down" rather than "this page is broken"
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+DEFAULT_RETRIES = 3
+BASE_BACKOFF = 1.0   # Seconds before the first retry
+MAX_BACKOFF = 60.0   # Cap on any single wait, including Retry-After
+
+class RetryableStatus(Exception):
+    """
+    Raised for a 429/5xx response so the caller can back off and retry
+    """
+    def __init__(self, status, retry_after=None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.retry_after = retry_after
+
+def parse_retry_after(value):
+    """
+    Parse a Retry-After header given either as seconds or as an HTTP date
+
+    Args:
+        value (str): Header value, or None
+
+    Returns:
+        float: Seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+def backoff_delay(attempt, retry_after=None):
+    """
+    Seconds to wait before retry number `attempt` (1-based).
+    Honours Retry-After when the server sent one, otherwise exponential with jitter.
+    """
+    if retry_after is not None:
+        return min(retry_after, MAX_BACKOFF)
+    delay = min(BASE_BACKOFF * (2 ** (attempt - 1)), MAX_BACKOFF)
+    return delay * random.uniform(0.5, 1.0)
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency controller for asyncio requests.
+
+    The number of requests allowed in flight grows by about one per
+    round of successful, fast responses and is multiplied by `decrease`
+    on a 429, 5xx or timeout. A Retry-After pauses all new requests.
+    """
+
+    def __init__(self, initial=4, minimum=1, maximum=64, decrease=0.5, latency_factor=3.0, window=60.0):
+        """
+        Args:
+            initial (int): Starting number of requests in flight
+            minimum (int): Never go below this many requests in flight
+            maximum (int): Never go above this many requests in flight
+            decrease (float): Multiplier applied to the limit on failure
+            latency_factor (float): A response slower than this many times the
+                fastest seen counts as unhealthy and stops the limit growing
+            window (float): Seconds of history used for the request rate
+        """
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self.window = window
+
+        self.in_flight = 0
+        self.min_latency = None
+        self.paused_until = 0.0
+        self.last_decrease = 0.0
+        self.counters = {"requests": 0, "successes": 0, "throttled": 0, "server_errors": 0, "timeouts": 0}
+        self._completed = deque()
+        self._condition = None
+
+    def _get_condition(self):
+        # Created lazily so it binds to the running event loop
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def acquire(self):
+        """
+        Wait until another request may be sent
+        """
+        condition = self._get_condition()
+        while True:
+            pause = self.paused_until - time.monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
+                continue
+            async with condition:
+                if self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    self.counters["requests"] += 1
+                    return
+                await condition.wait()
+
+    async def release(self):
+        """
+        Mark a request as finished and wake a waiting one
+        """
+        condition = self._get_condition()
+        async with condition:
+            self.in_flight -= 1
+            condition.notify_all()
+
+    def on_success(self, latency):
+        """
+        Record a successful response and grow the limit if latency is healthy
+
+        Args:
+            latency (float): Response time in seconds
+        """
+        now = time.monotonic()
+        self.counters["successes"] += 1
+        self._completed.append(now)
+        if self.min_latency is None or latency < self.min_latency:
+            self.min_latency = latency
+        if latency <= self.min_latency * self.latency_factor:
+            # Additive increase: about +1 per limit's worth of successes
+            self.limit = min(self.limit + 1.0 / self.limit, float(self.maximum))
+
+    def on_failure(self, status=None, retry_after=None):
+        """
+        Record a throttled, failed or timed-out request and shrink the limit
+
+        Args:
+            status (int): HTTP status, or None for a timeout/connection error
+            retry_after (float): Seconds from a Retry-After header, if any
+        """
+        now = time.monotonic()
+        if status == 429:
+            self.counters["throttled"] += 1
+        elif status is not None:
+            self.counters["server_errors"] += 1
+        else:
+            self.counters["timeouts"] += 1
+
+        # One multiplicative decrease per burst of failures
+        if now - self.last_decrease >= (self.min_latency or 1.0):
+            self.limit = max(self.limit * self.decrease, float(self.minimum))
+            self.last_decrease = now
+        if retry_after:
+            self.paused_until = max(self.paused_until, now + min(retry_after, MAX_BACKOFF))
+
+    def rate(self):
+        """
+        Successful requests per second over the recent window
+        """
+        now = time.monotonic()
+        while self._completed and now - self._completed[0] > self.window:
+            self._completed.popleft()
+        if not self._completed:
+            return 0.0
+        span = max(now - self._completed[0], 1.0)
+        return len(self._completed) / span
+
+    def stats(self):
+        """
+        Current limit, rate and error counters
+
+        Returns:
+            dict: Snapshot of the controller state
+        """
+        snapshot = dict(self.counters)
+        snapshot.update({
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "rate": round(self.rate(), 2),
+        })
+        return snapshot
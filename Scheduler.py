@@ -0,0 +1,289 @@
+import heapq
+import threading
+from datetime import datetime, timedelta
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Bounds on how often a player page is refreshed
+MIN_INTERVAL = timedelta(hours=6)
+MAX_INTERVAL = timedelta(days=30)
+
+# Assumed gap between matches for players without enough history
+DEFAULT_MATCH_INTERVAL_DAYS = 7
+
+def _parse_time(text):
+    if not text:
+        return None
+    for time_format in (TIME_FORMAT, "%Y-%m-%d"):
+        try:
+            return datetime.strptime(text, time_format)
+        except ValueError:
+            continue
+    return None
+
+def match_interval_days(matches):
+    """
+    Average number of days between a player's recent matches
+
+    Args:
+        matches (list): List of match dictionaries with ISO dates
+
+    Returns:
+        float: Average gap in days, or None with fewer than two dated matches
+    """
+    dates = sorted({_parse_time(match.get("date")) for match in matches} - {None})
+    if len(dates) < 2:
+        return None
+    return max((dates[-1] - dates[0]).days / (len(dates) - 1), 1.0)
+
+def refresh_interval(interval_days, days_since_last_match):
+    """
+    How long to wait before refreshing a player page again
+
+    Players are checked about twice per typical gap between their matches.
+    Once a player has gone quiet for longer than usual the wait grows in
+    proportion, so retired or dropped players drift towards MAX_INTERVAL.
+
+    Args:
+        interval_days (float): Average days between the player's matches, or None
+        days_since_last_match (float): Days since the player's newest match, or None
+
+    Returns:
+        timedelta: Time until the next refresh
+    """
+    gap = interval_days or DEFAULT_MATCH_INTERVAL_DAYS
+    wait_days = gap / 2
+    if days_since_last_match is not None and days_since_last_match > 2 * gap:
+        wait_days *= days_since_last_match / (2 * gap)
+    return min(max(timedelta(days=wait_days), MIN_INTERVAL), MAX_INTERVAL)
+
+def failure_backoff(failures):
+    """
+    Exponential backoff after consecutive failed fetches: 6h, 12h, 24h ... up to MAX_INTERVAL
+    """
+    if failures <= 0:
+        return timedelta(0)
+    return min(MIN_INTERVAL * (2 ** min(failures - 1, 16)), MAX_INTERVAL)
+
+def next_due(matches, now=None):
+    """
+    When a player is next due after a successful crawl, from the dates of its matches
+
+    Args:
+        matches (list): All match entries scraped from the page
+        now (datetime): Current time
+
+    Returns:
+        tuple: (average days between matches or None, datetime the player is next due)
+    """
+    now = now or datetime.now()
+    interval = match_interval_days(matches)
+    dates = [match.get("date") for match in matches if match.get("date")]
+    last_match = _parse_time(max(dates)) if dates else None
+    days_since = (now - last_match).days if last_match else None
+    return interval, now + refresh_interval(interval, days_since)
+
+def next_refresh_at(row, now):
+    """
+    Work out when a player is next due from its crawl_state row
+
+    Args:
+        row (dict): crawl_state columns for the player, or None if never crawled
+        now (datetime): Current time
+
+    Returns:
+        datetime: Time the player is due for a refresh
+    """
+    if not row:
+        return now  # Never crawled, due straight away
+    # A stored due time wins: failure backoff sets it without a successful crawl
+    stored = _parse_time(row.get("next_fetch_at"))
+    if stored:
+        return stored
+    if not row.get("last_crawled_at"):
+        return now
+    last_crawled = _parse_time(row["last_crawled_at"])
+    last_match = _parse_time(row.get("last_match_date"))
+    days_since = (now - last_match).days if last_match else None
+    return last_crawled + refresh_interval(row.get("match_interval_days"), days_since)
+
+def load_schedule(cursor):
+    """
+    Load the scheduling columns of every crawled player
+
+    Args:
+        cursor: Database cursor
+
+    Returns:
+        dict: player_url -> row dict
+    """
+    cursor.execute("""
+        SELECT player_url, player_name, last_match_date, last_crawled_at, match_interval_days, failures, next_fetch_at
+        FROM crawl_state
+    """)
+    columns = ["player_url", "player_name", "last_match_date", "last_crawled_at", "match_interval_days",
+               "failures", "next_fetch_at"]
+    return {row[0]: dict(zip(columns, row)) for row in cursor.fetchall()}
+
+def not_due_urls(cursor, upcoming=(), now=None):
+    """
+    URLs of crawled players that are not due for a refresh yet, so the URL
+    store can leave them out (see Fetch.exclude_urls_query). Players in
+    upcoming fixtures are always treated as due.
+
+    Args:
+        cursor: Database cursor (crawl_state must exist)
+        upcoming (iterable): Player URLs or names playing in upcoming fixtures
+        now (datetime): Current time
+
+    Returns:
+        list: Player URLs
+    """
+    now = now or datetime.now()
+    upcoming = set(upcoming)
+    return [url for url, row in load_schedule(cursor).items()
+            if next_refresh_at(row, now) > now and url not in upcoming and row.get("player_name") not in upcoming]
+
+class RefreshScheduler:
+    """
+    Priority queue of player URLs ordered by when they are due for a refresh.
+    Players in upcoming fixtures are due immediately and come before everyone else.
+    Safe to pull from several worker threads.
+    """
+
+    def __init__(self, upcoming=()):
+        """
+        Args:
+            upcoming (iterable): Player URLs or names playing in upcoming fixtures
+        """
+        self.upcoming = set(upcoming)
+        self._heap = []
+        self._rows = {}
+        self._counter = 0
+        self._lock = threading.Lock()
+
+    def _is_upcoming(self, doc):
+        return doc.get("url") in self.upcoming or doc.get("player_name") in self.upcoming
+
+    def add(self, doc, row=None, now=None):
+        """
+        Schedule a player
+
+        Args:
+            doc (dict): Player document with at least a "url" key
+            row (dict): crawl_state row for the player, or None if never crawled
+            now (datetime): Current time
+        """
+        now = now or datetime.now()
+        due_at = next_refresh_at(row, now)
+        upcoming = self._is_upcoming(doc)
+        if upcoming:
+            due_at = min(due_at, now)
+        with self._lock:
+            self._rows[doc["url"]] = dict(row or {})
+            # Upcoming players sort first, then earliest due time, then insertion order
+            heapq.heappush(self._heap, (0 if upcoming else 1, due_at, self._counter, doc))
+            self._counter += 1
+
+    def pop_due(self, now=None):
+        """
+        Take the highest-priority player that is due
+
+        Returns:
+            dict: Player document, or None if nobody is due
+        """
+        now = now or datetime.now()
+        with self._lock:
+            # Upcoming players are always due, so the heap top is the only candidate
+            if self._heap and self._heap[0][1] <= now:
+                return heapq.heappop(self._heap)[3]
+        return None
+
+    def due(self, budget=None, now=None):
+        """
+        Iterate over due players in priority order
+
+        Args:
+            budget (int): Maximum number of players to return (None for all due)
+            now (datetime): Current time
+
+        Yields:
+            dict: Player documents
+        """
+        count = 0
+        while budget is None or count < budget:
+            doc = self.pop_due(now)
+            if doc is None:
+                return
+            count += 1
+            yield doc
+
+    def __len__(self):
+        return len(self._heap)
+
+    def record_success(self, cursor, url, matches, now=None):
+        """
+        Store the player's match frequency and next refresh time after a successful crawl.
+        Creates the crawl_state row when there is none, e.g. on a --full crawl.
+
+        Args:
+            cursor: Database cursor
+            url (str): URL of the player page
+            matches (list): All match entries scraped from the page
+            now (datetime): Current time
+
+        Returns:
+            datetime: Time the player is next due
+        """
+        interval, due_at = next_due(matches, now)
+        with self._lock:
+            self._rows.setdefault(url, {})["failures"] = 0
+        cursor.execute("""
+            INSERT INTO crawl_state (player_url, match_interval_days, failures, next_fetch_at) VALUES (?, ?, 0, ?)
+            ON CONFLICT(player_url) DO UPDATE SET match_interval_days = excluded.match_interval_days,
+                failures = 0, next_fetch_at = excluded.next_fetch_at
+        """, (url, interval, due_at.strftime(TIME_FORMAT)))
+        return due_at
+
+    def record_failure(self, cursor, url, now=None):
+        """
+        Count a failed crawl and back the player off exponentially
+
+        Args:
+            cursor: Database cursor
+            url (str): URL of the player page
+            now (datetime): Current time
+
+        Returns:
+            datetime: Time of the next attempt
+        """
+        now = now or datetime.now()
+        with self._lock:
+            row = self._rows.setdefault(url, {})
+            row["failures"] = (row.get("failures") or 0) + 1
+            failures = row["failures"]
+        due_at = now + failure_backoff(failures)
+        cursor.execute("""
+            INSERT INTO crawl_state (player_url, failures, next_fetch_at) VALUES (?, ?, ?)
+            ON CONFLICT(player_url) DO UPDATE SET failures = excluded.failures, next_fetch_at = excluded.next_fetch_at
+        """, (url, failures, due_at.strftime(TIME_FORMAT)))
+        return due_at
+
+def build_scheduler(cursor, docs, upcoming=(), now=None):
+    """
+    Create a scheduler holding every player document
+
+    Args:
+        cursor: Database cursor (crawl_state must exist)
+        docs (iterable): Player documents from the URL store
+        upcoming (iterable): Player URLs or names playing in upcoming fixtures
+        now (datetime): Current time
+
+    Returns:
+        RefreshScheduler
+    """
+    rows = load_schedule(cursor)
+    scheduler = RefreshScheduler(upcoming)
+    for doc in docs:
+        scheduler.add(doc, rows.get(doc["url"]), now)
+    return scheduler
@@ -0,0 +1,443 @@
+# Managed schema: the players dimension and the per-match stats facts that
+# reference it by the numeric cricket.com player ID.
+#
+#   python Schema.py                              # migrate the SQLite Cloud database
+#   python Schema.py --db local.db                # migrate a local SQLite file
+#   python Schema.py --players player_urls.csv    # load canonical player names
+
+import csv
+
+import ScoreParser
+
+STATS_COLUMNS = [
+    ("player_id", "INTEGER"),
+    ("opponent", "TEXT"),
+    ("runs_scored", "INTEGER"),
+    ("balls_faced", "INTEGER"),
+    ("wickets_taken", "INTEGER"),
+    ("catch_taken", "INTEGER"),
+    ("format", "TEXT"),
+    ("date", "TEXT"),
+    ("match_id", "INTEGER"),
+    ("match_key", "TEXT"),
+    ("updated_at", "TEXT"),
+]
+
+# Time of the last write to a stats row, set by every upsert. The Parquet
+# export compares it per partition to find the partitions to rewrite.
+STATS_UPDATED_AT = "strftime('%Y-%m-%d %H:%M:%f', 'now')"
+
+# A player plays a given match once: this is the natural key of a stats row.
+# match_key is the cricket.com match ID when known, else the date and fixture.
+STATS_KEY = ("player_id", "match_key")
+STATS_KEY_INDEX = "ux_stats_player_match_key"
+
+STATS_INDEXES = [
+    # Per-player credit calculation reads only these columns
+    ("idx_stats_player_id_points", "stats (player_id, format, runs_scored, balls_faced, wickets_taken, catch_taken)"),
+    # Per-date access, e.g. everything played on a match day
+    ("idx_stats_date_player_id", "stats (date, player_id)"),
+]
+
+# Name-keyed indexes from before the players table; dropped by the migration
+LEGACY_STATS_INDEXES = ("ux_stats_player_match", "idx_stats_player_points", "idx_stats_date",
+                        # Keyed on the raw fixture text, which differed between parse paths
+                        "ux_stats_player_id_match")
+
+# Insert a match, or refresh the figures if it is already stored
+STATS_UPSERT = f'''
+    INSERT INTO stats (player_id, opponent, runs_scored, balls_faced, wickets_taken, catch_taken, format, date, match_id,
+                       match_key, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, {STATS_UPDATED_AT})
+    ON CONFLICT({", ".join(STATS_KEY)}) DO UPDATE SET
+        opponent = excluded.opponent,
+        date = excluded.date,
+        runs_scored = excluded.runs_scored,
+        balls_faced = excluded.balls_faced,
+        wickets_taken = excluded.wickets_taken,
+        catch_taken = excluded.catch_taken,
+        format = excluded.format,
+        match_id = COALESCE(excluded.match_id, stats.match_id),
+        updated_at = excluded.updated_at
+'''
+
+# Names from the player listing are canonical and replace whatever is stored
+PLAYERS_UPSERT = '''
+    INSERT INTO players (player_id, player_name, url) VALUES (?, ?, ?)
+    ON CONFLICT(player_id) DO UPDATE SET
+        player_name = excluded.player_name,
+        url = COALESCE(excluded.url, players.url)
+'''
+
+# Names scraped from a player page only fill in players not seen before
+PLAYERS_INSERT_NEW = '''
+    INSERT INTO players (player_id, player_name, url) VALUES (?, ?, ?)
+    ON CONFLICT(player_id) DO NOTHING
+'''
+
+# One credit point per stats row, so reruns of either writer replace instead of adding
+PLAYER_POINTS_KEY_INDEX = "ux_player_points_match"
+PLAYER_POINTS_UPSERT = '''
+    INSERT INTO player_points (player_id, match_key, point) VALUES (?, ?, ?)
+    ON CONFLICT(player_id, match_key) DO UPDATE SET point = excluded.point
+'''
+
+def player_id_from_url(url):
+    """
+    Numeric cricket.com player ID from a player URL, e.g. .../players/virat-kohli-3993/recent -> 3993
+
+    Returns:
+        int: Player ID, or None if the URL doesn't contain one
+    """
+    try:
+        return int(url.split("/")[4].split("-")[-1])
+    except (IndexError, ValueError, AttributeError):
+        return None
+
+def match_key(match_id, date, opponent):
+    """
+    Natural key of a match for one player: the cricket.com match ID when it
+    is known, otherwise the date and the whitespace-normalized fixture name
+
+    Returns:
+        str: e.g. "id:257222" or "2025-03-28|Chennai Super Kings vs Royal Challengers Bengaluru"
+    """
+    if match_id is not None:
+        return f"id:{match_id}"
+    return f"{date}|{ScoreParser.normalize_opponent(opponent) or ''}"
+
+def stats_row(entry, player_id=None):
+    """
+    Turn a scraped match entry into a row for STATS_UPSERT
+
+    Args:
+        entry (dict): Match dictionary from scrape_player_match_stats
+        player_id (int): ID of the player the page belongs to (default: entry["player_id"])
+
+    Returns:
+        tuple: Column values, with 0 for missing counts
+    """
+    return (
+        player_id if player_id is not None else entry.get('player_id'),
+        entry.get('opponent', None),
+        entry.get('runs', 0),
+        entry.get('balls_faced', 0),
+        entry.get('wickets', 0),
+        entry.get('catch_taken', 0),
+        entry.get('format'),
+        entry.get('date', None),
+        entry.get('match_id'),
+        match_key(entry.get('match_id'), entry.get('date'), entry.get('opponent')),
+    )
+
+def _existing_columns(cursor, table):
+    cursor.execute(f"PRAGMA table_info({table})")
+    return {row[1] for row in cursor.fetchall()}
+
+def _existing_indexes(cursor, table):
+    cursor.execute(f"PRAGMA index_list({table})")
+    return {row[1] for row in cursor.fetchall()}
+
+def _table_exists(cursor, table):
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+    return cursor.fetchone() is not None
+
+def ensure_players(cursor):
+    """
+    Create the players dimension: one row per cricket.com player ID with its canonical name
+
+    Args:
+        cursor: Database cursor (SQLite or SQLite Cloud)
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS players (
+            player_id INTEGER PRIMARY KEY,
+            player_name TEXT NOT NULL,
+            url TEXT
+        )
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_players_name ON players (player_name)")
+
+def register_players(cursor, players):
+    """
+    Add players or replace their names with canonical ones, keyed on player ID
+
+    Args:
+        cursor: Database cursor
+        players (iterable): Documents with player_name and url, and player_id if known
+
+    Returns:
+        int: Number of players written
+    """
+    rows = []
+    for player in players:
+        player_id = player.get("player_id") or player_id_from_url(player.get("url"))
+        if player_id is not None and player.get("player_name"):
+            rows.append((int(player_id), player["player_name"], player.get("url")))
+    if rows:
+        cursor.executemany(PLAYERS_UPSERT, rows)
+    return len(rows)
+
+def import_players_csv(cursor, filename="player_urls.csv"):
+    """
+    Load canonical names from a CSV with Name, ID and URL columns (the format of player_urls.csv)
+
+    Returns:
+        int: Number of players written
+    """
+    with open(filename, 'r', encoding='utf-8') as f:
+        players = [{"player_id": int(row["ID"]) if row.get("ID", "").isdigit() else None,
+                    "player_name": row.get("Name"), "url": row.get("URL")}
+                   for row in csv.DictReader(f)]
+    return register_players(cursor, players)
+
+def load_players(cursor):
+    """
+    Load every player's canonical name in one query
+
+    Returns:
+        dict: player_id -> player_name
+    """
+    cursor.execute("SELECT player_id, player_name FROM players")
+    return dict(cursor.fetchall())
+
+def resolve_player(cursor, url, player_name, known):
+    """
+    Player ID and canonical name for a crawled page, adding the player to
+    the players table the first time it is seen
+
+    Args:
+        cursor: Database cursor
+        url (str): URL of the player page
+        player_name (str): Name scraped from the page, used only for new players
+        known (dict): player_id -> player_name from load_players; updated in place
+
+    Returns:
+        tuple: (player_id, player_name), with a None ID if the URL has no ID
+    """
+    player_id = player_id_from_url(url)
+    if player_id is None:
+        return None, player_name
+    if player_id not in known:
+        cursor.execute(PLAYERS_INSERT_NEW, (player_id, player_name or "Unknown Player", url))
+        known[player_id] = player_name
+    return player_id, known[player_id]
+
+def _player_ids_by_name(cursor):
+    # Name -> ID from the players table and from the scraped names kept in
+    # crawl_state (the same names the old stats rows were written with).
+    # Names shared by more than one player are left out.
+    candidates = {}
+    cursor.execute("SELECT player_name, player_id FROM players")
+    pairs = list(cursor.fetchall())
+    if _table_exists(cursor, "crawl_state"):
+        cursor.execute("SELECT player_name, player_url FROM crawl_state WHERE player_name IS NOT NULL")
+        for player_name, url in cursor.fetchall():
+            player_id = player_id_from_url(url)
+            if player_id is not None:
+                pairs.append((player_name, player_id))
+                cursor.execute(PLAYERS_INSERT_NEW, (player_id, player_name, url))
+    for player_name, player_id in pairs:
+        candidates.setdefault(player_name, set()).add(player_id)
+    return {name: ids.pop() for name, ids in candidates.items() if len(ids) == 1}
+
+def backfill_player_ids(cursor, table):
+    """
+    Fill in player_id on rows written by name only, before the players table existed
+
+    Args:
+        cursor: Database cursor
+        table (str): Table with player_name and player_id columns
+
+    Returns:
+        int: Number of rows still without a player ID
+    """
+    if "player_name" not in _existing_columns(cursor, table):
+        return 0
+    ids = _player_ids_by_name(cursor)
+    # One UPDATE against a keyed lookup table instead of one table scan per name
+    cursor.execute("CREATE TEMP TABLE IF NOT EXISTS player_name_ids (player_name TEXT PRIMARY KEY, player_id INTEGER)")
+    cursor.execute("DELETE FROM player_name_ids")
+    cursor.executemany("INSERT INTO player_name_ids VALUES (?, ?)", list(ids.items()))
+    cursor.execute(f"""
+        UPDATE {table} SET player_id = (
+            SELECT n.player_id FROM player_name_ids n WHERE n.player_name = {table}.player_name
+        )
+        WHERE player_id IS NULL AND player_name IN (SELECT player_name FROM player_name_ids)
+    """)
+    cursor.execute("DROP TABLE player_name_ids")
+    cursor.execute(f"SELECT COUNT(*) FROM {table} WHERE player_id IS NULL")
+    return cursor.fetchone()[0]
+
+def fill_match_keys(cursor, batch_size=1000):
+    """
+    Normalize the fixture name and set match_key on rows written before the
+    key existed
+
+    Args:
+        cursor: Database cursor
+        batch_size (int): Rows updated per executemany
+
+    Returns:
+        int: Number of rows updated
+    """
+    cursor.execute("SELECT rowid, match_id, date, opponent FROM stats WHERE match_key IS NULL")
+    rows = cursor.fetchall()
+    updates = [(ScoreParser.normalize_opponent(opponent), match_key(match_id, date, opponent), rowid)
+               for rowid, match_id, date, opponent in rows]
+    for offset in range(0, len(updates), batch_size):
+        cursor.executemany(f"UPDATE stats SET opponent = ?, match_key = ?, updated_at = {STATS_UPDATED_AT} "
+                           "WHERE rowid = ?",
+                           updates[offset:offset + batch_size])
+    # A row stored without a match ID and the same match stored with one
+    cursor.execute("""
+        DELETE FROM stats WHERE match_id IS NULL AND EXISTS (
+            SELECT 1 FROM stats other
+            WHERE other.player_id = stats.player_id AND other.match_id IS NOT NULL
+              AND other.date = stats.date AND other.opponent = stats.opponent
+        )
+    """)
+    return len(updates)
+
+def dedupe_stats(cursor):
+    """
+    Delete repeated copies of the same match, keeping the most recently inserted one.
+    Name variants of one player count as the same player once they share an ID.
+
+    Args:
+        cursor: Database cursor
+
+    Returns:
+        int: Number of rows deleted
+    """
+    cursor.execute(f"""
+        DELETE FROM stats WHERE player_id IS NOT NULL AND rowid NOT IN (
+            SELECT MAX(rowid) FROM stats WHERE player_id IS NOT NULL GROUP BY {", ".join(STATS_KEY)}
+        )
+    """)
+    return cursor.rowcount
+
+def migrate_stats_keys(cursor):
+    """
+    Re-key stats on player ID and match: drop the old indexes, fill in IDs
+    for rows written by name and match keys for rows written before them,
+    merge the duplicates that leaves and add the unique key. Also run after loading more players, to map old rows.
+
+    Args:
+        cursor: Database cursor
+    """
+    indexes = _existing_indexes(cursor, "stats")
+    for name in LEGACY_STATS_INDEXES + (STATS_KEY_INDEX,):
+        if name in indexes:
+            cursor.execute(f"DROP INDEX {name}")
+    unmapped = backfill_player_ids(cursor, "stats")
+    fill_match_keys(cursor)
+    deleted = dedupe_stats(cursor)
+    if deleted and deleted > 0:
+        print(f"Removed {deleted} duplicate match rows from stats")
+    if unmapped:
+        print(f"{unmapped} stats rows have no player ID; load player_urls.csv with --players to map them")
+    cursor.execute(f"CREATE UNIQUE INDEX {STATS_KEY_INDEX} ON stats ({', '.join(STATS_KEY)})")
+
+def ensure_stats(cursor):
+    """
+    Create or migrate the players and stats tables: add missing columns,
+    move name-keyed rows onto player IDs, remove duplicate matches, then
+    add the unique natural key and the covering indexes. Cheap to call on
+    every start once migrated.
+
+    Args:
+        cursor: Database cursor (SQLite or SQLite Cloud)
+    """
+    ensure_players(cursor)
+    columns = ", ".join(f"{name} {definition}" for name, definition in STATS_COLUMNS)
+    cursor.execute(f"CREATE TABLE IF NOT EXISTS stats ({columns})")
+
+    existing = _existing_columns(cursor, "stats")
+    for name, definition in STATS_COLUMNS:
+        if name not in existing:
+            cursor.execute(f"ALTER TABLE stats ADD COLUMN {name} {definition}")
+
+    if STATS_KEY_INDEX not in _existing_indexes(cursor, "stats"):
+        migrate_stats_keys(cursor)
+    indexes = _existing_indexes(cursor, "stats")
+    for name, definition in STATS_INDEXES:
+        if name not in indexes:
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {definition}")
+
+def ensure_player_points(cursor):
+    """
+    Create or migrate player_points, the per-match credit points keyed on
+    player ID and match_key. Rows written before the key existed can't be
+    tied to a match (and were appended once per run), so they are dropped;
+    UltimateDatabase.py rebuilds them from stats.
+
+    Args:
+        cursor: Database cursor
+    """
+    ensure_players(cursor)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS player_points (
+            player_id INTEGER,
+            match_key TEXT,
+            point REAL
+        )
+    """)
+    existing = _existing_columns(cursor, "player_points")
+    if "player_id" not in existing:
+        cursor.execute("ALTER TABLE player_points ADD COLUMN player_id INTEGER")
+    if "match_key" not in existing:
+        cursor.execute("ALTER TABLE player_points ADD COLUMN match_key TEXT")
+    if PLAYER_POINTS_KEY_INDEX not in _existing_indexes(cursor, "player_points"):
+        cursor.execute("DELETE FROM player_points WHERE player_id IS NULL OR match_key IS NULL")
+        if cursor.rowcount:
+            print(f"Dropped {cursor.rowcount} player_points rows without a match key; "
+                  "run UltimateDatabase.py to rebuild them from stats")
+        cursor.execute(f"CREATE UNIQUE INDEX {PLAYER_POINTS_KEY_INDEX} ON player_points (player_id, match_key)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_player_points_player ON player_points (player_id, point)")
+
+def ensure_player_average_points(cursor):
+    """
+    Create player_average_points keyed on player ID. The table is derived
+    from player_points, so an old name-keyed copy is dropped and rebuilt.
+
+    Args:
+        cursor: Database cursor
+    """
+    if _table_exists(cursor, "player_average_points") and \
+            "player_id" not in _existing_columns(cursor, "player_average_points"):
+        cursor.execute("DROP TABLE player_average_points")
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS player_average_points (
+            player_id INTEGER PRIMARY KEY,
+            average_point REAL
+        )
+    """)
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Create or migrate the players and stats tables")
+    parser.add_argument("--db", help="local SQLite file to migrate instead of SQLite Cloud")
+    parser.add_argument("--players", metavar="CSV",
+                        help="load canonical player names from a CSV with Name, ID and URL columns")
+    args = parser.parse_args()
+
+    if args.db:
+        import sqlite3
+        conn = sqlite3.connect(args.db)
+    else:
+        # pip install sqlitecloud
+        import sqlitecloud
+        conn = sqlitecloud.connect("")
+    try:
+        cursor = conn.cursor()
+        ensure_stats(cursor)
+        if args.players:
+            print(f"Loaded {import_players_csv(cursor, args.players)} players from {args.players}")
+            # Rows written by name may match the newly loaded players
+            migrate_stats_keys(cursor)
+        conn.commit()
+        print("players and stats schema is up to date")
+    finally:
+        conn.close()
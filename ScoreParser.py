@@ -0,0 +1,266 @@
+import re
+from datetime import date
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Sequence, Union
+
+# Patterns are compiled once at import instead of per row
+BATTING_PATTERN = re.compile(r'(\d+)(\*?)\s*\(\s*(\d+)\s*\)')
+BATTING_BARE_PATTERN = re.compile(r'^(\d+)(\*?)\s+(\d+)$')
+BOWLING_PATTERN = re.compile(r'^\s*(\d+)\s*/\s*(\d+)\s*(?:/|$)')
+DATE_PATTERN = re.compile(r'^(\d{1,2})([- ])([A-Za-z]{3})\2(\d{4})$')
+MATCH_ID_PATTERN = re.compile(r'(\d+)/?$')
+
+MONTHS = {name: number for number, name in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], start=1)}
+
+# Cell values meaning the player did not bat/bowl
+NO_SCORE = ("DNB", "-", "")
+
+class Batting(NamedTuple):
+    runs: Optional[int]
+    balls_faced: Optional[int]
+    not_out: bool
+
+class Bowling(NamedTuple):
+    wickets: Optional[int]
+    runs_conceded: Optional[int]
+
+class MatchLine(NamedTuple):
+    opponent: str
+    runs: Optional[int]
+    balls_faced: Optional[int]
+    not_out: bool
+    wickets: Optional[int]
+    runs_conceded: Optional[int]
+    format: str
+    date: str
+    match_id: Optional[int] = None
+
+def normalize_opponent(text: Optional[str]) -> Optional[str]:
+    """
+    Collapse the line breaks and indentation that the page markup leaves inside
+    the fixture name, so the DOM and payload paths write the same text
+
+    Args:
+        text: Fixture name such as "Chennai\\n    Super Kings vs Royal Challengers Bengaluru"
+
+    Returns:
+        Fixture name with single spaces, e.g. "Chennai Super Kings vs Royal Challengers Bengaluru"
+    """
+    return " ".join(text.split()) if text is not None else None
+
+def parse_match_id(text: Union[str, int, None]) -> Optional[int]:
+    """
+    Get the cricket.com match ID from a match URL such as "/live-score/...-257222"
+
+    Args:
+        text: Match URL or bare match ID; the JSON payload gives the ID as an int
+
+    Returns:
+        Match ID or None if the text does not end in one
+    """
+    if text is None:
+        return None
+    match = MATCH_ID_PATTERN.search(str(text).strip())
+    return int(match.group(1)) if match else None
+
+def parse_batting(text: str) -> Batting:
+    """
+    Parse a batting cell such as "59*(36)", "31(30)", "DNB" or "-"
+
+    Args:
+        text: Batting cell text
+
+    Returns:
+        Batting with runs and balls_faced set to None if the player did not bat
+    """
+    text = text.strip()
+    if text in NO_SCORE:
+        return Batting(None, None, False)
+    match = BATTING_PATTERN.search(text) or BATTING_BARE_PATTERN.match(text)
+    if not match:
+        return Batting(None, None, False)
+    return Batting(int(match.group(1)), int(match.group(3)), "*" in text)
+
+def parse_bowling(text: str) -> Bowling:
+    """
+    Parse a bowling cell such as "3/24", "DNB" or "-"
+
+    Args:
+        text: Bowling cell text
+
+    Returns:
+        Bowling with wickets and runs_conceded set to None if the player did not bowl
+    """
+    match = BOWLING_PATTERN.match(text)
+    if not match:
+        return Bowling(None, None)
+    return Bowling(int(match.group(1)), int(match.group(2)))
+
+@lru_cache(maxsize=4096)
+def parse_date(text: str) -> str:
+    """
+    Convert "28-Mar-2025" or "28 Mar 2025" to "2025-03-28".
+    Results are cached since every player page repeats the same match dates.
+
+    Args:
+        text: Date cell text
+
+    Returns:
+        Date as YYYY-MM-DD, or the text unchanged if it is not a recognised date
+    """
+    match = DATE_PATTERN.match(text)
+    if not match:
+        return text
+    month = MONTHS.get(match.group(3).lower())
+    if month is None:
+        return text
+    try:
+        return date(int(match.group(4)), month, int(match.group(1))).isoformat()
+    except ValueError:
+        return text
+
+def parse_cells(cells: Sequence[str]) -> MatchLine:
+    """
+    Parse the text of one results row: opposition, batting, bowling, format, date
+    and optionally the match URL
+
+    Args:
+        cells: Cell strings in table order
+
+    Returns:
+        MatchLine with typed fields
+    """
+    opponent, batting_text, bowling_text, format_text, date_text = cells[:5]
+    batting = parse_batting(batting_text)
+    bowling = parse_bowling(bowling_text)
+    match_id = parse_match_id(cells[5]) if len(cells) > 5 else None
+    return MatchLine(normalize_opponent(opponent), batting.runs, batting.balls_faced, batting.not_out,
+                     bowling.wickets, bowling.runs_conceded, format_text, parse_date(date_text), match_id)
+
+def parse_rows(rows: Sequence[Sequence[str]]) -> List[MatchLine]:
+    """
+    Parse a whole table of row cell strings at once
+
+    Args:
+        rows: List of rows, each a list of cell strings in table order
+
+    Returns:
+        List of MatchLine
+    """
+    return [parse_cells(cells) for cells in rows]
+
+def to_match_entry(line: MatchLine, player_name: str) -> dict:
+    """
+    Convert a MatchLine to the match dict format of scrape_player_match_stats.
+    runs, balls_faced and not_out are only present if the player batted;
+    wickets and runs_conceded only if the player bowled; match_id only if known.
+
+    Args:
+        line: Parsed row
+        player_name: Name of the player
+
+    Returns:
+        dict: Match entry
+    """
+    match_entry = {
+        "player_name": player_name,
+        "opponent": line.opponent,
+        "format": line.format,
+        "date": line.date
+    }
+    if line.runs is not None:
+        match_entry["runs"] = line.runs
+        match_entry["balls_faced"] = line.balls_faced
+        match_entry["not_out"] = line.not_out
+    if line.wickets is not None:
+        match_entry["wickets"] = line.wickets
+        match_entry["runs_conceded"] = line.runs_conceded
+    if line.match_id is not None:
+        match_entry["match_id"] = line.match_id
+    return match_entry
+
+def _legacy_parse(batting_stats, bowling_stats, date_text):
+    """
+    Batting/bowling/date handling as it was inlined in scrape_player_match_stats, kept for the benchmark
+    """
+    from datetime import datetime
+    match_entry = {}
+    try:
+        date_obj = datetime.strptime(date_text, '%d-%b-%Y')
+        match_entry["date"] = date_obj.strftime('%Y-%m-%d')
+    except ValueError:
+        try:
+            date_obj = datetime.strptime(date_text, '%d %b %Y')
+            match_entry["date"] = date_obj.strftime('%Y-%m-%d')
+        except ValueError:
+            match_entry["date"] = date_text
+    if batting_stats != "DNB" and batting_stats != "-":
+        try:
+            if "*" in batting_stats:
+                match = re.search(r'(\d+)\*\((\d+)\)', batting_stats)
+                if match:
+                    runs_str, balls_str = match.groups()
+                else:
+                    runs_str, balls_str = batting_stats.replace("*", "").replace("(", "").replace(")", "").split()
+            else:
+                match = re.search(r'(\d+)\((\d+)\)', batting_stats)
+                if match:
+                    runs_str, balls_str = match.groups()
+                else:
+                    runs_str, balls_str = batting_stats.replace("(", "").replace(")", "").split()
+            match_entry["runs"] = int(runs_str)
+            match_entry["balls_faced"] = int(balls_str)
+        except Exception:
+            pass
+    if bowling_stats not in ["DNB", "-"] and "/" in bowling_stats:
+        try:
+            wickets_runs = bowling_stats.split("/")
+            match_entry["wickets"] = int(wickets_runs[0])
+            match_entry["runs_conceded"] = int(wickets_runs[1])
+        except Exception:
+            pass
+    return match_entry
+
+def benchmark(repeat=20000):
+    """
+    Time the legacy per-row parsing against parse_rows on the same cells
+
+    Args:
+        repeat: Number of times the sample rows are repeated
+
+    Returns:
+        dict: Rows per second for each code path
+    """
+    import time
+    sample = [
+        ["CSK vs RCB", "31(30)", "DNB", "T20s", "28-Mar-2025"],
+        ["KKR vs RCB", "59*(36)", "DNB", "T20s", "22-Mar-2025"],
+        ["IND vs NZ", "DNB", "3/24", "ODI", "09-Mar-2025"],
+        ["RAI vs DEL", "-", "-", "First-class", "30 Jan 2025"],
+        ["IND vs ENG", "100*(111)", "1/12", "ODI", "12-Feb-2025"],
+    ]
+    rows = sample * repeat
+
+    start = time.perf_counter()
+    for cells in rows:
+        _legacy_parse(cells[1], cells[2], cells[4])
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parse_rows(rows)
+    parser_seconds = time.perf_counter() - start
+
+    return {
+        "rows": len(rows),
+        "legacy_rows_per_sec": round(len(rows) / legacy_seconds),
+        "parser_rows_per_sec": round(len(rows) / parser_seconds),
+        "speedup": round(legacy_seconds / parser_seconds, 2)
+    }
+
+if __name__ == "__main__":
+    results = benchmark()
+    print(f"Parsed {results['rows']} rows")
+    print(f"Legacy code path: {results['legacy_rows_per_sec']} rows/sec")
+    print(f"ScoreParser:      {results['parser_rows_per_sec']} rows/sec")
+    print(f"Speedup: {results['speedup']}x")
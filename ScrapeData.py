@@ -1,60 +1,229 @@
-import json
-import requests
-from bs4 import BeautifulSoup
-
-def create_player_urls(html_content):
-    """
-    Extracts player name and ID from the given HTML, constructs URLs,
-    and returns a JSON string with player names as keys and URLs as values.
-
-    Args:
-        html_content (str): The HTML content to parse.
-
-    Returns:
-        str: A JSON string containing a dictionary with player names as keys and URLs as values.
-             Returns '[]' if no player data is found.
-    """
-
-    player_urls = {}
-    soup = BeautifulSoup(html_content, 'html.parser')
-
-    # Find all divs with class 'ds-grow'
-    player_divs = soup.find_all('div', class_='ds-grow')
-
-    for player_div in player_divs:
-        # Find the link (<a> tag) within each player div
-        link = player_div.find('a')
-        if link:
-            player_name = link.text.strip()
-            href = link.get('href')
-
-            # Extract player ID from the href
-            try:
-                player_id = int(href.split('-')[-1])  # Assuming ID is the last part after '-'
-            except:
-                player_id = None  # Handle cases where id is absent or malformed
-
-            if player_id is not None:  # Only include if id is valid
-                base_url = "https://www.cricket.com/players/"
-                player_url = f"{base_url}{player_name.lower().replace(' ', '-')}-{player_id}"
-                player_urls[player_name] = player_url
-
-    return json.dumps(player_urls, indent=4)  # Convert to JSON string with indentation
-
-
-# URL of the HTML content
-url = "https://www.cricket.com/players"
-
-try:
-    response = requests.get(url)
-    response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
-    html_content = response.text
-except requests.exceptions.RequestException as e:
-    print(f"Error fetching the URL: {e}")
-    html_content = None
-
-if html_content:
-    player_urls_json = create_player_urls(html_content)
-    print(player_urls_json)
-else:
-    print("[]")  # Print empty JSON array if no content
+import csv
+import json
+import sqlite3
+from html.parser import HTMLParser
+
+import requests
+
+BASE_URL = "https://www.cricket.com/players/"
+
+# Characters read per step when streaming a listing
+CHUNK_SIZE = 64 * 1024
+
+class PlayerListingParser(HTMLParser):
+    """
+    Event-based scan of a players listing. Tracks only the ds-grow divs and
+    the first link inside each, so nothing is kept for the rest of the page.
+    Finished players pile up in `found` until the caller drains them.
+    """
+
+    def __init__(self, base_url=BASE_URL):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.found = []
+        self._div_depth = 0
+        self._player_depth = None  # div depth of the open ds-grow div
+        self._href = None
+        self._text = None          # text of the link while inside it
+        self._link_done = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'div':
+            self._div_depth += 1
+            if self._player_depth is None:
+                classes = (dict(attrs).get('class') or '').split()
+                if 'ds-grow' in classes:
+                    self._player_depth = self._div_depth
+                    self._href = None
+                    self._text = None
+                    self._link_done = False
+        elif tag == 'a' and self._player_depth is not None and self._text is None and not self._link_done:
+            self._href = dict(attrs).get('href')
+            self._text = []
+
+    def handle_endtag(self, tag):
+        if tag == 'a' and self._text is not None and not self._link_done:
+            self._link_done = True
+        elif tag == 'div' and self._div_depth > 0:
+            if self._div_depth == self._player_depth:
+                self._emit()
+                self._player_depth = None
+            self._div_depth -= 1
+
+    def handle_data(self, data):
+        if self._text is not None and not self._link_done:
+            self._text.append(data)
+
+    def _emit(self):
+        if self._text is None or not self._href:
+            return
+        player_name = ''.join(self._text).strip()
+        try:
+            player_id = int(self._href.split('-')[-1])  # Assuming ID is the last part after '-'
+        except ValueError:
+            return  # Skip links where the id is absent or malformed
+        player_url = f"{self.base_url}{player_name.lower().replace(' ', '-')}-{player_id}"
+        self.found.append((player_name, player_id, player_url))
+
+def iter_player_urls(chunks, base_url=BASE_URL):
+    """
+    Stream (name, id, url) for every player in a listing
+
+    Args:
+        chunks (iterable): The listing HTML as an iterable of text chunks
+            (a single string is fine too)
+        base_url (str): Prefix for the player URLs
+
+    Yields:
+        tuple: (player_name, player_id, player_url) in page order
+    """
+    if isinstance(chunks, str):
+        chunks = [chunks]
+    parser = PlayerListingParser(base_url)
+    for chunk in chunks:
+        parser.feed(chunk)
+        if parser.found:
+            yield from parser.found
+            parser.found.clear()
+    parser.close()
+    yield from parser.found
+
+def iter_file_chunks(file_path, chunk_size=CHUNK_SIZE):
+    """
+    Read a saved listing in chunks
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+def iter_url_chunks(url, chunk_size=CHUNK_SIZE):
+    """
+    Download a listing in chunks without holding the whole response
+    """
+    with requests.get(url, stream=True, timeout=30) as response:
+        response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
+        if response.encoding is None:
+            response.encoding = 'utf-8'
+        yield from response.iter_content(chunk_size=chunk_size, decode_unicode=True)
+
+def discover_players(sources, base_url=BASE_URL):
+    """
+    Stream players from one or more listing pages (e.g. every page of a
+    paginated listing), skipping URLs already seen on an earlier page
+
+    Args:
+        sources (iterable): Listing URLs (http/https) or saved HTML files
+        base_url (str): Prefix for the player URLs
+
+    Yields:
+        tuple: (player_name, player_id, player_url)
+    """
+    seen = set()
+    for source in sources:
+        chunks = iter_url_chunks(source) if source.startswith("http") else iter_file_chunks(source)
+        for player in iter_player_urls(chunks, base_url):
+            if player[2] not in seen:
+                seen.add(player[2])
+                yield player
+
+def write_player_urls(players, output_filename, batch_size=1000):
+    """
+    Bulk-write discovered players to a CSV file or, for .db/.sqlite files, a SQLite table
+
+    Args:
+        players (iterable): (player_name, player_id, player_url) tuples
+        output_filename (str): CSV file or SQLite database to write
+        batch_size (int): Rows per executemany call for SQLite
+
+    Returns:
+        int: Number of players written
+    """
+    count = 0
+    if output_filename.endswith(('.db', '.sqlite', '.sqlite3')):
+        conn = sqlite3.connect(output_filename)
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS player_urls (
+                    player_url TEXT PRIMARY KEY,
+                    player_id INTEGER,
+                    player_name TEXT
+                )
+            """)
+            batch = []
+            for player_name, player_id, player_url in players:
+                batch.append((player_url, player_id, player_name))
+                if len(batch) >= batch_size:
+                    conn.executemany("INSERT OR REPLACE INTO player_urls VALUES (?, ?, ?)", batch)
+                    count += len(batch)
+                    batch = []
+            if batch:
+                conn.executemany("INSERT OR REPLACE INTO player_urls VALUES (?, ?, ?)", batch)
+                count += len(batch)
+            conn.commit()
+        finally:
+            conn.close()
+        return count
+
+    with open(output_filename, 'w', newline='', encoding='utf-8') as csvfile:
+        csv_writer = csv.writer(csvfile)
+        csv_writer.writerow(['Name', 'ID', 'URL'])
+        for player in players:
+            csv_writer.writerow(player)
+            count += 1
+    return count
+
+def create_player_urls(html_content):
+    """
+    Extracts player name and ID from the given HTML, constructs URLs,
+    and returns a JSON string with player names as keys and URLs as values.
+
+    Args:
+        html_content (str): The HTML content to parse.
+
+    Returns:
+        str: A JSON string containing a dictionary with player names as keys and URLs as values.
+             Returns '[]' if no player data is found.
+    """
+
+    player_urls = {}
+    for player_name, player_id, player_url in iter_player_urls(html_content):
+        player_urls[player_name] = player_url
+
+    return json.dumps(player_urls, indent=4)  # Convert to JSON string with indentation
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Discover player URLs from the cricket.com players listing")
+    parser.add_argument("sources", nargs="*", default=["https://www.cricket.com/players"],
+                        help="listing URLs or saved HTML files, e.g. every page of a paginated listing")
+    parser.add_argument("--output", help="stream the players into this CSV file or .db SQLite database instead of printing JSON")
+    args = parser.parse_args()
+
+    if args.output:
+        try:
+            count = write_player_urls(discover_players(args.sources), args.output)
+            print(f"Wrote {count} players to {args.output}")
+        except (requests.exceptions.RequestException, OSError) as e:
+            print(f"Error fetching the URL: {e}")
+    else:
+        # URL of the HTML content
+        url = args.sources[0]
+
+        try:
+            response = requests.get(url)
+            response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
+            html_content = response.text
+        except requests.exceptions.RequestException as e:
+            print(f"Error fetching the URL: {e}")
+            html_content = None
+
+        if html_content:
+            player_urls_json = create_player_urls(html_content)
+            print(player_urls_json)
+        else:
+            print("[]")  # Print empty JSON array if no content
@@ -0,0 +1,533 @@
+import importlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+import CrawlState
+import RateControl
+import Schema
+
+# Local primary database (override with the LOCAL_DB environment variable)
+LOCAL_DB = os.environ.get("LOCAL_DB", "cricket_local.db")
+
+# Statements that change data or schema and so must reach the cloud copy
+REPLICATED_STATEMENTS = ("INSERT", "UPDATE", "DELETE", "REPLACE", "CREATE", "ALTER", "DROP")
+SCHEMA_STATEMENTS = ("CREATE", "ALTER", "DROP")
+
+DEFAULT_SYNC_BATCH = 500     # Outbox entries pushed per cloud transaction
+DEFAULT_SYNC_INTERVAL = 2.0  # Seconds between checks for new changes
+
+# Run locally when a store opens, and queued for the cloud as a MIGRATE outbox
+# entry. Migrations rewrite rows by rowid, which differs between the two
+# copies, so the syncer runs the functions themselves on the cloud instead of
+# replaying the statements they ran locally.
+DEFAULT_MIGRATIONS = (Schema.ensure_stats, Schema.ensure_player_points, CrawlState.ensure_table)
+MIGRATE = "MIGRATE"
+
+# Copied from the cloud into a new local database before it is first used
+HYDRATE_TABLES = ("players", "stats", "player_points", "player_average_points", "crawl_state")
+HYDRATE_BATCH = 5000
+
+_ROWID = re.compile(r"\b(rowid|_rowid_|oid)\b", re.IGNORECASE)
+
+def _connect_cloud():
+    # pip install sqlitecloud
+    import sqlitecloud
+    return sqlitecloud.connect("")
+
+def _statement_kind(sql):
+    words = sql.lstrip().split(None, 1)
+    return words[0].upper() if words else ""
+
+def _migration_name(migration):
+    return f"{migration.__module__}.{migration.__name__}"
+
+def _load_migration(name):
+    module, function = name.rsplit(".", 1)
+    return getattr(importlib.import_module(module), function)
+
+def _connect_local(path):
+    conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS sync_outbox (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            statement TEXT NOT NULL,
+            params TEXT,
+            many INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    # Changes the cloud rejected; kept for inspection and requeue_dead_letters()
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS sync_deadletter (
+            seq INTEGER PRIMARY KEY,
+            statement TEXT NOT NULL,
+            params TEXT,
+            many INTEGER NOT NULL DEFAULT 0,
+            error TEXT,
+            failed_at TEXT
+        )
+    """)
+    conn.commit()
+    return conn
+
+class LocalCursor:
+    """
+    Cursor on the local database. Every data or schema change is also
+    appended to sync_outbox in the same transaction, so a change is queued
+    for the cloud exactly when it is committed locally. Changes that refer
+    to rowids are refused: rowids differ between the local and cloud copies.
+    """
+
+    def __init__(self, store):
+        self._store = store
+        self._cursor = store._conn.cursor()
+        self.rowcount = -1
+        self.lastrowid = None
+
+    def _check(self, sql):
+        if _statement_kind(sql) in REPLICATED_STATEMENTS and _ROWID.search(sql):
+            raise Exception("Statements using rowid can't be replayed on the cloud; "
+                            f"run them as a migration instead: {sql.strip()[:80]}")
+
+    def _queue(self, sql, params, many):
+        if _statement_kind(sql) in REPLICATED_STATEMENTS:
+            self._cursor.execute(
+                "INSERT INTO sync_outbox (statement, params, many) VALUES (?, ?, ?)",
+                (sql, json.dumps(params), 1 if many else 0)
+            )
+
+    def execute(self, sql, params=()):
+        self._check(sql)
+        with self._store._lock:
+            if _statement_kind(sql) in SCHEMA_STATEMENTS and not self._store._conn.in_transaction:
+                # sqlite3 runs DDL outside a transaction; open one so the outbox entry commits with it
+                self._cursor.execute("BEGIN")
+            self._cursor.execute(sql, params)
+            rowcount, lastrowid = self._cursor.rowcount, self._cursor.lastrowid
+            self._queue(sql, list(params), many=False)
+            # Report the caller's statement, not the outbox insert
+            self.rowcount, self.lastrowid = rowcount, lastrowid
+        return self
+
+    def executemany(self, sql, seq_of_params):
+        self._check(sql)
+        rows = [list(params) for params in seq_of_params]
+        with self._store._lock:
+            self._cursor.executemany(sql, rows)
+            rowcount = self._cursor.rowcount
+            self._queue(sql, rows, many=True)
+            self.rowcount, self.lastrowid = rowcount, None
+        return self
+
+    def fetchone(self):
+        return self._cursor.fetchone()
+
+    def fetchmany(self, size=None):
+        return self._cursor.fetchmany(size or self._cursor.arraysize)
+
+    def fetchall(self):
+        return self._cursor.fetchall()
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def close(self):
+        self._cursor.close()
+
+class LocalStore:
+    """
+    Connection-like wrapper around the local WAL-mode SQLite primary.
+    Writes run at local-disk speed; a background CloudSyncer pushes the
+    committed changes to SQLite Cloud in batches, so the cloud copy is
+    eventually consistent. Drop-in for the sqlitecloud connection in the
+    pipelines: cursor(), execute(), commit(), rollback(), close().
+    """
+
+    def __init__(self, path=None, connect_cloud=_connect_cloud, sync=True,
+                 sync_batch=DEFAULT_SYNC_BATCH, sync_interval=DEFAULT_SYNC_INTERVAL, migrations=DEFAULT_MIGRATIONS):
+        """
+        Args:
+            path (str): Local database file
+            connect_cloud (callable): Returns a new cloud connection
+            sync (bool): Copy a new local database from the cloud and start the background syncer;
+                False never touches the cloud, changes stay queued for a later run
+            sync_batch (int): Outbox entries pushed per cloud transaction
+            sync_interval (float): Seconds between checks for new changes
+            migrations (iterable): Schema functions taking a cursor, run locally and queued for the cloud
+        """
+        self.path = path or LOCAL_DB
+        self._conn = _connect_local(self.path)
+        self._lock = threading.RLock()
+        self.syncer = None
+        try:
+            if sync and self._is_empty():
+                self._try_hydrate(connect_cloud)
+            self.migrate(migrations)
+        except Exception:
+            self._conn.close()
+            raise
+        if sync:
+            self.syncer = CloudSyncer(self.path, connect_cloud, sync_batch, sync_interval)
+            self.syncer.start()
+
+    def _is_empty(self):
+        # Nothing written locally yet: no rows in the synced tables and no changes queued
+        cursor = self._conn.cursor()
+        if cursor.execute("SELECT COUNT(*) FROM sync_outbox WHERE statement != ?", (MIGRATE,)).fetchone()[0]:
+            return False
+        for table in HYDRATE_TABLES:
+            exists = cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+            ).fetchone()
+            if exists and cursor.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone():
+                return False
+        return True
+
+    def _try_hydrate(self, connect_cloud):
+        try:
+            copied = self.hydrate(connect_cloud)
+            if copied:
+                print(f"Copied {copied} rows from the cloud into {self.path}")
+        except Exception as e:
+            print(f"Could not copy the cloud database, starting with an empty local copy: {str(e)}")
+
+    def hydrate(self, connect_cloud):
+        """
+        Copy the cloud tables into the local database, replacing the local
+        ones. The tables keep the cloud's definitions; the migrations then
+        bring them up to date locally. Only used while the local copy is
+        empty, so nothing local is lost.
+
+        Args:
+            connect_cloud (callable): Returns a cloud connection
+
+        Returns:
+            int: Number of rows copied
+        """
+        cloud = connect_cloud()
+        copied = 0
+        try:
+            remote = cloud.cursor()
+            with self._lock:
+                local = self._conn.cursor()
+                local.execute("BEGIN")
+                try:
+                    for table in HYDRATE_TABLES:
+                        remote.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+                        definition = remote.fetchone()
+                        if definition is None:
+                            continue
+                        remote.execute(f"PRAGMA table_info({table})")
+                        columns = ", ".join(column[1] for column in remote.fetchall())
+                        local.execute(f"DROP TABLE IF EXISTS {table}")
+                        local.execute(definition[0])
+                        remote.execute(f"SELECT {columns} FROM {table}")
+                        insert = f"INSERT INTO {table} ({columns}) VALUES ({', '.join('?' * len(columns.split(', ')))})"
+                        while True:
+                            rows = remote.fetchmany(HYDRATE_BATCH)
+                            if not rows:
+                                break
+                            local.executemany(insert, rows)
+                            copied += len(rows)
+                    self._conn.commit()
+                except Exception:
+                    self._conn.rollback()
+                    raise
+        finally:
+            cloud.close()
+        return copied
+
+    def migrate(self, migrations):
+        """
+        Bring the local schema up to date and queue the same migrations for
+        the cloud. The syncer runs the migration functions on the cloud in
+        outbox order, so the cloud migrates its own rows and no change queued
+        after this reaches it before its schema does. Needs no connection.
+
+        Args:
+            migrations (iterable): Schema functions taking a cursor
+        """
+        migrations = list(migrations)
+        if not migrations:
+            return
+        names = json.dumps([_migration_name(migration) for migration in migrations])
+        with self._lock:
+            cursor = self._conn.cursor()
+            for migration in migrations:
+                migration(cursor)
+            # One pending run of the same migrations is enough
+            queued = cursor.execute(
+                "SELECT 1 FROM sync_outbox WHERE statement = ? AND params = ? LIMIT 1", (MIGRATE, names)
+            ).fetchone()
+            if not queued:
+                cursor.execute("INSERT INTO sync_outbox (statement, params, many) VALUES (?, ?, 0)", (MIGRATE, names))
+            self._conn.commit()
+
+    def cursor(self):
+        return LocalCursor(self)
+
+    def execute(self, sql, params=()):
+        return self.cursor().execute(sql, params)
+
+    def commit(self):
+        with self._lock:
+            self._conn.commit()
+        if self.syncer:
+            self.syncer.wake()
+
+    def rollback(self):
+        with self._lock:
+            self._conn.rollback()
+
+    def close(self, sync_timeout=60):
+        """
+        Commit, push what is left in the outbox (waiting up to sync_timeout
+        seconds) and stop the syncer. Anything not pushed stays in the outbox
+        for the next run.
+        """
+        self.commit()
+        if self.syncer:
+            self.syncer.stop(sync_timeout)
+        self._conn.close()
+
+class CloudSyncer(threading.Thread):
+    """
+    Background thread that replays sync_outbox on the cloud database in
+    order, one batch per cloud transaction, and deletes entries once the
+    cloud has committed them. When a batch fails its entries are retried one
+    at a time: an entry the cloud rejects while the connection is healthy
+    is moved to sync_deadletter so the rest can go through, and a connection
+    failure leaves the entries in place and backs off before trying again.
+    A MIGRATE entry runs the named schema functions on the cloud; if one
+    fails the syncer stops with the entry still queued, since every change
+    after it expects the new schema.
+    """
+
+    def __init__(self, path, connect_cloud=_connect_cloud, batch_size=DEFAULT_SYNC_BATCH,
+                 interval=DEFAULT_SYNC_INTERVAL):
+        super().__init__(name="cloud-sync", daemon=True)
+        self.path = path
+        self.connect_cloud = connect_cloud
+        self.batch_size = batch_size
+        self.interval = interval
+        self.synced = 0
+        self.failures = 0
+        self.dead = 0
+        self.error = None
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._cloud = None
+
+    def wake(self):
+        self._wake.set()
+
+    def pending(self, local=None):
+        """
+        Number of changes not yet pushed to the cloud
+        """
+        conn = local or sqlite3.connect(self.path, timeout=30)
+        try:
+            return conn.execute("SELECT COUNT(*) FROM sync_outbox").fetchone()[0]
+        finally:
+            if local is None:
+                conn.close()
+
+    def _push_batch(self, local):
+        entries = local.execute(
+            "SELECT seq, statement, params, many FROM sync_outbox ORDER BY seq LIMIT ?", (self.batch_size,)
+        ).fetchall()
+        if not entries:
+            return 0
+        try:
+            self._apply(entries)
+        except Exception as e:
+            if not self._cloud_healthy():
+                raise
+            print(f"Cloud rejected a batch of {len(entries)} changes, retrying them one at a time: {str(e)}")
+            return self._push_singly(local, entries)
+        self._done(local, entries)
+        return len(entries)
+
+    def _push_singly(self, local, entries):
+        for pushed, entry in enumerate(entries):
+            try:
+                self._apply([entry])
+            except Exception as e:
+                if not self._cloud_healthy():
+                    raise  # Connection trouble, not this entry: back off and retry
+                if entry[1] == MIGRATE:
+                    self.error = f"Could not migrate the cloud database: {str(e)}"
+                    print(f"{self.error}; sync stopped, changes stay in the outbox")
+                    return pushed
+                self._dead_letter(local, entry, e)
+                continue
+            self._done(local, [entry])
+        return len(entries)
+
+    def _apply(self, entries):
+        if self._cloud is None:
+            self._cloud = self.connect_cloud()
+        cursor = self._cloud.cursor()
+        try:
+            # Consecutive single-row writes of the same statement go out as one executemany
+            group_sql, group_rows = None, []
+            for seq, statement, params, many in entries:
+                params = json.loads(params) if params else []
+                if many or statement != group_sql or _statement_kind(statement) in SCHEMA_STATEMENTS + (MIGRATE,):
+                    self._flush_group(cursor, group_sql, group_rows)
+                    group_sql, group_rows = None, []
+                if statement == MIGRATE:
+                    for name in params:
+                        _load_migration(name)(cursor)
+                elif many:
+                    if params:
+                        cursor.executemany(statement, params)
+                elif _statement_kind(statement) in SCHEMA_STATEMENTS:
+                    cursor.execute(statement, params)
+                else:
+                    group_sql = statement
+                    group_rows.append(params)
+            self._flush_group(cursor, group_sql, group_rows)
+            self._cloud.commit()
+        except Exception:
+            try:
+                self._cloud.rollback()
+            except Exception:
+                self._cloud = None  # Reconnect next time
+            raise
+
+    def _done(self, local, entries):
+        local.execute("DELETE FROM sync_outbox WHERE seq <= ?", (entries[-1][0],))
+        local.commit()
+        self.synced += len(entries)
+
+    def _dead_letter(self, local, entry, error):
+        seq, statement, params, many = entry
+        print(f"Cloud rejected change {seq}, moved to sync_deadletter: {str(error)}")
+        local.execute(
+            "INSERT OR REPLACE INTO sync_deadletter (seq, statement, params, many, error, failed_at) "
+            "VALUES (?, ?, ?, ?, ?, datetime('now'))", (seq, statement, params, many, str(error))
+        )
+        local.execute("DELETE FROM sync_outbox WHERE seq = ?", (seq,))
+        local.commit()
+        self.dead += 1
+
+    def _cloud_healthy(self):
+        try:
+            if self._cloud is None:
+                self._cloud = self.connect_cloud()
+            cursor = self._cloud.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+            return True
+        except Exception:
+            self._cloud = None
+            return False
+
+    def _flush_group(self, cursor, sql, rows):
+        if sql is None or not rows:
+            return
+        if len(rows) == 1:
+            cursor.execute(sql, rows[0])
+        else:
+            cursor.executemany(sql, rows)
+
+    def run(self):
+        local = sqlite3.connect(self.path, timeout=30)
+        attempt = 0
+        try:
+            while True:
+                try:
+                    pushed = self._push_batch(local)
+                    attempt = 0
+                    if self.error:
+                        break
+                except Exception as e:
+                    self.failures += 1
+                    attempt += 1
+                    delay = RateControl.backoff_delay(attempt)
+                    print(f"Cloud sync failed, retrying in {delay:.1f}s: {str(e)}")
+                    if self._stopping.wait(delay):
+                        break
+                    continue
+                if pushed:
+                    continue  # More may be waiting
+                if self._stopping.is_set():
+                    break
+                self._wake.wait(self.interval)
+                self._wake.clear()
+        finally:
+            local.close()
+            if self._cloud is not None:
+                self._cloud.close()
+
+    def stop(self, timeout=60):
+        """
+        Push what is left, then stop. Waits up to `timeout` seconds.
+        """
+        self._stopping.set()
+        self._wake.set()
+        self.join(timeout)
+        left = self.pending()
+        if left:
+            print(f"{left} changes not yet synced to the cloud; they will be pushed on the next run")
+
+def requeue_dead_letters(path=None):
+    """
+    Move the changes the cloud rejected back into the outbox, e.g. once the
+    cloud schema has been fixed. They keep their original order.
+
+    Args:
+        path (str): Local database file
+
+    Returns:
+        int: Number of changes requeued
+    """
+    conn = _connect_local(path or LOCAL_DB)
+    try:
+        moved = conn.execute("""
+            INSERT INTO sync_outbox (seq, statement, params, many)
+            SELECT seq, statement, params, many FROM sync_deadletter ORDER BY seq
+        """).rowcount
+        conn.execute("DELETE FROM sync_deadletter")
+        conn.commit()
+        return moved
+    finally:
+        conn.close()
+
+def open_store(path=None, **kwargs):
+    """
+    Open the local primary with background sync to SQLite Cloud
+
+    Args:
+        path (str): Local database file
+        **kwargs: LocalStore options
+
+    Returns:
+        LocalStore
+    """
+    return LocalStore(path, **kwargs)
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Push pending local changes to SQLite Cloud")
+    parser.add_argument("--db", help=f"local database file (default {LOCAL_DB})")
+    parser.add_argument("--timeout", type=float, default=300, help="seconds to wait for the sync to finish")
+    parser.add_argument("--requeue", action="store_true", help="retry the changes the cloud rejected earlier")
+    args = parser.parse_args()
+
+    if args.requeue:
+        print(f"Requeued {requeue_dead_letters(args.db)} rejected changes")
+    store = open_store(args.db)
+    print(f"{store.syncer.pending()} changes pending")
+    start = time.perf_counter()
+    store.close(sync_timeout=args.timeout)
+    print(f"Synced {store.syncer.synced} changes in {time.perf_counter() - start:.1f}s")
+    if store.syncer.dead:
+        print(f"{store.syncer.dead} changes rejected by the cloud; see sync_deadletter")
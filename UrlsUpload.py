@@ -1,75 +1,171 @@
-
-from pymongo.mongo_client import MongoClient
-from pymongo.server_api import ServerApi
-import csv
-import pymongo
-
-def upload_players_to_mongodb(player_data):
-    """
-    Uploads player names and URLs to a MongoDB database.
-
-    Args:
-        player_data (list): A list of dictionaries containing player names and URLs.
-        db_name (str): The name of the database to connect to. Defaults to 'cricket'.
-        collection_name (str): The name of the collection to store player data. Defaults to 'players'.
-
-    Returns:
-        None
-    """
-    try:
-        # Connect to MongoDB
-        uri = ""
-
-        # Create a new client and connect to the server
-        client = MongoClient(uri, server_api=ServerApi('1'))
-
-        # Send a ping to confirm a successful connection
-        try:
-            client.admin.command('ping')
-            print("Pinged your deployment. You successfully connected to MongoDB!")
-        except Exception as e:
-            print(e)
-
-        # Access database and collection
-        db = client["cricket"]
-        collection = db["players"]
-
-        # Insert player data into the collection
-        result = collection.insert_many(player_data)
-        
-        print(f"Inserted {len(result.inserted_ids)} players into the collection.")
-    
-    except Exception as e:
-        print(f"An error occurred: {e}")
-
-def process_csv(filename):
-    """Process CSV file and upsert embeddings to Pinecone"""
-    urls = []
-    with open(filename, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        next(reader)  # Skip header row
-        
-        vectors = []
-        for row_id, row in enumerate(reader):
-            if len(row) < 3:
-                continue
-                
-            # Extract 3rd column value
-            text = row[2].strip()
-            
-            url = {
-                "player_name": " ".join(text.split("/")[4].split("-")[0:-1]).title(),
-                "url": row[2]
-            }
-            print(url["player_name"])
-
-            urls.append(url)
-    return urls
-
-
-# Example player data
-filename = "player_urls.csv"
-player_data = process_csv(filename)
-
-# Upload players to MongoDB
-upload_players_to_mongodb(player_data)
+
+from pymongo.mongo_client import MongoClient
+from pymongo.server_api import ServerApi
+from pymongo import UpdateOne
+import csv
+import pymongo
+
+from Schema import player_id_from_url
+
+# Documents per bulk_write call
+DEFAULT_CHUNK_SIZE = 1000
+
+def dedupe_players(collection):
+    """
+    Prepare a collection filled by earlier insert_many runs for the unique index:
+    fill in missing player IDs from the URL and delete all but one document per player
+
+    Args:
+        collection: MongoDB collection
+
+    Returns:
+        int: Number of duplicate documents deleted
+    """
+    backfill = []
+    for doc in collection.find({"player_id": {"$exists": False}}, {"url": 1}):
+        player_id = player_id_from_url(doc.get("url", ""))
+        if player_id is not None:
+            backfill.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"player_id": player_id}}))
+    for start in range(0, len(backfill), DEFAULT_CHUNK_SIZE):
+        collection.bulk_write(backfill[start:start + DEFAULT_CHUNK_SIZE], ordered=False)
+
+    duplicates = collection.aggregate([
+        {"$match": {"player_id": {"$ne": None}}},
+        {"$group": {"_id": "$player_id", "ids": {"$push": "$_id"}, "count": {"$sum": 1}}},
+        {"$match": {"count": {"$gt": 1}}},
+    ], allowDiskUse=True)
+    extra_ids = [doc_id for group in duplicates for doc_id in group["ids"][1:]]
+    deleted = 0
+    for start in range(0, len(extra_ids), DEFAULT_CHUNK_SIZE):
+        deleted += collection.delete_many({"_id": {"$in": extra_ids[start:start + DEFAULT_CHUNK_SIZE]}}).deleted_count
+    return deleted
+
+def upsert_players(collection, player_data, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Insert new players and update changed ones, keyed on the cricket.com player ID.
+    Safe to re-run: players already stored with the same name and URL are left alone.
+
+    Args:
+        collection: MongoDB collection
+        player_data (list): Dictionaries with player_id, player_name and url
+        chunk_size (int): Operations per unordered bulk_write call
+
+    Returns:
+        dict: Counts of inserted, updated, unchanged and skipped players
+    """
+    summary = {"inserted": 0, "updated": 0, "unchanged": 0, "skipped": 0}
+
+    # One operation per player; two upserts of a new ID in the same unordered batch would race
+    players = {}
+    for player in player_data:
+        if player.get("player_id") is None:
+            summary["skipped"] += 1
+            continue
+        players[player["player_id"]] = player
+
+    operations = [
+        UpdateOne(
+            {"player_id": player_id},
+            {"$set": {"player_name": player["player_name"], "url": player["url"]}},
+            upsert=True
+        )
+        for player_id, player in players.items()
+    ]
+
+    for start in range(0, len(operations), chunk_size):
+        chunk = operations[start:start + chunk_size]
+        try:
+            result = collection.bulk_write(chunk, ordered=False).bulk_api_result
+        except pymongo.errors.BulkWriteError as e:
+            # Unordered: the rest of the chunk was still applied
+            result = e.details
+            summary["skipped"] += len(result.get("writeErrors", []))
+            print(f"{len(result.get('writeErrors', []))} players in a chunk could not be written")
+        summary["inserted"] += result.get("nUpserted", 0)
+        summary["updated"] += result.get("nModified", 0)
+        summary["unchanged"] += result.get("nMatched", 0) - result.get("nModified", 0)
+    return summary
+
+def upload_players_to_mongodb(player_data, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Uploads player names and URLs to a MongoDB database.
+
+    Args:
+        player_data (list): A list of dictionaries containing player IDs, names and URLs.
+        chunk_size (int): Operations per bulk write. Defaults to 1000.
+
+    Returns:
+        dict: Counts of inserted, updated, unchanged and skipped players, or None on error
+    """
+    try:
+        # Connect to MongoDB
+        uri = ""
+
+        # Create a new client and connect to the server
+        client = MongoClient(uri, server_api=ServerApi('1'))
+
+        # Send a ping to confirm a successful connection
+        try:
+            client.admin.command('ping')
+            print("Pinged your deployment. You successfully connected to MongoDB!")
+        except Exception as e:
+            print(e)
+
+        # Access database and collection
+        db = client["cricket"]
+        collection = db["players"]
+
+        # One document per player: clean up earlier duplicate uploads, then enforce it
+        deleted = dedupe_players(collection)
+        if deleted:
+            print(f"Removed {deleted} duplicate players from the collection.")
+        collection.create_index("player_id", unique=True)
+
+        # Upsert player data into the collection
+        summary = upsert_players(collection, player_data, chunk_size)
+
+        print(f"Inserted {summary['inserted']}, updated {summary['updated']}, "
+              f"unchanged {summary['unchanged']}, skipped {summary['skipped']} players.")
+        return summary
+    
+    except Exception as e:
+        print(f"An error occurred: {e}")
+
+def process_csv(filename):
+    """Process CSV file and upsert embeddings to Pinecone"""
+    urls = []
+    with open(filename, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        next(reader)  # Skip header row
+        
+        vectors = []
+        for row_id, row in enumerate(reader):
+            if len(row) < 3:
+                continue
+                
+            # Extract 3rd column value
+            text = row[2].strip()
+            
+            try:
+                player_id = int(row[1])
+            except ValueError:
+                player_id = player_id_from_url(text)
+
+            url = {
+                "player_id": player_id,
+                "player_name": " ".join(text.split("/")[4].split("-")[0:-1]).title(),
+                "url": row[2]
+            }
+            print(url["player_name"])
+
+            urls.append(url)
+    return urls
+
+
+if __name__ == "__main__":
+    # Example player data
+    filename = "player_urls.csv"
+    player_data = process_csv(filename)
+
+    # Upload players to MongoDB
+    upload_players_to_mongodb(player_data)
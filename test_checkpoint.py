@@ -0,0 +1,66 @@
+# Resuming an interrupted crawl from the checkpoint log:
+#
+#   python -m pytest test_checkpoint.py
+
+import Checkpoint
+
+URLS = [f"https://example.com/players/p-{i}" for i in range(5)]
+
+
+def test_resume_skips_only_committed_urls(tmp_path):
+    path = str(tmp_path / "checkpoint.db")
+    log = Checkpoint.CheckpointLog(path)
+    log.start(URLS)
+    log.mark(URLS[0], Checkpoint.STORED)
+    log.mark(URLS[2], Checkpoint.STORED)
+    log.commit()
+    # Not committed when the crawl dies, so it must be crawled again
+    log.mark(URLS[1], Checkpoint.STORED)
+    log.conn.rollback()
+    log.close()
+
+    log = Checkpoint.CheckpointLog(path)
+    assert log.resume() == [(URLS[1], Checkpoint.PENDING), (URLS[3], Checkpoint.PENDING),
+                            (URLS[4], Checkpoint.PENDING)]
+    log.close()
+
+
+def test_failed_urls_are_retried_on_resume(tmp_path):
+    path = str(tmp_path / "checkpoint.db")
+    log = Checkpoint.CheckpointLog(path)
+    log.start(URLS[:2])
+    log.mark(URLS[0], Checkpoint.FAILED, error="HTTP 503")
+    log.mark(URLS[1], Checkpoint.STORED)
+    log.commit()
+    log.close()
+
+    log = Checkpoint.CheckpointLog(path)
+    assert log.resume() == [(URLS[0], Checkpoint.FAILED)]
+    log.close()
+
+
+def test_finished_run_is_not_resumed(tmp_path):
+    path = str(tmp_path / "checkpoint.db")
+    log = Checkpoint.CheckpointLog(path)
+    log.start(URLS)
+    for url in URLS:
+        log.mark(url, Checkpoint.STORED)
+    log.finish()
+    log.close()
+
+    log = Checkpoint.CheckpointLog(path)
+    assert log.resume() is None
+    log.close()
+
+
+def test_commit_due_after_batch_size_stored(tmp_path):
+    log = Checkpoint.CheckpointLog(str(tmp_path / "checkpoint.db"), batch_size=2)
+    log.start(URLS)
+    log.mark(URLS[0], Checkpoint.FETCHED)
+    log.mark(URLS[0], Checkpoint.STORED)
+    assert not log.commit_due()
+    log.mark(URLS[1], Checkpoint.STORED)
+    assert log.commit_due()
+    log.commit()
+    assert not log.commit_due()
+    log.close()
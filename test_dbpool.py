@@ -0,0 +1,84 @@
+# Shared and private checkouts from the connection pool, with SQLite files standing in for SQLite Cloud:
+#
+#   python -m pytest test_dbpool.py
+
+import sqlite3
+import threading
+
+import pytest
+
+import DbPool
+
+
+@pytest.fixture
+def pool(tmp_path):
+    path = str(tmp_path / "pool.db")
+    pool = DbPool.ConnectionPool(connect=lambda: sqlite3.connect(path, check_same_thread=False),
+                                 max_size=2, timeout=0.2)
+    yield pool
+    pool.close()
+
+
+def test_nested_shared_checkouts_reuse_the_connection(pool):
+    outer = pool.acquire()
+    inner = pool.acquire()
+    assert inner is outer
+    pool.release(inner)
+    assert pool.stats()["idle"] == 0  # The outer checkout still holds it
+    pool.release(outer)
+    assert pool.stats() == {"open": 1, "idle": 1, "opened": 1, "recycled": 0}
+
+
+def test_private_checkout_gets_its_own_connection(pool):
+    shared = pool.acquire()
+    private = pool.acquire(shared=False)
+    assert private is not shared
+    pool.release(private)
+    pool.release(shared)
+    assert pool.stats()["idle"] == 2
+
+
+def test_threads_get_different_connections(pool):
+    seen = []
+
+    def work():
+        with pool.connection() as conn:
+            seen.append(conn)
+            barrier.wait()
+
+    barrier = threading.Barrier(2)
+    threads = [threading.Thread(target=work) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert seen[0] is not seen[1]
+
+
+def test_checkout_times_out_when_pool_is_exhausted(pool):
+    held = [pool.acquire(shared=False), pool.acquire(shared=False)]
+    with pytest.raises(Exception, match="No database connection free"):
+        pool.acquire(shared=False)
+    for conn in held:
+        pool.release(conn)
+
+
+def test_failed_checkout_rolls_back(pool):
+    with pool.connection() as conn:
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.commit()
+    with pytest.raises(ValueError):
+        with pool.connection() as conn:
+            conn.execute("INSERT INTO t VALUES (1)")
+            raise ValueError("boom")
+    with pool.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+
+def test_closed_pool_refuses_checkouts(pool):
+    conn = pool.acquire()
+    pool.close()
+    with pytest.raises(Exception, match="closed"):
+        pool.acquire(shared=False)
+    pool.release(conn)
+    assert pool.stats()["open"] == 0
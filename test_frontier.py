@@ -0,0 +1,69 @@
+# Claiming, completing and failing players in the SQLite frontier:
+#
+#   python -m pytest test_frontier.py
+
+from datetime import datetime, timedelta
+
+import pytest
+
+import Frontier
+
+NOW = datetime(2025, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def frontier(tmp_path):
+    frontier = Frontier.Frontier(str(tmp_path / "frontier.db"))
+    frontier.add_players([
+        {"player_id": player_id, "player_name": f"Player {player_id}", "url": f"https://example.com/players/p-{player_id}"}
+        for player_id in range(1, 6)
+    ])
+    yield frontier
+    frontier.close()
+
+
+def urls(players):
+    return [player["url"] for player in players]
+
+
+def test_each_player_is_claimed_once(frontier):
+    first = frontier.claim("a", limit=3, now=NOW)
+    second = frontier.claim("b", now=NOW)
+
+    assert len(first) == 3
+    assert len(second) == 2
+    assert not set(urls(first)) & set(urls(second))
+    assert frontier.claim("c", now=NOW) == []
+    assert frontier.summary() == {Frontier.CLAIMED: 5}
+
+
+def test_completed_player_waits_until_due(frontier):
+    player = frontier.claim("a", limit=1, now=NOW)[0]
+    frontier.complete(player["url"], next_fetch_at=NOW + timedelta(hours=6))
+    frontier.release("a")
+
+    assert player["url"] not in urls(frontier.claim("a", now=NOW + timedelta(hours=1)))
+    frontier.release("a")
+    assert player["url"] in urls(frontier.claim("a", now=NOW + timedelta(hours=7)))
+
+
+def test_failed_player_keeps_its_error_and_retries_later(frontier):
+    player = frontier.claim("a", limit=1, now=NOW)[0]
+    frontier.fail(player["url"], error="HTTP 503", retry_at=NOW + timedelta(hours=1))
+
+    status, error = frontier.conn.execute(
+        "SELECT status, error FROM players WHERE url = ?", (player["url"],)
+    ).fetchone()
+    assert (status, error) == (Frontier.FAILED, "HTTP 503")
+    assert player["url"] not in urls(frontier.claim("b", now=NOW))
+    assert player["url"] in urls(frontier.claim("b", now=NOW + timedelta(hours=2)))
+
+
+def test_release_and_stale_claims(frontier):
+    frontier.claim("a", limit=2, now=NOW)
+    assert frontier.release("a") == 2
+
+    frontier.claim("a", now=NOW)
+    # A worker that died keeps its claims until the lease runs out
+    assert frontier.claim("b", now=NOW + timedelta(minutes=10)) == []
+    assert len(frontier.claim("b", now=NOW + Frontier.DEFAULT_LEASE + timedelta(minutes=1))) == 5
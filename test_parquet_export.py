@@ -0,0 +1,68 @@
+# Incremental Parquet export of stats from a local SQLite file:
+#
+#   python -m pytest test_parquet_export.py
+
+import sqlite3
+
+import pytest
+
+import Schema
+
+# Importing ParquetExport needs pyarrow
+ParquetExport = pytest.importorskip("ParquetExport")
+
+
+def upsert(conn, player_id, date, runs, fmt="T20s"):
+    entry = {"date": date, "opponent": "A vs B", "runs": runs, "format": fmt}
+    conn.execute(Schema.STATS_UPSERT, Schema.stats_row(entry, player_id=player_id))
+    conn.commit()
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / "stats.db"))
+    Schema.ensure_stats(conn.cursor())
+    upsert(conn, 1, "2025-01-05", 10)
+    upsert(conn, 2, "2025-01-06", 20)
+    upsert(conn, 1, "2025-02-05", 30)
+    yield conn
+    conn.close()
+
+
+def export(conn, export_dir):
+    return ParquetExport.export_all(conn, str(export_dir), tables=["stats"])["stats"]
+
+
+def runs_by_month(export_dir):
+    table = ParquetExport.read_table("stats", columns=["month", "runs_scored"], export_dir=str(export_dir))
+    return sorted(zip(table.column("month").to_pylist(), table.column("runs_scored").to_pylist()))
+
+
+def test_unchanged_table_is_not_exported_again(conn, tmp_path):
+    export_dir = tmp_path / "parquet"
+    assert export(conn, export_dir) == 3
+    assert export(conn, export_dir) == 0
+    assert runs_by_month(export_dir) == [("2025-01", 10), ("2025-01", 20), ("2025-02", 30)]
+
+
+def test_only_changed_partitions_are_rewritten(conn, tmp_path):
+    export_dir = tmp_path / "parquet"
+    export(conn, export_dir)
+
+    upsert(conn, 1, "2025-02-05", 35)  # Updated in place: same row count, newer updated_at
+    assert export(conn, export_dir) == 1
+    assert runs_by_month(export_dir) == [("2025-01", 10), ("2025-01", 20), ("2025-02", 35)]
+
+    upsert(conn, 3, "2025-03-01", 40)
+    assert export(conn, export_dir) == 1
+    assert runs_by_month(export_dir)[-1] == ("2025-03", 40)
+
+
+def test_deleted_partition_is_removed(conn, tmp_path):
+    export_dir = tmp_path / "parquet"
+    export(conn, export_dir)
+
+    conn.execute("DELETE FROM stats WHERE date LIKE '2025-02-%'")
+    conn.commit()
+    assert export(conn, export_dir) == 0
+    assert runs_by_month(export_dir) == [("2025-01", 10), ("2025-01", 20)]
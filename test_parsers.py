@@ -0,0 +1,66 @@
+# Every way of reading a player page must give the same match dicts:
+#
+#   python -m pytest test_parsers.py
+
+import os
+
+import pytest
+
+import JsonExtractor
+import ParserBackends
+
+# Importing DemoFinal pulls in the crawler's dependencies (pymongo, ...)
+DemoFinal = pytest.importorskip("DemoFinal")
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PAGES = ["Index.html", "cricket_match_data.html"]
+
+
+def read_page(name):
+    with open(os.path.join(HERE, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+@pytest.fixture(scope="module", params=PAGES)
+def page(request):
+    html = read_page(request.param)
+    # html.parser over the whole page is the reference every other path must match
+    return html, DemoFinal.scrape_player_match_stats(html, backend="html.parser", use_payload=False)
+
+
+def test_reference_has_matches(page):
+    _, (player_name, matches) = page
+    assert player_name
+    assert matches
+    assert all(match["date"] and match["opponent"] for match in matches)
+
+
+@pytest.mark.parametrize("backend", ParserBackends.available_backends())
+def test_backends_match_reference(page, backend):
+    html, expected = page
+    assert DemoFinal.scrape_player_match_stats(html, backend=backend, use_payload=False) == expected
+
+
+def test_auto_backend_matches_reference(page):
+    html, expected = page
+    assert DemoFinal.scrape_player_match_stats(html, backend="auto", use_payload=False) == expected
+
+
+def test_payload_matches_reference(page):
+    html, expected = page
+    result = JsonExtractor.scrape_from_payload(html)
+    if result is None:
+        pytest.skip("page has no embedded JSON payload")
+    assert result == expected
+
+
+def test_default_path_matches_reference(page):
+    # Uses the payload when present, the table otherwise
+    html, expected = page
+    assert DemoFinal.scrape_player_match_stats(html) == expected
+
+
+def test_opponent_whitespace_is_normalized(page):
+    _, (_, matches) = page
+    for match in matches:
+        assert match["opponent"] == " ".join(match["opponent"].split())
@@ -0,0 +1,61 @@
+# Refresh scheduling and failure backoff against crawl_state in a local SQLite file:
+#
+#   python -m pytest test_scheduler.py
+
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+import CrawlState
+import Scheduler
+
+NOW = datetime(2025, 1, 1, 12, 0, 0)
+URL = "https://example.com/players/p-1"
+
+
+@pytest.fixture
+def cursor(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / "crawl.db"))
+    cursor = conn.cursor()
+    CrawlState.ensure_table(cursor)
+    yield cursor
+    conn.close()
+
+
+def test_failure_backoff_doubles_up_to_the_cap():
+    assert Scheduler.failure_backoff(0) == timedelta(0)
+    assert Scheduler.failure_backoff(1) == Scheduler.MIN_INTERVAL
+    assert Scheduler.failure_backoff(2) == 2 * Scheduler.MIN_INTERVAL
+    assert Scheduler.failure_backoff(3) == 4 * Scheduler.MIN_INTERVAL
+    assert Scheduler.failure_backoff(50) == Scheduler.MAX_INTERVAL
+
+
+def test_repeated_failures_back_off_and_success_resets(cursor):
+    scheduler = Scheduler.build_scheduler(cursor, [{"url": URL}], now=NOW)
+    first = scheduler.record_failure(cursor, URL, now=NOW)
+    second = scheduler.record_failure(cursor, URL, now=NOW)
+
+    assert first == NOW + Scheduler.MIN_INTERVAL
+    assert second == NOW + 2 * Scheduler.MIN_INTERVAL
+    cursor.execute("SELECT failures, next_fetch_at FROM crawl_state WHERE player_url = ?", (URL,))
+    assert cursor.fetchone() == (2, second.strftime(Scheduler.TIME_FORMAT))
+
+    matches = [{"date": "2024-12-20"}, {"date": "2024-12-27"}]
+    scheduler.record_success(cursor, URL, matches, now=NOW)
+    assert scheduler.record_failure(cursor, URL, now=NOW) == NOW + Scheduler.MIN_INTERVAL
+
+
+def test_backed_off_player_is_not_due_until_its_retry(cursor):
+    Scheduler.RefreshScheduler().record_failure(cursor, URL, now=NOW)
+
+    scheduler = Scheduler.build_scheduler(cursor, [{"url": URL}, {"url": "new"}], now=NOW)
+    assert [doc["url"] for doc in scheduler.due(now=NOW)] == ["new"]
+    assert [doc["url"] for doc in scheduler.due(now=NOW + Scheduler.MIN_INTERVAL)] == [URL]
+
+
+def test_upcoming_players_come_first(cursor):
+    docs = [{"url": "a"}, {"url": "b", "player_name": "Fixture Player"}]
+    scheduler = Scheduler.build_scheduler(cursor, docs, upcoming=["Fixture Player"], now=NOW)
+
+    assert [doc["url"] for doc in scheduler.due(now=NOW)] == ["b", "a"]
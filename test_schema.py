@@ -0,0 +1,74 @@
+# Migrations of the stats and player_points tables on a local SQLite file:
+#
+#   python -m pytest test_schema.py
+
+import sqlite3
+
+import pytest
+
+import Schema
+
+
+@pytest.fixture
+def cursor(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / "schema.db"))
+    yield conn.cursor()
+    conn.close()
+
+
+def test_match_key_prefers_match_id():
+    assert Schema.match_key(257222, "2025-03-28", "A vs B") == "id:257222"
+    assert Schema.match_key(None, "2025-03-28", "Chennai\n    Super Kings vs B") == "2025-03-28|Chennai Super Kings vs B"
+
+
+def test_ensure_stats_rekeys_name_keyed_rows(cursor):
+    # Stats as written before the players table: keyed on the name, stored twice by reruns
+    cursor.execute("CREATE TABLE stats (player_name TEXT, opponent TEXT, runs_scored INTEGER, date TEXT)")
+    cursor.executemany("INSERT INTO stats VALUES (?, ?, ?, ?)", [
+        ("Virat Kohli", "India vs  Australia", 10, "2025-01-01"),
+        ("Virat Kohli", "India vs Australia", 12, "2025-01-01"),
+        ("Virat Kohli", "India vs England", 50, "2025-02-01"),
+    ])
+    Schema.ensure_players(cursor)
+    cursor.execute(Schema.PLAYERS_UPSERT, (3993, "Virat Kohli", "https://www.cricket.com/players/virat-kohli-3993"))
+
+    Schema.ensure_stats(cursor)
+
+    cursor.execute("SELECT player_id, match_key, runs_scored FROM stats ORDER BY date")
+    assert cursor.fetchall() == [
+        (3993, "2025-01-01|India vs Australia", 12),
+        (3993, "2025-02-01|India vs England", 50),
+    ]
+    assert Schema.STATS_KEY_INDEX in Schema._existing_indexes(cursor, "stats")
+
+
+def test_stats_upsert_replaces_the_same_match(cursor):
+    Schema.ensure_stats(cursor)
+    entry = {"opponent": "India vs Australia", "runs": 10, "date": "2025-01-01", "match_id": 1}
+    cursor.execute(Schema.STATS_UPSERT, Schema.stats_row(entry, player_id=3993))
+    cursor.execute(Schema.STATS_UPSERT, Schema.stats_row(dict(entry, runs=25), player_id=3993))
+
+    cursor.execute("SELECT player_id, match_key, runs_scored FROM stats")
+    assert cursor.fetchall() == [(3993, "id:1", 25)]
+
+
+def test_ensure_stats_is_idempotent(cursor):
+    Schema.ensure_stats(cursor)
+    cursor.execute(Schema.STATS_UPSERT, Schema.stats_row({"date": "2025-01-01", "opponent": "A vs B"}, player_id=1))
+    Schema.ensure_stats(cursor)
+
+    cursor.execute("SELECT COUNT(*) FROM stats")
+    assert cursor.fetchone()[0] == 1
+
+
+def test_ensure_player_points_drops_keyless_rows_and_upserts(cursor):
+    # Appended once per run, with no way to tell which match a point belongs to
+    cursor.execute("CREATE TABLE player_points (player_name TEXT, point REAL)")
+    cursor.executemany("INSERT INTO player_points VALUES (?, ?)", [("Virat Kohli", 10.0)] * 3)
+
+    Schema.ensure_player_points(cursor)
+    cursor.execute(Schema.PLAYER_POINTS_UPSERT, (3993, "id:1", 10.0))
+    cursor.execute(Schema.PLAYER_POINTS_UPSERT, (3993, "id:1", 12.5))
+
+    cursor.execute("SELECT player_id, match_key, point FROM player_points")
+    assert cursor.fetchall() == [(3993, "id:1", 12.5)]
@@ -0,0 +1,108 @@
+# The local store and its cloud outbox, with a second SQLite file standing in for SQLite Cloud:
+#
+#   python -m pytest test_storage.py
+
+import sqlite3
+
+import pytest
+
+import Schema
+import Storage
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return str(tmp_path / "local.db"), str(tmp_path / "cloud.db")
+
+
+def connector(path):
+    return lambda: sqlite3.connect(path, check_same_thread=False)
+
+
+def open_store(local, cloud, **kwargs):
+    return Storage.LocalStore(local, connect_cloud=connector(cloud), sync_interval=0.05, **kwargs)
+
+
+def query(path, sql):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(sql).fetchall()
+    finally:
+        conn.close()
+
+
+def test_changes_and_migrations_reach_the_cloud(paths):
+    local, cloud = paths
+    store = open_store(local, cloud)
+    store.execute(Schema.STATS_UPSERT, Schema.stats_row({"date": "2025-01-01", "match_id": 1, "runs": 7}, player_id=3))
+    store.close(sync_timeout=10)
+
+    assert query(cloud, "SELECT player_id, match_key, runs_scored FROM stats") == [(3, "id:1", 7)]
+    # The cloud ran the migrations itself, so it has the natural key too
+    assert query(cloud, f"SELECT name FROM sqlite_master WHERE name = '{Schema.STATS_KEY_INDEX}'")
+    assert query(local, "SELECT COUNT(*) FROM sync_outbox") == [(0,)]
+
+
+def test_opens_without_the_cloud_when_sync_is_off(paths):
+    local, _ = paths
+
+    def unreachable():
+        raise AssertionError("sync=False must not connect")
+
+    store = Storage.LocalStore(local, connect_cloud=unreachable, sync=False)
+    store.execute("INSERT INTO crawl_state (player_url) VALUES ('u')")
+    store.close()
+
+    # Kept for the next synced run: the migrations first, then the change
+    statements = [row[0] for row in query(local, "SELECT statement FROM sync_outbox ORDER BY seq")]
+    assert statements[0] == Storage.MIGRATE
+    assert statements[1].startswith("INSERT INTO crawl_state")
+
+
+def test_rowid_statements_are_refused(paths):
+    local, cloud = paths
+    store = open_store(local, cloud, sync=False)
+    with pytest.raises(Exception, match="rowid"):
+        store.execute("DELETE FROM stats WHERE rowid = 1")
+    store.close()
+
+
+def test_rejected_change_is_dead_lettered_and_requeued(paths):
+    local, cloud = paths
+    store = open_store(local, cloud)
+    store.execute("CREATE TABLE IF NOT EXISTS notes (x)")
+    store.commit()
+    store.close(sync_timeout=10)
+    conn = sqlite3.connect(cloud)
+    conn.execute("DROP TABLE notes")  # The cloud drifts, so the next insert there fails
+    conn.commit()
+    conn.close()
+
+    store = open_store(local, cloud)
+    store.execute("INSERT INTO crawl_state (player_url) VALUES ('a')")
+    store.execute("INSERT INTO notes VALUES (1)")
+    store.execute("INSERT INTO crawl_state (player_url) VALUES ('b')")
+    store.close(sync_timeout=10)
+
+    assert store.syncer.dead == 1
+    assert query(cloud, "SELECT player_url FROM crawl_state ORDER BY player_url") == [("a",), ("b",)]
+    assert [row[0] for row in query(local, "SELECT statement FROM sync_deadletter")] == ["INSERT INTO notes VALUES (1)"]
+
+    assert Storage.requeue_dead_letters(local) == 1
+    assert query(local, "SELECT statement FROM sync_outbox") == [("INSERT INTO notes VALUES (1)",)]
+
+
+def test_new_local_copy_is_hydrated_from_the_cloud(paths):
+    local, cloud = paths
+    conn = sqlite3.connect(cloud)
+    cursor = conn.cursor()
+    Schema.ensure_stats(cursor)
+    cursor.execute(Schema.STATS_UPSERT, Schema.stats_row({"date": "2025-01-01", "match_id": 1}, player_id=3))
+    conn.commit()
+    conn.close()
+
+    store = open_store(local, cloud)
+    store.close(sync_timeout=10)
+
+    assert query(local, "SELECT player_id, match_key FROM stats") == [(3, "id:1")]
+    assert query(cloud, "SELECT COUNT(*) FROM stats") == [(1,)]